@@ -0,0 +1,49 @@
+"""add_concept_explanations_table
+
+Revision ID: 9c1d2e3f4a5b
+Revises: 8b9c0d1e2f3a
+Create Date: 2026-10-17 10:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import inspect
+
+
+revision: str = "9c1d2e3f4a5b"
+down_revision: Union[str, Sequence[str], None] = "8b9c0d1e2f3a"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _table_exists(table_name: str) -> bool:
+    inspector = inspect(op.get_bind())
+    return table_name in inspector.get_table_names()
+
+
+def upgrade() -> None:
+    if not _table_exists("concept_explanations"):
+        op.create_table(
+            "concept_explanations",
+            sa.Column("id", sa.String(), nullable=False),
+            sa.Column("concept_id", sa.String(), nullable=False),
+            sa.Column("concept", sa.String(), nullable=False),
+            sa.Column("difficulty_level", sa.String(), nullable=False),
+            sa.Column("language", sa.String(), nullable=False),
+            sa.Column("format", sa.String(), nullable=False),
+            sa.Column("payload", sa.JSON(), nullable=False),
+            sa.Column("created_at", sa.DateTime(), nullable=True, server_default=sa.text("now()")),
+            sa.Column("updated_at", sa.DateTime(), nullable=True, server_default=sa.text("now()")),
+            sa.PrimaryKeyConstraint("id"),
+            sa.UniqueConstraint(
+                "concept_id", "difficulty_level", "language", "format",
+                name="uq_concept_explanations_key",
+            ),
+        )
+
+
+def downgrade() -> None:
+    if _table_exists("concept_explanations"):
+        op.drop_table("concept_explanations")
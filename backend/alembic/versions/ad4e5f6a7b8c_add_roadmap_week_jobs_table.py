@@ -0,0 +1,48 @@
+"""add_roadmap_week_jobs_table
+
+Revision ID: ad4e5f6a7b8c
+Revises: 9c1d2e3f4a5b
+Create Date: 2026-10-17 12:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import inspect
+
+
+revision: str = "ad4e5f6a7b8c"
+down_revision: Union[str, Sequence[str], None] = "9c1d2e3f4a5b"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _table_exists(table_name: str) -> bool:
+    inspector = inspect(op.get_bind())
+    return table_name in inspector.get_table_names()
+
+
+def upgrade() -> None:
+    if not _table_exists("roadmap_week_jobs"):
+        op.create_table(
+            "roadmap_week_jobs",
+            sa.Column("id", sa.String(), nullable=False),
+            sa.Column("roadmap_id", sa.String(), nullable=False),
+            sa.Column("week_number", sa.Integer(), nullable=False),
+            sa.Column("status", sa.String(), nullable=False),
+            sa.Column("source", sa.String(), nullable=False),
+            sa.Column("attempts", sa.Integer(), nullable=False, server_default="0"),
+            sa.Column("error", sa.String(), nullable=True),
+            sa.Column("lease_expires_at", sa.DateTime(), nullable=True),
+            sa.Column("created_at", sa.DateTime(), nullable=True, server_default=sa.text("now()")),
+            sa.Column("updated_at", sa.DateTime(), nullable=True, server_default=sa.text("now()")),
+            sa.ForeignKeyConstraint(["roadmap_id"], ["roadmaps.id"], ondelete="CASCADE"),
+            sa.PrimaryKeyConstraint("id"),
+            sa.UniqueConstraint("roadmap_id", "week_number", name="uq_roadmap_week_jobs_week"),
+        )
+
+
+def downgrade() -> None:
+    if _table_exists("roadmap_week_jobs"):
+        op.drop_table("roadmap_week_jobs")
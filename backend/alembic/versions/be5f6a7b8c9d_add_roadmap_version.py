@@ -0,0 +1,37 @@
+"""add_roadmap_version
+
+Revision ID: be5f6a7b8c9d
+Revises: ad4e5f6a7b8c
+Create Date: 2026-10-17 10:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import inspect
+
+
+revision: str = "be5f6a7b8c9d"
+down_revision: Union[str, Sequence[str], None] = "ad4e5f6a7b8c"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _column_exists(table_name: str, column_name: str) -> bool:
+    inspector = inspect(op.get_bind())
+    columns = [col["name"] for col in inspector.get_columns(table_name)]
+    return column_name in columns
+
+
+def upgrade() -> None:
+    if not _column_exists("roadmaps", "version"):
+        op.add_column(
+            "roadmaps",
+            sa.Column("version", sa.Integer(), nullable=False, server_default="1"),
+        )
+
+
+def downgrade() -> None:
+    if _column_exists("roadmaps", "version"):
+        op.drop_column("roadmaps", "version")
@@ -0,0 +1,41 @@
+"""add_interview_summary
+
+Revision ID: cf6a7b8c9d0e
+Revises: be5f6a7b8c9d
+Create Date: 2026-10-17 12:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import inspect
+
+
+revision: str = "cf6a7b8c9d0e"
+down_revision: Union[str, Sequence[str], None] = "be5f6a7b8c9d"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _column_exists(table_name: str, column_name: str) -> bool:
+    inspector = inspect(op.get_bind())
+    columns = [col["name"] for col in inspector.get_columns(table_name)]
+    return column_name in columns
+
+
+def upgrade() -> None:
+    if not _column_exists("interviews", "summary"):
+        op.add_column("interviews", sa.Column("summary", sa.String(), nullable=True))
+    if not _column_exists("interviews", "summarized_messages"):
+        op.add_column(
+            "interviews",
+            sa.Column("summarized_messages", sa.Integer(), nullable=False, server_default="0"),
+        )
+
+
+def downgrade() -> None:
+    if _column_exists("interviews", "summarized_messages"):
+        op.drop_column("interviews", "summarized_messages")
+    if _column_exists("interviews", "summary"):
+        op.drop_column("interviews", "summary")
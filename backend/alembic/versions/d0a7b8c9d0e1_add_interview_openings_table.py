@@ -0,0 +1,59 @@
+"""add_interview_openings_table
+
+Revision ID: d0a7b8c9d0e1
+Revises: cf6a7b8c9d0e
+Create Date: 2026-10-17 13:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import inspect
+
+
+revision: str = "d0a7b8c9d0e1"
+down_revision: Union[str, Sequence[str], None] = "cf6a7b8c9d0e"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _table_exists(table_name: str) -> bool:
+    inspector = inspect(op.get_bind())
+    return table_name in inspector.get_table_names()
+
+
+def _index_exists(table_name: str, index_name: str) -> bool:
+    inspector = inspect(op.get_bind())
+    if table_name not in inspector.get_table_names():
+        return False
+    return any(idx.get("name") == index_name for idx in inspector.get_indexes(table_name))
+
+
+def upgrade() -> None:
+    if not _table_exists("interview_openings"):
+        op.create_table(
+            "interview_openings",
+            sa.Column("id", sa.String(), nullable=False),
+            sa.Column("role_key", sa.String(), nullable=False),
+            sa.Column("company_bucket", sa.String(), nullable=False),
+            sa.Column("language", sa.String(), nullable=False),
+            sa.Column("question", sa.String(), nullable=False),
+            sa.Column("created_at", sa.DateTime(), nullable=True, server_default=sa.text("now()")),
+            sa.PrimaryKeyConstraint("id"),
+        )
+
+    if not _index_exists("interview_openings", "ix_interview_openings_key"):
+        op.create_index(
+            "ix_interview_openings_key",
+            "interview_openings",
+            ["role_key", "company_bucket", "language"],
+            unique=False,
+        )
+
+
+def downgrade() -> None:
+    if _index_exists("interview_openings", "ix_interview_openings_key"):
+        op.drop_index("ix_interview_openings_key", table_name="interview_openings")
+    if _table_exists("interview_openings"):
+        op.drop_table("interview_openings")
@@ -0,0 +1,62 @@
+"""add_interview_evaluation_jobs
+
+Revision ID: e1b8c9d0e1f2
+Revises: d0a7b8c9d0e1
+Create Date: 2026-10-17 14:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import inspect
+
+
+revision: str = "e1b8c9d0e1f2"
+down_revision: Union[str, Sequence[str], None] = "d0a7b8c9d0e1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _table_exists(table_name: str) -> bool:
+    inspector = inspect(op.get_bind())
+    return table_name in inspector.get_table_names()
+
+
+def _column_exists(table_name: str, column_name: str) -> bool:
+    inspector = inspect(op.get_bind())
+    columns = [col["name"] for col in inspector.get_columns(table_name)]
+    return column_name in columns
+
+
+def upgrade() -> None:
+    if not _column_exists("interviews", "status"):
+        op.add_column(
+            "interviews",
+            sa.Column("status", sa.String(), nullable=False, server_default="active"),
+        )
+        op.execute("UPDATE interviews SET status = 'completed' WHERE score IS NOT NULL")
+
+    if not _table_exists("interview_evaluation_jobs"):
+        op.create_table(
+            "interview_evaluation_jobs",
+            sa.Column("id", sa.String(), nullable=False),
+            sa.Column("interview_id", sa.String(), nullable=False),
+            sa.Column("status", sa.String(), nullable=False),
+            sa.Column("attempts", sa.Integer(), nullable=False, server_default="0"),
+            sa.Column("error", sa.String(), nullable=True),
+            sa.Column("next_attempt_at", sa.DateTime(), nullable=True),
+            sa.Column("lease_expires_at", sa.DateTime(), nullable=True),
+            sa.Column("created_at", sa.DateTime(), nullable=True, server_default=sa.text("now()")),
+            sa.Column("updated_at", sa.DateTime(), nullable=True, server_default=sa.text("now()")),
+            sa.ForeignKeyConstraint(["interview_id"], ["interviews.id"], ondelete="CASCADE"),
+            sa.PrimaryKeyConstraint("id"),
+            sa.UniqueConstraint("interview_id"),
+        )
+
+
+def downgrade() -> None:
+    if _table_exists("interview_evaluation_jobs"):
+        op.drop_table("interview_evaluation_jobs")
+    if _column_exists("interviews", "status"):
+        op.drop_column("interviews", "status")
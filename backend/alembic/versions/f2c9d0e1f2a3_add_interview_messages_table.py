@@ -0,0 +1,130 @@
+"""add_interview_messages_table
+
+Revision ID: f2c9d0e1f2a3
+Revises: e1b8c9d0e1f2
+Create Date: 2026-10-17 16:00:00.000000
+"""
+
+from typing import Sequence, Union
+import uuid
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import inspect
+
+
+revision: str = "f2c9d0e1f2a3"
+down_revision: Union[str, Sequence[str], None] = "e1b8c9d0e1f2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BATCH_SIZE = 500
+
+interviews = sa.table(
+    "interviews",
+    sa.column("id", sa.String()),
+    sa.column("messages", sa.JSON()),
+    sa.column("message_count", sa.Integer()),
+)
+interview_messages = sa.table(
+    "interview_messages",
+    sa.column("id", sa.String()),
+    sa.column("interview_id", sa.String()),
+    sa.column("seq", sa.Integer()),
+    sa.column("role", sa.String()),
+    sa.column("content", sa.String()),
+    sa.column("assessment", sa.JSON(none_as_null=True)),
+)
+
+
+def _table_exists(table_name: str) -> bool:
+    inspector = inspect(op.get_bind())
+    return table_name in inspector.get_table_names()
+
+
+def _column_exists(table_name: str, column_name: str) -> bool:
+    inspector = inspect(op.get_bind())
+    columns = [col["name"] for col in inspector.get_columns(table_name)]
+    return column_name in columns
+
+
+def _backfill() -> None:
+    """Copy every interview's JSON transcript into interview_messages."""
+    bind = op.get_bind()
+    rows = bind.execute(
+        sa.select(interviews.c.id, interviews.c.messages).where(interviews.c.messages.isnot(None))
+    ).fetchall()
+    batch = []
+    for interview_id, messages in rows:
+        messages = [message for message in messages or [] if isinstance(message, dict)]
+        for seq, message in enumerate(messages):
+            batch.append({
+                "id": str(uuid.uuid4()),
+                "interview_id": interview_id,
+                "seq": seq,
+                "role": str(message.get("role") or "user"),
+                "content": str(message.get("content") or ""),
+                "assessment": message.get("assessment"),
+            })
+        bind.execute(
+            interviews.update().where(interviews.c.id == interview_id).values(message_count=len(messages))
+        )
+        if len(batch) >= BATCH_SIZE:
+            bind.execute(interview_messages.insert(), batch)
+            batch = []
+    if batch:
+        bind.execute(interview_messages.insert(), batch)
+
+
+def upgrade() -> None:
+    if not _column_exists("interviews", "message_count"):
+        op.add_column(
+            "interviews",
+            sa.Column("message_count", sa.Integer(), nullable=False, server_default="0"),
+        )
+
+    if not _table_exists("interview_messages"):
+        op.create_table(
+            "interview_messages",
+            sa.Column("id", sa.String(), nullable=False),
+            sa.Column("interview_id", sa.String(), nullable=False),
+            sa.Column("seq", sa.Integer(), nullable=False),
+            sa.Column("role", sa.String(), nullable=False),
+            sa.Column("content", sa.String(), nullable=False),
+            sa.Column("assessment", sa.JSON(), nullable=True),
+            sa.Column("created_at", sa.DateTime(), nullable=True, server_default=sa.text("now()")),
+            sa.ForeignKeyConstraint(["interview_id"], ["interviews.id"], ondelete="CASCADE"),
+            sa.PrimaryKeyConstraint("id"),
+            sa.UniqueConstraint("interview_id", "seq", name="uq_interview_messages_interview_seq"),
+        )
+        # The JSON column is no longer written but is left in place so this
+        # migration can be rolled back without losing transcripts
+        if _column_exists("interviews", "messages"):
+            _backfill()
+
+
+def downgrade() -> None:
+    if _table_exists("interview_messages"):
+        bind = op.get_bind()
+        if _column_exists("interviews", "messages"):
+            rows = bind.execute(
+                sa.select(
+                    interview_messages.c.interview_id,
+                    interview_messages.c.role,
+                    interview_messages.c.content,
+                    interview_messages.c.assessment,
+                ).order_by(interview_messages.c.interview_id, interview_messages.c.seq)
+            ).fetchall()
+            transcripts: dict[str, list[dict]] = {}
+            for interview_id, role, content, assessment in rows:
+                message = {"role": role, "content": content}
+                if assessment:
+                    message["assessment"] = assessment
+                transcripts.setdefault(interview_id, []).append(message)
+            for interview_id, messages in transcripts.items():
+                bind.execute(
+                    interviews.update().where(interviews.c.id == interview_id).values(messages=messages)
+                )
+        op.drop_table("interview_messages")
+    if _column_exists("interviews", "message_count"):
+        op.drop_column("interviews", "message_count")
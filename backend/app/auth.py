@@ -69,11 +69,13 @@ def verify_token(token: str) -> dict:
         )
 
 
-def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: Session = Depends(get_db),
-) -> User:
-    token = credentials.credentials
+def user_from_token(db: Session, token: str) -> User:
+    """
+    Resolve the user an access token belongs to.
+
+    Raises:
+        HTTPException: 401 if the token is invalid or its user does not exist
+    """
     payload = verify_token(token)
 
     user: User | None = None
@@ -94,3 +96,10 @@ def get_current_user(
         )
 
     return user
+
+
+def get_current_user(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    db: Session = Depends(get_db),
+) -> User:
+    return user_from_token(db, credentials.credentials)
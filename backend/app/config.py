@@ -25,8 +25,123 @@ class Settings(BaseSettings):
     AWS_ACCESS_KEY_ID: str
     AWS_SECRET_ACCESS_KEY: str
 
+    # Shared boto3 clients (app/services/aws_clients.py), created on first
+    # use. The pool must cover BEDROCK_MAX_WORKERS plus sync callers.
+    AWS_MAX_POOL_CONNECTIONS: int = 64
+    AWS_CONNECT_TIMEOUT_SECONDS: float = 3.0
+    AWS_TCP_KEEPALIVE: bool = True
+    # A Bedrock read never outlives the request deadline; botocore does not
+    # retry Bedrock calls because BedrockService retries within its budget
+    BEDROCK_READ_TIMEOUT_SECONDS: float = 45.0
+    BEDROCK_CLIENT_MAX_ATTEMPTS: int = 1
+    TRANSLATE_READ_TIMEOUT_SECONDS: float = 10.0
+    TRANSLATE_CLIENT_MAX_ATTEMPTS: int = 3
+
     # Amazon Bedrock
     BEDROCK_MODEL_ID: str = "amazon.nova-lite-v1:0"
+    # Threads reserved for in-flight Bedrock calls made from async endpoints
+    BEDROCK_MAX_WORKERS: int = 32
+    # Circuit breaker: consecutive throttling/unavailable errors before opening,
+    # and how long to wait before letting a probe call through
+    BEDROCK_BREAKER_FAILURE_THRESHOLD: int = 5
+    BEDROCK_BREAKER_RECOVERY_SECONDS: float = 30.0
+    # Mark static prompt prefixes with Converse cachePoint blocks on models
+    # that support prompt caching
+    BEDROCK_PROMPT_CACHE_ENABLED: bool = True
+    # Model routing: call sites tagged "fast" or "strong" in
+    # BedrockService.MODEL_ROUTES use these models (unset = BEDROCK_MODEL_ID).
+    # BEDROCK_MODEL_ROUTES overrides the table per call site with a tier name
+    # or a model id, e.g. {"jd_analysis": "strong"}.
+    BEDROCK_FAST_MODEL_ID: str | None = None
+    BEDROCK_STRONG_MODEL_ID: str | None = None
+    BEDROCK_MODEL_ROUTES: dict[str, str] = {}
+    # Tried once when the routed model is throttled
+    BEDROCK_SECONDARY_MODEL_ID: str | None = None
+    # Adaptive cap on in-flight Bedrock calls per process (AIMD between MIN
+    # and MAX); calls over the limit wait up to QUEUE_MAX_WAIT seconds
+    BEDROCK_CONCURRENCY_INITIAL_LIMIT: int = 16
+    BEDROCK_CONCURRENCY_MIN_LIMIT: int = 2
+    BEDROCK_CONCURRENCY_MAX_LIMIT: int = 32
+    BEDROCK_QUEUE_MAX_WAIT_SECONDS: float = 10.0
+    # Background calls (pre-generation, translation backfills) may use this
+    # share of the limit and wait longer for a slot
+    BEDROCK_BACKGROUND_SHARE: float = 0.5
+    BEDROCK_BACKGROUND_QUEUE_MAX_WAIT_SECONDS: float = 120.0
+    # Retries (and secondary-model switches) may use at most this share of
+    # calls, with a burst allowance of BEDROCK_RETRY_BUDGET_MAX_TOKENS
+    BEDROCK_RETRY_BUDGET_RATIO: float = 0.1
+    BEDROCK_RETRY_BUDGET_MAX_TOKENS: float = 10.0
+    # A retry is only sent if its backoff plus this much still fits in the
+    # request deadline
+    BEDROCK_MIN_ATTEMPT_SECONDS: float = 2.0
+    # Hedging for latency-critical calls (interview turns): an attempt still
+    # running past its call site's PERCENTILE latency (learned once there
+    # are MIN_SAMPLES calls) gets one identical backup request. Hedges are
+    # capped at MAX_RATIO of eligible calls, with a burst of MAX_TOKENS.
+    BEDROCK_HEDGING_ENABLED: bool = True
+    BEDROCK_HEDGE_PERCENTILE: float = 0.9
+    BEDROCK_HEDGE_MIN_SAMPLES: int = 20
+    BEDROCK_HEDGE_MAX_RATIO: float = 0.05
+    BEDROCK_HEDGE_MAX_TOKENS: float = 5.0
+    # End-to-end budget for the LLM work of one API request
+    LLM_REQUEST_DEADLINE_SECONDS: float = 45.0
+
+    # LLM response cache (in-memory, per process)
+    LLM_CACHE_ENABLED: bool = True
+    LLM_CACHE_MAX_ENTRIES: int = 1024
+
+    # Interview prompt context (estimated tokens). The last RECENT_MESSAGES
+    # are sent verbatim, each clipped to MESSAGE_MAX_TOKENS; older ones are
+    # folded into a rolling summary once SUMMARY_EVERY_MESSAGES of them
+    # have accumulated. The transcript part of follow-up and evaluation
+    # prompts never exceeds the *_CONTEXT_TOKENS budgets.
+    INTERVIEW_RECENT_MESSAGES: int = 4
+    INTERVIEW_SUMMARY_EVERY_MESSAGES: int = 4
+    INTERVIEW_SUMMARY_MAX_TOKENS: int = 400
+    INTERVIEW_MESSAGE_MAX_TOKENS: int = 600
+    INTERVIEW_FOLLOWUP_CONTEXT_TOKENS: int = 1800
+    INTERVIEW_EVAL_CONTEXT_TOKENS: int = 3000
+    # Opening-question bank: /api/interview/start serves a pre-generated
+    # opening for (role, company bucket, language) and only calls Bedrock on
+    # a miss. scripts.fill_interview_question_bank tops every listed
+    # combination up to QUESTIONS_PER_KEY; a user's last AVOID_RECENT
+    # openings are not served to them again while alternatives exist.
+    INTERVIEW_BANK_ENABLED: bool = True
+    INTERVIEW_BANK_ROLES: list[str] | str = [
+        "sde", "cloud_engineer", "data_analyst", "devops", "qa", "ml_engineer", "fullstack_developer",
+    ]
+    INTERVIEW_BANK_LANGUAGES: list[str] | str = ["en", "hi", "ta", "te", "bn", "mr"]
+    INTERVIEW_BANK_QUESTIONS_PER_KEY: int = 12
+    INTERVIEW_BANK_AVOID_RECENT: int = 5
+    # Interview evaluation runs as a background job once an interview ends.
+    # Failed attempts are retried after RETRY_BASE * 2^(n-1) seconds, up to
+    # MAX_ATTEMPTS; a running job whose worker died is taken over once its
+    # lease expires.
+    INTERVIEW_EVAL_MAX_ATTEMPTS: int = 3
+    INTERVIEW_EVAL_RETRY_BASE_SECONDS: float = 5.0
+    INTERVIEW_EVAL_JOB_LEASE_SECONDS: int = 180
+    INTERVIEW_EVAL_DEADLINE_SECONDS: float = 90.0
+    # Per-answer micro-assessments: each answer is scored by a cheap call
+    # running alongside the follow-up question, so the final evaluation only
+    # averages stored scores and writes the feedback from a shorter transcript
+    INTERVIEW_TURN_ASSESSMENT_ENABLED: bool = True
+    INTERVIEW_ASSESSMENT_MAX_TOKENS: int = 200
+    INTERVIEW_FEEDBACK_CONTEXT_TOKENS: int = 1200
+    # Live interview sessions (WebSocket): state kept in memory between
+    # turns, per worker, for up to this many interviews and this long idle
+    INTERVIEW_SESSION_CACHE_SIZE: int = 500
+    INTERVIEW_SESSION_TTL_SECONDS: int = 1800
+
+    # Roadmap week pre-generation: once the student reaches this day of a
+    # week, the next pending week is generated in the background
+    ROADMAP_PREGENERATE_ENABLED: bool = True
+    ROADMAP_PREGENERATE_FROM_DAY: int = 3
+    # A running week job is considered abandoned after this long
+    ROADMAP_WEEK_JOB_LEASE_SECONDS: int = 300
+    # How long a generate-week request waits for a running background job
+    ROADMAP_WEEK_JOB_WAIT_SECONDS: float = 90.0
+    # Concurrent week generations per generate-remaining request
+    ROADMAP_FANOUT_CONCURRENCY: int = 4
 
     # CORS
     CORS_ORIGINS: list[str] | str = ["http://localhost:3000"]
@@ -34,6 +149,12 @@ class Settings(BaseSettings):
     # API
     API_PREFIX: str = "/api"
 
+    # Internal stats endpoints (/internal/*): callers send INTERNAL_STATS_TOKEN
+    # as X-Internal-Token; with no token set they answer 403 unless
+    # INTERNAL_STATS_OPEN is on (local development only)
+    INTERNAL_STATS_TOKEN: str | None = None
+    INTERNAL_STATS_OPEN: bool = False
+
     # Rate limiting
     RATE_LIMIT_REQUESTS_PER_MINUTE: int = 300
     RATE_LIMIT_BURST_SIZE: int = 100
@@ -46,10 +167,10 @@ class Settings(BaseSettings):
     # Local bootstrap (disabled by default; prefer Alembic migrations)
     AUTO_CREATE_TABLES: bool = False
 
-    @field_validator("CORS_ORIGINS", mode="before")
+    @field_validator("CORS_ORIGINS", "INTERVIEW_BANK_ROLES", "INTERVIEW_BANK_LANGUAGES", mode="before")
     @classmethod
-    def parse_cors_origins(cls, value: object) -> object:
-        """Accept both JSON array and comma-separated CORS origin values."""
+    def parse_string_list(cls, value: object) -> object:
+        """Accept both JSON array and comma-separated list values (CORS origins, bank keys)."""
         if isinstance(value, str):
             raw = value.strip()
             if not raw:
@@ -1,3 +1,6 @@
+import asyncio
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.exceptions import RequestValidationError
@@ -9,6 +12,8 @@ from app.middleware.error_handler import (
     http_exception_handler,
     validation_exception_handler,
 )
+from app.services.bedrock import bedrock_service
+from app.services.interview_evaluation import evaluation_jobs
 from app.routers import (
     auth,
     profile,
@@ -20,17 +25,32 @@ from app.routers import (
     progress,
     content,
     dashboard,
+    internal,
 )
+from app.utils.logging_config import setup_logging
 
 # Optional dev-only bootstrap.
 # Prefer Alembic migrations for normal setup.
 if settings.AUTO_CREATE_TABLES:
     Base.metadata.create_all(bind=engine)
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Configured at start-up rather than on import, so importing app.main
+    # (tests, scripts, alembic) leaves the caller's logging alone
+    setup_logging()
+    # Interview evaluations a previous worker left queued or half-done
+    resume = asyncio.create_task(evaluation_jobs.resume_pending())
+    yield
+    resume.cancel()
+
+
 app = FastAPI(
     title="Campus-for-Hire API",
     description="AI-powered personalization platform for Indian campus placements",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
 # Rate limiting middleware
@@ -39,7 +59,7 @@ app.add_middleware(
     requests_per_minute=settings.RATE_LIMIT_REQUESTS_PER_MINUTE,
     burst_size=settings.RATE_LIMIT_BURST_SIZE,
     exempt_methods={"OPTIONS"},
-    exempt_paths={"/", "/health", "/openapi.json", "/api/profile"},
+    exempt_paths={"/", "/health", "/health/bedrock", "/openapi.json", "/api/profile"},
     exempt_path_prefixes={"/docs", "/redoc", "/api/auth"},
 )
 
@@ -71,6 +91,7 @@ app.include_router(progress.router)
 app.include_router(content.router)
 app.include_router(content.resources_router)
 app.include_router(dashboard.router)
+app.include_router(internal.router)
 
 
 @app.get("/")
@@ -81,3 +102,15 @@ def root():
 @app.get("/health")
 def health():
     return {"status": "healthy"}
+
+
+@app.get("/health/bedrock")
+def bedrock_health():
+    """Circuit breaker, concurrency limiter and retry budget state; "degraded" means Bedrock calls are being short-circuited."""
+    breaker = bedrock_service.circuit_breaker_state()
+    return {
+        "status": "healthy" if breaker["state"] == "closed" else "degraded",
+        "circuit_breaker": breaker,
+        "concurrency": bedrock_service.concurrency_stats(),
+        "retries": bedrock_service.retry_stats(),
+    }
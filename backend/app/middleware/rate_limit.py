@@ -10,7 +10,9 @@ from typing import Any, Iterable
 from fastapi import Request, status
 from fastapi.responses import JSONResponse
 from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
+from starlette.requests import HTTPConnection
 from starlette.responses import Response
+from starlette.types import Receive, Scope, Send
 
 logger = logging.getLogger(__name__)
 
@@ -47,6 +49,13 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         self._requests: dict[str, list[tuple[float, int]]] = {}
         self._cleanup_interval = 300  # Cleanup every 5 minutes
         self._last_cleanup = time.time()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "websocket":
+            # BaseHTTPMiddleware passes WebSockets straight through, so the
+            # route charges each message itself via ``websocket.state.rate_limiter``
+            scope.setdefault("state", {})["rate_limiter"] = self
+        await super().__call__(scope, receive, send)
     
     async def dispatch(
         self, request: Request, call_next: RequestResponseEndpoint
@@ -77,6 +86,24 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         
         return response
 
+    def check(self, connection: HTTPConnection) -> tuple[bool, int]:
+        """Charge one request to the client behind ``connection``.
+
+        For work started by WebSocket messages, which never pass through
+        ``dispatch``; shares the same per-client window as HTTP requests.
+
+        Returns:
+            ``(is_allowed, retry_after)`` as for ``_is_allowed``
+        """
+        client_id = self._get_client_id(connection)
+        is_allowed, retry_after = self._is_allowed(client_id)
+        if not is_allowed:
+            logger.warning(
+                f"Rate limit exceeded for client: {client_id}",
+                extra={"client_id": client_id, "path": connection.url.path, "method": "WEBSOCKET"},
+            )
+        return is_allowed, retry_after
+
     def _is_exempt_request(self, request: Request) -> bool:
         """Check whether this request should bypass rate limiting."""
         method = request.method.upper()
@@ -87,7 +114,7 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
             return True
         return any(path.startswith(prefix) for prefix in self.exempt_path_prefixes)
     
-    def _get_client_id(self, request: Request) -> str:
+    def _get_client_id(self, request: HTTPConnection) -> str:
         """Get a unique identifier for the client.
         
         Priority:
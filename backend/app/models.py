@@ -1,6 +1,7 @@
 import uuid
 
-from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Integer, JSON, String
+from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Index, Integer, JSON, String, UniqueConstraint
+from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
 from app.database import Base
@@ -45,6 +46,8 @@ class Roadmap(Base):
     current_week = Column(Integer, default=1)
     current_day = Column(Integer, default=1)
     is_active = Column(Boolean, default=True)
+    # Bumped on every content write; see app.services.roadmap_content
+    version = Column(Integer, nullable=False, default=1, server_default="1")
     created_at = Column(DateTime, default=func.now())
 
 
@@ -68,9 +71,36 @@ class Interview(Base):
     user_id = Column(String, ForeignKey("users.id"))
     role = Column(String)
     company = Column(String, nullable=True)
-    messages = Column(JSON)
     score = Column(Integer, nullable=True)
     feedback = Column(String, nullable=True)
+    # Rolling summary of messages[:summarized_messages]; later messages are
+    # sent to the model verbatim (see app/services/interview_context.py)
+    summary = Column(String, nullable=True)
+    summarized_messages = Column(Integer, nullable=False, default=0, server_default="0")
+    status = Column(String, nullable=False, default="active", server_default="active")  # active | evaluating | completed | evaluation_failed
+    # Number of rows in interview_messages; bumped in the same transaction
+    # as every append (see app/services/interview_messages.py)
+    message_count = Column(Integer, nullable=False, default=0, server_default="0")
+    created_at = Column(DateTime, default=func.now())
+
+    # Loaded only when accessed, e.g. when an InterviewResponse is built
+    messages = relationship("InterviewMessage", order_by="InterviewMessage.seq", lazy="select")
+
+
+class InterviewMessage(Base):
+    """One transcript message; rows are only ever appended."""
+
+    __tablename__ = "interview_messages"
+    __table_args__ = (
+        UniqueConstraint("interview_id", "seq", name="uq_interview_messages_interview_seq"),
+    )
+
+    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
+    interview_id = Column(String, ForeignKey("interviews.id", ondelete="CASCADE"), nullable=False)
+    seq = Column(Integer, nullable=False)  # 0-based position in the transcript
+    role = Column(String, nullable=False)  # assistant | user
+    content = Column(String, nullable=False)
+    assessment = Column(JSON(none_as_null=True), nullable=True)  # per-answer micro-assessment, user messages only
     created_at = Column(DateTime, default=func.now())
 
 
@@ -89,3 +119,69 @@ class Resource(Base):
     estimated_minutes = Column(Integer, nullable=True)
     tags = Column(JSON, nullable=True)
     created_at = Column(DateTime, default=func.now())
+
+
+class ConceptExplanation(Base):
+    __tablename__ = "concept_explanations"
+    __table_args__ = (
+        UniqueConstraint(
+            "concept_id", "difficulty_level", "language", "format",
+            name="uq_concept_explanations_key",
+        ),
+    )
+
+    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
+    concept_id = Column(String, nullable=False)
+    concept = Column(String, nullable=False)
+    difficulty_level = Column(String, nullable=False)
+    language = Column(String, nullable=False, default="en")
+    format = Column(String, nullable=False)
+    payload = Column(JSON, nullable=False)
+    created_at = Column(DateTime, default=func.now())
+    updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
+
+
+class InterviewEvaluationJob(Base):
+    __tablename__ = "interview_evaluation_jobs"
+
+    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
+    interview_id = Column(String, ForeignKey("interviews.id", ondelete="CASCADE"), nullable=False, unique=True)
+    status = Column(String, nullable=False)  # queued | running | done | failed
+    attempts = Column(Integer, nullable=False, default=0)
+    error = Column(String, nullable=True)
+    next_attempt_at = Column(DateTime, nullable=True)
+    lease_expires_at = Column(DateTime, nullable=True)
+    created_at = Column(DateTime, default=func.now())
+    updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
+
+
+class InterviewOpening(Base):
+    __tablename__ = "interview_openings"
+    __table_args__ = (
+        Index("ix_interview_openings_key", "role_key", "company_bucket", "language"),
+    )
+
+    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
+    role_key = Column(String, nullable=False)
+    company_bucket = Column(String, nullable=False)  # service | product | startup | generic
+    language = Column(String, nullable=False, default="en")
+    question = Column(String, nullable=False)  # "{company}" marks the company name
+    created_at = Column(DateTime, default=func.now())
+
+
+class RoadmapWeekJob(Base):
+    __tablename__ = "roadmap_week_jobs"
+    __table_args__ = (
+        UniqueConstraint("roadmap_id", "week_number", name="uq_roadmap_week_jobs_week"),
+    )
+
+    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
+    roadmap_id = Column(String, ForeignKey("roadmaps.id", ondelete="CASCADE"), nullable=False)
+    week_number = Column(Integer, nullable=False)
+    status = Column(String, nullable=False)  # queued | running | done | failed
+    source = Column(String, nullable=False)  # pregenerate | manual
+    attempts = Column(Integer, nullable=False, default=0)
+    error = Column(String, nullable=True)
+    lease_expires_at = Column(DateTime, nullable=True)
+    created_at = Column(DateTime, default=func.now())
+    updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
@@ -1,6 +1,5 @@
 from datetime import timedelta
 from urllib.parse import urlencode
-import httpx
 
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.responses import RedirectResponse
@@ -162,6 +161,9 @@ async def google_callback(
     db: Session = Depends(get_db),
 ) -> AuthResponse:
     """Handle Google OAuth callback"""
+    # Only this endpoint needs httpx; importing it here keeps it off app start-up
+    import httpx
+
     if not settings.GOOGLE_CLIENT_ID or not settings.GOOGLE_CLIENT_SECRET:
         raise HTTPException(
             status_code=status.HTTP_501_NOT_IMPLEMENTED,
@@ -17,7 +17,9 @@ from app.schemas import (
     TranslateRoadmapResponse,
 )
 from app.services.bedrock import bedrock_service
+from app.services.concept_store import concept_store
 from app.services.translate import translate_service
+from app.utils.deadline import Deadline, request_deadline
 
 router = APIRouter(prefix="/api/content", tags=["content"])
 resources_router = APIRouter(prefix="/api/resources", tags=["resources"])
@@ -111,91 +113,115 @@ def _resource_to_item(resource: Resource) -> ResourceItem:
     )
 
 
+def _parse_explanation(raw_response: str) -> ExplainResponse:
+    """Split the model's sectioned text into an ExplainResponse."""
+    lines = raw_response.split("\n")
+
+    explanation = ""
+    examples = []
+    key_points = []
+    related_topics = []
+
+    current_section = None
+    current_content = []
+
+    for line in lines:
+        line_lower = line.lower().strip()
+
+        if any(keyword in line_lower for keyword in ["definition", "what is", "introduction"]):
+            if current_section and current_content:
+                if current_section == "examples":
+                    examples = current_content
+                elif current_section == "key points":
+                    key_points = current_content
+                elif current_section == "related topics":
+                    related_topics = current_content
+            current_section = "explanation"
+            current_content = []
+        elif any(keyword in line_lower for keyword in ["example", "code"]):
+            if current_section and current_content and current_section == "explanation":
+                explanation = "\n".join(current_content)
+            current_section = "examples"
+            current_content = []
+        elif any(keyword in line_lower for keyword in ["key point", "remember", "important"]):
+            if current_section and current_content and current_section == "examples":
+                examples = current_content
+            current_section = "key_points"
+            current_content = []
+        elif any(keyword in line_lower for keyword in ["related topic", "learn next", "next topic"]):
+            if current_section and current_content and current_section == "key_points":
+                key_points = current_content
+            current_section = "related_topics"
+            current_content = []
+        elif line.strip():
+            current_content.append(line.strip())
+
+    if current_section == "explanation":
+        explanation = "\n".join(current_content)
+    elif current_section == "examples":
+        examples = current_content
+    elif current_section == "key_points":
+        key_points = current_content
+    elif current_section == "related_topics":
+        related_topics = current_content
+
+    if not explanation:
+        explanation = raw_response[:500]
+    if not examples:
+        examples = ["See the detailed explanation above."]
+    if not key_points:
+        key_points = ["Practice this concept with coding problems."]
+    if not related_topics:
+        related_topics = ["Data Structures", "Algorithms"]
+
+    return ExplainResponse(
+        explanation=explanation,
+        examples=examples[:3],
+        key_points=key_points[:5],
+        related_topics=related_topics[:4],
+    )
+
+
 @router.post("/explain", response_model=ExplainResponse)
-def explain_concept(
+async def explain_concept(
     body: ExplainRequest,
     current_user: User = Depends(get_current_user),
+    deadline: Deadline = Depends(request_deadline),
 ):
     """Get an AI-generated explanation of a technical concept."""
+    difficulty_level = (body.difficulty_level or "beginner").strip().lower()
+
+    # Context-free requests are shared across students: "BFS", "Breadth First
+    # Search" and "bfs algorithm" at the same level resolve to one stored answer.
+    shareable = not (body.context and body.context.strip())
+    if shareable:
+        stored = await concept_store.get_async(body.concept, difficulty_level, "en", "summary")
+        if stored is not None:
+            return ExplainResponse(**stored)
+
     try:
-        raw_response = bedrock_service.invoke_model(
+        raw_response = await bedrock_service.invoke_model_async(
             EXPLAIN_SYSTEM_PROMPT,
-            _get_explain_prompt(body.concept, body.context, body.difficulty_level or "beginner"),
+            _get_explain_prompt(body.concept, body.context, difficulty_level),
             max_tokens=2048,
+            call_site="explanation",
+            user_id=current_user.id,
+            deadline=deadline,
         )
-
-        lines = raw_response.split("\n")
-
-        explanation = ""
-        examples = []
-        key_points = []
-        related_topics = []
-
-        current_section = None
-        current_content = []
-
-        for line in lines:
-            line_lower = line.lower().strip()
-
-            if any(keyword in line_lower for keyword in ["definition", "what is", "introduction"]):
-                if current_section and current_content:
-                    if current_section == "examples":
-                        examples = current_content
-                    elif current_section == "key points":
-                        key_points = current_content
-                    elif current_section == "related topics":
-                        related_topics = current_content
-                current_section = "explanation"
-                current_content = []
-            elif any(keyword in line_lower for keyword in ["example", "code"]):
-                if current_section and current_content and current_section == "explanation":
-                    explanation = "\n".join(current_content)
-                current_section = "examples"
-                current_content = []
-            elif any(keyword in line_lower for keyword in ["key point", "remember", "important"]):
-                if current_section and current_content and current_section == "examples":
-                    examples = current_content
-                current_section = "key_points"
-                current_content = []
-            elif any(keyword in line_lower for keyword in ["related topic", "learn next", "next topic"]):
-                if current_section and current_content and current_section == "key_points":
-                    key_points = current_content
-                current_section = "related_topics"
-                current_content = []
-            elif line.strip():
-                current_content.append(line.strip())
-
-        if current_section == "explanation":
-            explanation = "\n".join(current_content)
-        elif current_section == "examples":
-            examples = current_content
-        elif current_section == "key_points":
-            key_points = current_content
-        elif current_section == "related_topics":
-            related_topics = current_content
-
-        if not explanation:
-            explanation = raw_response[:500]
-        if not examples:
-            examples = ["See the detailed explanation above."]
-        if not key_points:
-            key_points = ["Practice this concept with coding problems."]
-        if not related_topics:
-            related_topics = ["Data Structures", "Algorithms"]
-
-        return ExplainResponse(
-            explanation=explanation,
-            examples=examples[:3],
-            key_points=key_points[:5],
-            related_topics=related_topics[:4],
-        )
-
+        result = _parse_explanation(raw_response)
     except Exception as exc:
         raise HTTPException(
             status_code=500,
             detail=f"Failed to generate explanation: {exc}",
         ) from exc
 
+    if shareable and not bedrock_service.is_fallback_response(raw_response):
+        await concept_store.put_async(
+            body.concept, difficulty_level, "en", "summary", result.model_dump()
+        )
+
+    return result
+
 
 @router.get("/resources", response_model=ResourcesResponse)
 def get_resources(
@@ -1,14 +1,17 @@
 import copy
 import uuid
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException
 from sqlalchemy.orm import Session
 from sqlalchemy.orm.attributes import flag_modified
 
+from app.config import settings
 from app.database import get_db
 from app.auth import get_current_user
 from app.models import User, Roadmap, DailyPlan
+from app.routers.roadmap import next_pending_week, schedule_week_pregeneration
 from app.schemas import DailyPlanResponse, TaskCompleteRequest
+from app.services.roadmap_content import RoadmapConflictError, update_roadmap_content
 
 router = APIRouter(prefix="/api/daily-plan", tags=["daily-plan"])
 
@@ -34,17 +37,20 @@ def _get_day_focus_area(roadmap: Roadmap, week: int, day: int) -> str | None:
         return None
 
 
-def _get_today_plan(roadmap: Roadmap, db: Session) -> DailyPlan | None:
-    """Return the DailyPlan row for the roadmap's current week/day, if it exists."""
-    return (
-        db.query(DailyPlan)
-        .filter(
-            DailyPlan.roadmap_id == roadmap.id,
-            DailyPlan.week == roadmap.current_week,
-            DailyPlan.day == roadmap.current_day,
-        )
-        .first()
+def _get_today_plan(roadmap: Roadmap, db: Session, for_update: bool = False) -> DailyPlan | None:
+    """Return the DailyPlan row for the roadmap's current week/day, if it exists.
+
+    ``for_update`` locks the row until commit (databases that support it)
+    so concurrent task updates to the same plan are serialized.
+    """
+    query = db.query(DailyPlan).filter(
+        DailyPlan.roadmap_id == roadmap.id,
+        DailyPlan.week == roadmap.current_week,
+        DailyPlan.day == roadmap.current_day,
     )
+    if for_update:
+        query = query.with_for_update()
+    return query.first()
 
 
 def _derive_tasks_from_roadmap(roadmap: Roadmap) -> list[dict]:
@@ -105,6 +111,15 @@ def _advance_roadmap(roadmap: Roadmap) -> None:
     # If already on the last day of the last week, leave the pointer in place.
 
 
+def _schedule_next_week(roadmap: Roadmap, background_tasks: BackgroundTasks) -> None:
+    """Pre-generate the following week once the student is far enough into this one."""
+    if roadmap.current_day < settings.ROADMAP_PREGENERATE_FROM_DAY:
+        return
+    next_week = roadmap.current_week + 1
+    if next_pending_week(roadmap.content, roadmap.current_week) == next_week:
+        schedule_week_pregeneration(background_tasks, roadmap.id, next_week)
+
+
 def _sync_tasks_to_roadmap(
     roadmap: Roadmap,
     week: int,
@@ -115,31 +130,37 @@ def _sync_tasks_to_roadmap(
     """Write task completion flags back into the roadmap's content JSON.
 
     This keeps the roadmap page in sync with the daily-plan page so that
-    completed tasks show as completed everywhere.
+    completed tasks show as completed everywhere. Only the flags of
+    ``tasks`` are touched, and the write is a compare-and-swap on the
+    roadmap version, so concurrent edits to other tasks or weeks survive.
     """
-    try:
-        week_index = week - 1
-        day_index = day - 1
-        content = copy.deepcopy(roadmap.content)
-        roadmap_tasks = content["weeks"][week_index]["days"][day_index]["tasks"]
-    except (KeyError, IndexError, TypeError):
-        return  # Nothing to sync — silently skip
-
     # Build a lookup from task id → completed
     completion_map = {t["id"]: t.get("completed", False) for t in tasks if "id" in t}
 
-    changed = False
-    for rt in roadmap_tasks:
-        tid = rt.get("id")
-        if tid and tid in completion_map:
-            new_val = completion_map[tid]
-            if rt.get("completed") != new_val:
-                rt["completed"] = new_val
-                changed = True
+    def apply_flags(content: dict) -> bool:
+        try:
+            roadmap_tasks = content["weeks"][week - 1]["days"][day - 1]["tasks"]
+        except (KeyError, IndexError, TypeError):
+            return False  # Nothing to sync — silently skip
+
+        changed = False
+        for rt in roadmap_tasks:
+            tid = rt.get("id")
+            if tid and tid in completion_map:
+                new_val = completion_map[tid]
+                if rt.get("completed") != new_val:
+                    rt["completed"] = new_val
+                    changed = True
+        return changed
 
-    if changed:
-        roadmap.content = content
-        flag_modified(roadmap, "content")
+    try:
+        update_roadmap_content(db, roadmap, apply_flags)
+    except RoadmapConflictError:
+        db.rollback()
+        raise HTTPException(
+            status_code=409,
+            detail="Roadmap was modified concurrently; please retry.",
+        )
 
 
 @router.get("", response_model=DailyPlanResponse)
@@ -193,7 +214,7 @@ def complete_task(
     """
     roadmap = _get_active_roadmap(current_user, db)
 
-    plan = _get_today_plan(roadmap, db)
+    plan = _get_today_plan(roadmap, db, for_update=True)
     if plan is None:
         raise HTTPException(status_code=404, detail="No daily plan found for today.")
 
@@ -218,7 +239,11 @@ def complete_task(
     flag_modified(plan, "tasks")
 
     # ── Sync completion state back into the roadmap content JSON ──
-    _sync_tasks_to_roadmap(roadmap, plan.week, plan.day, tasks, db)
+    # Only the toggled task, so a stale copy of the others can't undo a
+    # concurrent update to them.
+    _sync_tasks_to_roadmap(
+        roadmap, plan.week, plan.day, [t for t in tasks if t.get("id") == body.task_id], db
+    )
 
     db.commit()
     db.refresh(plan)
@@ -228,6 +253,7 @@ def complete_task(
 
 @router.post("/next", response_model=DailyPlanResponse)
 def advance_to_next_day(
+    background_tasks: BackgroundTasks,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
 ) -> DailyPlan:
@@ -235,6 +261,8 @@ def advance_to_next_day(
 
     Only allowed when all tasks in the current day's plan are completed.
     If the next day's content doesn't exist (pending week), raises 422.
+    From ``ROADMAP_PREGENERATE_FROM_DAY`` on, the next pending week is
+    generated in the background.
     """
     roadmap = _get_active_roadmap(current_user, db)
 
@@ -262,6 +290,7 @@ def advance_to_next_day(
     existing = _get_today_plan(roadmap, db)
     if existing is not None:
         db.commit()
+        _schedule_next_week(roadmap, background_tasks)
         return existing
 
     tasks = _derive_tasks_from_roadmap(roadmap)
@@ -279,6 +308,7 @@ def advance_to_next_day(
 
     db.commit()
     db.refresh(new_plan)
+    _schedule_next_week(roadmap, background_tasks)
 
     return new_plan
 
@@ -0,0 +1,66 @@
+"""
+Internal operational endpoints.
+Not used by the frontend; meant for on-call dashboards and curl.
+"""
+
+import hmac
+
+from fastapi import APIRouter, Depends, Header, HTTPException
+
+from app.config import settings
+from app.services.aws_clients import aws_clients
+from app.services.bedrock import bedrock_service
+from app.services.concept_store import concept_store
+from app.services.interview_sessions import interview_sessions
+from app.services.question_bank import question_bank
+from app.services.telemetry import llm_telemetry
+from app.services.translate import translate_service
+
+router = APIRouter(prefix="/internal", tags=["internal"])
+
+
+def require_internal_token(x_internal_token: str | None = Header(default=None)) -> None:
+    """
+    Callers must send INTERNAL_STATS_TOKEN as X-Internal-Token. With no
+    token configured the endpoints are closed, unless INTERNAL_STATS_OPEN
+    explicitly opens them for local development.
+    """
+    expected = settings.INTERNAL_STATS_TOKEN
+    if not expected:
+        if settings.INTERNAL_STATS_OPEN:
+            return
+        raise HTTPException(
+            status_code=403,
+            detail="Internal endpoints are disabled: INTERNAL_STATS_TOKEN is not set",
+        )
+    if not hmac.compare_digest(x_internal_token or "", expected):
+        raise HTTPException(status_code=403, detail="Invalid internal token")
+
+
+@router.get("/stats/llm", dependencies=[Depends(require_internal_token)])
+def llm_stats():
+    """Per-call-site Bedrock telemetry plus cache, coalescing, breaker, limiter, retry budget, hedging, routing, AWS client and store state."""
+    return {
+        "telemetry": llm_telemetry.snapshot(),
+        "response_cache": bedrock_service.cache_stats(),
+        "coalescing": {
+            "bedrock": bedrock_service.coalescing_stats(),
+            "translate": translate_service.coalescing_stats(),
+        },
+        "circuit_breaker": bedrock_service.circuit_breaker_state(),
+        "concurrency": bedrock_service.concurrency_stats(),
+        "retries": bedrock_service.retry_stats(),
+        "hedging": bedrock_service.hedge_stats(),
+        "aws_clients": aws_clients.stats(),
+        "model_routing": bedrock_service.routing_table(),
+        "concept_store": concept_store.stats(),
+        "interview_question_bank": question_bank.stats(),
+        "interview_sessions": interview_sessions.stats(),
+    }
+
+
+@router.post("/stats/llm/reset", status_code=204, dependencies=[Depends(require_internal_token)])
+def reset_llm_stats():
+    """Start a fresh telemetry window (e.g. before a load test)."""
+    llm_telemetry.reset()
+    return None
@@ -1,224 +1,251 @@
+import asyncio
 import json
-
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-
-from app.database import get_db
-from app.auth import get_current_user
-from app.models import User, Interview
+from typing import AsyncGenerator
+
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    Depends,
+    HTTPException,
+    WebSocket,
+    WebSocketDisconnect,
+    status,
+)
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, selectinload
+
+from app.config import settings
+from app.database import SessionLocal, get_db
+from app.auth import get_current_user, user_from_token
+from app.models import User, Interview, InterviewMessage
 from app.schemas import InterviewStartRequest, InterviewRespondRequest, InterviewResponse
 from app.services.bedrock import bedrock_service
+from app.services.interview_context import interview_context
+from app.services.interview_evaluation import (
+    ACTIVE,
+    EVALUATING,
+    assess_answer,
+    evaluation_jobs,
+    question_before,
+)
+from app.services.interview_messages import ConcurrentTurnError, append_messages, load_messages
+from app.services.interview_sessions import interview_sessions
 from app.services.prompts import (
-    INTERVIEW_SYSTEM_PROMPT,
+    INTERVIEW_FOLLOWUP_RULES,
+    get_interview_system_prompt,
     get_interview_start_prompt,
-    get_interview_evaluate_prompt,
     get_interview_followup_prompt,
 )
+from app.services.question_bank import question_bank
+from app.utils.deadline import Deadline, request_deadline
 
 router = APIRouter(prefix="/api/interview", tags=["interview"])
 
-LANGUAGE_NAMES = {
-    "en": "English",
-    "hi": "Hindi",
-    "ta": "Tamil",
-    "te": "Telugu",
-    "bn": "Bengali",
-    "mr": "Marathi",
-}
-
-
-def _build_interview_system_prompt(preferred_language: str | None) -> str:
-    language_code = (preferred_language or "en").lower()
-    if language_code == "en":
-        return INTERVIEW_SYSTEM_PROMPT
-
-    language_name = LANGUAGE_NAMES.get(language_code, preferred_language or "English")
-    return (
-        f"{INTERVIEW_SYSTEM_PROMPT}\n\n"
-        f"Conduct this interview primarily in {language_name}. "
-        f"Keep technical terms (data structures, algorithms, API names) in English "
-        f"but explain and converse in {language_name}."
+
+def _get_owned_interview(db: Session, interview_id: str, user_id: str) -> Interview:
+    interview = (
+        db.query(Interview)
+        .filter(Interview.id == interview_id, Interview.user_id == user_id)
+        .first()
     )
+    if interview is None:
+        raise HTTPException(status_code=404, detail="Interview not found")
+    return interview
 
 
-def _evaluate_interview(interview: Interview) -> tuple[int | None, str | None]:
+def _with_transcript(db: Session, interview: Interview) -> Interview:
     """
-    Call Bedrock to evaluate the completed interview.
-
-    Returns a (score, feedback) tuple parsed from the JSON response.
-    On any parsing failure the raw text is returned as feedback with no score.
+    Load the messages for the response here, on the threadpool, rather than
+    lazily while the response is serialized on the event loop.
     """
-    raw = bedrock_service.invoke_model(
-        _build_interview_system_prompt(getattr(interview, "preferred_language", "en")),
-        get_interview_evaluate_prompt(
-            interview.role,
-            interview.company,
-            interview.messages,
-        ),
-        fallback_type="interview",
-    )
+    db.refresh(interview, ["messages"])
+    return interview
+
+
+def _save(db: Session, instance: Interview) -> Interview:
+    db.add(instance)
+    db.commit()
+    db.refresh(instance)
+    return _with_transcript(db, instance)
+
+
+def _load_turn(db: Session, interview_id: str, user_id: str) -> tuple[Interview, list[dict]]:
+    """The interview and the transcript tail a follow-up prompt needs (what the summary does not cover)."""
+    interview = _get_owned_interview(db, interview_id, user_id)
+    return interview, load_messages(db, interview.id, since_seq=interview.summarized_messages or 0)
+
 
+def _append(db: Session, interview: Interview, messages: list[dict]) -> Interview:
+    """Append a turn's messages and save any other change to the interview with them."""
     try:
-        data = json.loads(raw)
-
-        # Compute score from sub-scores when available (weighted average).
-        tech = data.get("technical_score")
-        comm = data.get("communication_score")
-        ps = data.get("problem_solving_score")
-
-        if tech is not None and comm is not None and ps is not None:
-            # Weighted: technical 40%, problem-solving 35%, communication 25%
-            weighted = int(tech) * 0.40 + int(ps) * 0.35 + int(comm) * 0.25
-            score = round(weighted * 10)          # 1-10 → 0-100
-        else:
-            raw_score = data.get("score")
-            score = int(raw_score) if raw_score is not None else None
-            if score is not None:
-                if score <= 10:
-                    score = score * 10
-
-        if score is not None:
-            score = max(0, min(100, score))
-
-        # Store the full evaluation JSON so the frontend can render it.
-        feedback = json.dumps(data)
-    except (ValueError, TypeError, json.JSONDecodeError, AttributeError):
-        score = None
-        feedback = raw
-
-    # Guarantee a score so the interview is always marked as finished.
-    if score is None:
-        score = 50
-        if not feedback:
-            feedback = "Interview evaluation could not be fully processed. A default score has been assigned."
-
-    return score, feedback
+        append_messages(db, interview, messages)
+        return _save(db, interview)
+    except (ConcurrentTurnError, IntegrityError):
+        db.rollback()
+        raise HTTPException(
+            status_code=409,
+            detail="This interview was updated by another request; reload it and try again",
+        )
 
 
+async def _queue_evaluation(interview: Interview, background_tasks: BackgroundTasks) -> None:
+    """Queue the interview's evaluation job and run it after the response is sent."""
+    if await evaluation_jobs.enqueue_async(interview.id):
+        background_tasks.add_task(evaluation_jobs.run, interview.id)
+
+
+# Endpoints that call Bedrock are async so a slow model turn does not hold a
+# threadpool worker; database access is pushed onto the threadpool explicitly.
+
 @router.post("/start", response_model=InterviewResponse)
-def start_interview(
+async def start_interview(
     body: InterviewStartRequest,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
+    deadline: Deadline = Depends(request_deadline),
 ) -> InterviewResponse:
-    """Start a new mock interview session and return the first question."""
-    system_prompt = _build_interview_system_prompt(current_user.preferred_language)
-    first_question = bedrock_service.invoke_model(
-        system_prompt,
-        get_interview_start_prompt(body.role, body.company),
-        fallback_type="interview",
-    )
+    """
+    Start a new mock interview session and return the first question.
+
+    The opening comes from the pre-generated question bank when it covers
+    this role, company type and language; Bedrock is only called on a miss.
+    """
+    first_question = None
+    if settings.INTERVIEW_BANK_ENABLED:
+        first_question = await question_bank.sample_async(
+            body.role, body.company, current_user.preferred_language, current_user.id
+        )
+    if first_question is None:
+        first_question = await bedrock_service.invoke_model_async(
+            get_interview_system_prompt(current_user.preferred_language),
+            get_interview_start_prompt(body.role, body.company),
+            fallback_type="interview",
+            call_site="interview_start",
+            user_id=current_user.id,
+            deadline=deadline,
+            hedge=True,
+        )
 
     interview = Interview(
         user_id=current_user.id,
         role=body.role,
         company=body.company,
-        messages=[{"role": "assistant", "content": first_question}],
+        message_count=1,
+        messages=[InterviewMessage(seq=0, role="assistant", content=first_question)],
     )
     setattr(interview, "preferred_language", current_user.preferred_language)
-    db.add(interview)
-    db.commit()
-    db.refresh(interview)
 
-    return interview
+    return await run_in_threadpool(_save, db, interview)
 
 
 @router.post("/respond", response_model=InterviewResponse)
-def respond_to_interview(
+async def respond_to_interview(
     body: InterviewRespondRequest,
+    background_tasks: BackgroundTasks,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
+    deadline: Deadline = Depends(request_deadline),
 ) -> InterviewResponse:
     """
     Send a candidate answer to an ongoing interview.
 
-    After 8 Q&A pairs (16 messages total) the interview is automatically
-    evaluated and the session is closed with a score and feedback.
+    After 8 Q&A pairs (16 messages total) the interview is closed and
+    returned with status "evaluating"; the score and feedback are filled
+    in by a background job (poll GET /api/interview/{id}). Each answer is
+    scored alongside the follow-up question, and every few turns the older
+    exchanges are folded into the interview's running summary in the
+    background. The turn appends two transcript rows; a second answer sent
+    for the same question gets a 409.
     """
-    interview = (
-        db.query(Interview)
-        .filter(Interview.id == body.interview_id, Interview.user_id == current_user.id)
-        .first()
-    )
-
-    if interview is None:
-        raise HTTPException(status_code=404, detail="Interview not found")
+    interview, messages = await run_in_threadpool(_load_turn, db, body.interview_id, current_user.id)
 
     if interview.score is not None:
         raise HTTPException(status_code=400, detail="Interview is already completed")
+    if interview.status != ACTIVE:
+        raise HTTPException(status_code=400, detail="Interview has already ended")
 
-    # Append the candidate's answer.
-    messages = list(interview.messages)
-    messages.append({"role": "user", "content": body.message})
-    interview.messages = messages
+    # The candidate's answer; it is stored together with the reply below.
+    answer = {"seq": interview.message_count, "role": "user", "content": body.message}
+    messages.append(answer)
 
     # Auto-evaluate when 8 Q&A pairs (16 messages) have been exchanged.
-    if len(messages) >= 16:
-        setattr(interview, "preferred_language", current_user.preferred_language)
-        score, feedback = _evaluate_interview(interview)
-        interview.score = score
-        interview.feedback = feedback
-        db.commit()
-        db.refresh(interview)
-        return interview
+    if interview.message_count + 1 >= 16:
+        interview.status = EVALUATING
+        saved = await run_in_threadpool(_append, db, interview, [answer])
+        await _queue_evaluation(saved, background_tasks)
+        return saved
 
     # Otherwise ask the next interview question.
     # NOTE: We use invoke_model (not invoke_model_with_history) because:
     # - The Converse API requires the first message to be from "user";
     #   our stored messages start with the assistant's opening question.
-    # - get_interview_followup_prompt embeds the recent context in the prompt,
-    #   giving the model everything it needs without the ordering constraint.
-    last_answer = body.message
-    system_prompt = _build_interview_system_prompt(current_user.preferred_language)
-    ai_response = bedrock_service.invoke_model(
+    # - get_interview_followup_prompt embeds the context (running summary +
+    #   recent turns) in the prompt, giving the model everything it needs
+    #   without the ordering constraint.
+    conversation, last_answer = interview_context.followup_context(interview, messages)
+    system_prompt = get_interview_system_prompt(current_user.preferred_language)
+    followup = bedrock_service.invoke_model_async(
         system_prompt,
         get_interview_followup_prompt(
             interview.role,
             interview.company,
             last_answer,
-            messages,
+            conversation,
+            # Turns alternate from the opening question, so this is the answer count
+            (interview.message_count + 1) // 2,
         ),
         temperature=0.8,
         fallback_type="interview",
+        cacheable_prefix=INTERVIEW_FOLLOWUP_RULES,
+        user_id=current_user.id,
+        deadline=deadline,
+        hedge=True,
     )
-
-    messages.append({"role": "assistant", "content": ai_response})
-    interview.messages = messages
-
-    db.commit()
-    db.refresh(interview)
-
-    return interview
+    if settings.INTERVIEW_TURN_ASSESSMENT_ENABLED:
+        # Score the answer alongside the follow-up; the assessment is the
+        # cheaper call, so the turn is not slower for it
+        ai_response, assessment = await asyncio.gather(
+            followup,
+            assess_answer(interview, question_before(messages, len(messages) - 1), body.message, deadline),
+        )
+        if assessment is not None:
+            answer["assessment"] = assessment
+    else:
+        ai_response = await followup
+
+    saved = await run_in_threadpool(
+        _append, db, interview, [answer, {"role": "assistant", "content": ai_response}]
+    )
+    if interview_context.needs_summary(saved):
+        background_tasks.add_task(interview_context.summarize, saved.id)
+    return saved
 
 
 @router.post("/{interview_id}/end", response_model=InterviewResponse)
-def end_interview(
+async def end_interview(
     interview_id: str,
+    background_tasks: BackgroundTasks,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
 ) -> InterviewResponse:
-    """Manually end an interview and receive a score with detailed feedback."""
-    interview = (
-        db.query(Interview)
-        .filter(Interview.id == interview_id, Interview.user_id == current_user.id)
-        .first()
-    )
+    """
+    Manually end an interview and queue its evaluation.
 
-    if interview is None:
-        raise HTTPException(status_code=404, detail="Interview not found")
+    Returns at once with status "evaluating"; poll GET /api/interview/{id}
+    for the score and feedback. Ending an interview whose evaluation failed
+    retries it.
+    """
+    interview = await run_in_threadpool(_get_owned_interview, db, interview_id, current_user.id)
 
     if interview.score is not None:
-        return interview
-
-    setattr(interview, "preferred_language", current_user.preferred_language)
-    score, feedback = _evaluate_interview(interview)
-    interview.score = score
-    interview.feedback = feedback
+        return await run_in_threadpool(_with_transcript, db, interview)
 
-    db.commit()
-    db.refresh(interview)
-
-    return interview
+    if interview.status != EVALUATING:
+        interview.status = EVALUATING
+        interview = await run_in_threadpool(_save, db, interview)
+    await _queue_evaluation(interview, background_tasks)
+    return await run_in_threadpool(_with_transcript, db, interview)
 
 
 @router.get("/history", response_model=list[InterviewResponse])
@@ -229,9 +256,174 @@ def get_interview_history(
     """Return all past interviews for the current user, newest first."""
     interviews = (
         db.query(Interview)
+        .options(selectinload(Interview.messages))
         .filter(Interview.user_id == current_user.id)
         .order_by(Interview.created_at.desc())
         .all()
     )
 
     return interviews
+
+
+@router.get("/{interview_id}", response_model=InterviewResponse)
+async def get_interview(
+    interview_id: str,
+    background_tasks: BackgroundTasks,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+) -> InterviewResponse:
+    """
+    Return one interview; poll this while its status is "evaluating".
+
+    An evaluation job that no worker is running any more (its worker
+    restarted, or a retry is due) is picked up again here.
+    """
+    interview = await run_in_threadpool(_get_owned_interview, db, interview_id, current_user.id)
+
+    if interview.status == EVALUATING:
+        job = await evaluation_jobs.get_async(interview.id)
+        if job is None:
+            await _queue_evaluation(interview, background_tasks)
+        elif evaluation_jobs.is_due(job):
+            background_tasks.add_task(evaluation_jobs.run, interview.id)
+    return await run_in_threadpool(_with_transcript, db, interview)
+
+
+# ── Live session (WebSocket) ──────────────────────────────────────────────
+# The same interview as the endpoints above, one turn per client message,
+# with the interviewer's reply streamed as it is generated. Session state
+# stays in memory between turns (see app/services/interview_sessions.py).
+
+# How long a new connection has to send its auth message
+WS_AUTH_TIMEOUT_SECONDS = 10
+
+
+def _websocket_user(token: str) -> User | None:
+    db = SessionLocal()
+    try:
+        return user_from_token(db, token)
+    except HTTPException:
+        return None
+    finally:
+        db.close()
+
+
+async def _authenticate(websocket: WebSocket) -> User | None:
+    """
+    Read the ``{"type": "auth", "token": "..."}`` message a client must send
+    first. The token is not taken from the URL, where it would end up in
+    proxy and access logs and browser history.
+    """
+    try:
+        data = await asyncio.wait_for(websocket.receive_json(), WS_AUTH_TIMEOUT_SECONDS)
+    except (asyncio.TimeoutError, json.JSONDecodeError, KeyError):
+        return None
+    if not isinstance(data, dict) or data.get("type") != "auth":
+        return None
+    token = data.get("token")
+    if not isinstance(token, str) or not token:
+        return None
+    return await run_in_threadpool(_websocket_user, token)
+
+
+def _rate_limited(websocket: WebSocket) -> int:
+    """
+    Charge an answer to the client's HTTP rate-limit bucket; each one starts
+    a model call just like POST /api/interview/respond.
+
+    Returns:
+        Seconds to wait before answering again, or 0 if the answer may go ahead
+    """
+    limiter = getattr(websocket.state, "rate_limiter", None)
+    if limiter is None:
+        return 0
+    is_allowed, retry_after = limiter.check(websocket)
+    return 0 if is_allowed else retry_after
+
+
+async def _relay(websocket: WebSocket, events: AsyncGenerator[dict, None], connected: bool) -> bool:
+    """
+    Send a turn's events. A client that went away does not stop the turn,
+    so its messages are still saved.
+
+    Returns:
+        Whether the client is still connected
+    """
+    async for event in events:
+        if not connected:
+            continue
+        try:
+            await websocket.send_json(event)
+        except (WebSocketDisconnect, RuntimeError, OSError):
+            connected = False
+    return connected
+
+
+@router.websocket("/ws/{interview_id}")
+async def interview_session(websocket: WebSocket, interview_id: str) -> None:
+    """
+    Live interview session.
+
+    The first client message must be ``{"type": "auth", "token": "..."}``
+    with the access token, sent within ``WS_AUTH_TIMEOUT_SECONDS``; after
+    that, ``{"type": "answer", "message": "..."}`` and ``{"type": "end"}``.
+    Server events: ``session`` once authenticated, then per answer
+    ``answer`` (saved), ``token`` (reply text as generated) and ``reply``
+    (saved, with the turn's time to first token); ``ended`` once the
+    interview is over and evaluation is queued (poll GET
+    /api/interview/{id}); ``error`` with ``reload: true`` when the
+    interview was changed elsewhere, or with ``retry_after`` when answers
+    come faster than the API rate limit allows. A reply that was never
+    saved (the server stopped mid-turn) is generated when the client
+    reconnects.
+    """
+    await websocket.accept()
+    connected = True
+    try:
+        user = await _authenticate(websocket)
+        if user is None:
+            await websocket.close(code=status.WS_1008_POLICY_VIOLATION, reason="Invalid or expired token.")
+            return
+        session = await interview_sessions.open(interview_id, user.id, user.preferred_language)
+        if session is None:
+            await websocket.close(code=status.WS_1008_POLICY_VIOLATION, reason="Interview not found")
+            return
+
+        await websocket.send_json({
+            "type": "session",
+            "interview_id": interview_id,
+            "status": session.interview.status,
+            "message_count": session.interview.message_count,
+        })
+        if session.awaiting_reply:
+            connected = await _relay(websocket, interview_sessions.take_turn(session, None), connected)
+
+        while connected:
+            try:
+                data = await websocket.receive_json()
+            except (json.JSONDecodeError, KeyError):
+                await websocket.send_json({"type": "error", "detail": "Messages must be JSON objects"})
+                continue
+            kind = data.get("type") if isinstance(data, dict) else None
+            if kind == "answer":
+                message = str(data.get("message") or "").strip()
+                if not message:
+                    await websocket.send_json({"type": "error", "detail": "Answer is empty"})
+                    continue
+                retry_after = _rate_limited(websocket)
+                if retry_after:
+                    await websocket.send_json({
+                        "type": "error",
+                        "detail": "Rate limit exceeded. Please try again later.",
+                        "retry_after": retry_after,
+                    })
+                    continue
+                connected = await _relay(websocket, interview_sessions.take_turn(session, message), connected)
+            elif kind == "end":
+                await websocket.send_json(await interview_sessions.end(session))
+                await websocket.close()
+                return
+            else:
+                await websocket.send_json({"type": "error", "detail": f"Unknown message type: {kind}"})
+    except WebSocketDisconnect:
+        pass
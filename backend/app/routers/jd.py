@@ -7,6 +7,7 @@ from app.models import User
 from app.schemas import JDAnalyzeRequest, JDAnalyzeResponse
 from app.services.bedrock import bedrock_service
 from app.services.prompts import JD_SYSTEM_PROMPT, get_jd_analysis_prompt
+from app.utils.deadline import Deadline, request_deadline
 
 router = APIRouter(prefix="/api/jd", tags=["jd"])
 
@@ -46,18 +47,21 @@ def _normalize_gap_item(item: object) -> dict:
 
 
 @router.post("/analyze", response_model=JDAnalyzeResponse)
-def analyze_jd(
+async def analyze_jd(
     body: JDAnalyzeRequest,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
+    deadline: Deadline = Depends(request_deadline),
 ) -> JDAnalyzeResponse:
     """Analyze a job description and return a skill gap report against the user's current skills."""
     user_skills = current_user.skills or {}
 
-    raw = bedrock_service.invoke_model(
+    raw = await bedrock_service.invoke_model_async(
         JD_SYSTEM_PROMPT,
         get_jd_analysis_prompt(body.job_description, user_skills),
         fallback_type="jd_analysis",
+        user_id=current_user.id,
+        deadline=deadline,
     )
     data = bedrock_service.parse_json_response_safe(
         raw,
@@ -1,14 +1,24 @@
+import asyncio
 import copy
+import json
+import logging
 import uuid
+from typing import AsyncGenerator, Callable
 
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session, attributes
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session
 
-from app.database import get_db
+from app.config import settings
+from app.database import SessionLocal, get_db
 from app.auth import get_current_user
 from app.models import Resource, Roadmap, User
-from app.schemas import RoadmapResponse, RoadmapListResponse, GenerateWeekRequest
+from app.schemas import RoadmapResponse, RoadmapListResponse, GenerateWeekRequest, RoadmapWeekJobResponse
 from app.services.bedrock import bedrock_service
+from app.services.concepts import TOPIC_KEYWORDS
+from app.services.llm_scheduler import BACKGROUND
+from app.services.roadmap_content import RoadmapConflictError, update_roadmap_content
 from app.services.prompts import (
     ROADMAP_SYSTEM_PROMPT,
     ROADMAP_WEEK_SYSTEM_PROMPT,
@@ -16,9 +26,16 @@ from app.services.prompts import (
     get_roadmap_plan_prompt,
     get_roadmap_week_prompt,
 )
+from app.services.week_jobs import DONE, FAILED, MANUAL, PREGENERATE, week_jobs
+from app.utils.deadline import Deadline, request_deadline
+from app.utils.json_repair import IncrementalJsonParser
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/roadmap", tags=["roadmap"])
 
+SSE_HEADERS = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+
 ALLOWED_TASK_TYPES = {"learn", "practice", "review", "interview", "project", "quiz"}
 TASK_TYPE_ALIASES = {
     "video": "learn",
@@ -29,28 +46,6 @@ TASK_TYPE_ALIASES = {
     "code": "practice",
 }
 
-TOPIC_KEYWORDS = {
-    "Arrays": ["array", "hash", "prefix sum", "two pointer", "sliding window"],
-    "Strings": ["string", "substring", "anagram", "palindrome"],
-    "Linked List": ["linked list"],
-    "Stacks & Queues": ["stack", "queue", "monotonic"],
-    "Binary Trees": ["tree", "binary tree", "traversal"],
-    "BST": ["bst", "binary search tree"],
-    "Graphs": ["graph", "bfs", "dfs", "topological", "union find"],
-    "Dynamic Programming": ["dynamic programming", "dp", "memoization"],
-    "Greedy": ["greedy", "interval"],
-    "Backtracking": ["backtracking", "permutation", "combination"],
-    "Binary Search": ["binary search", "search"],
-    "Heap": ["heap", "priority queue"],
-    "SQL": ["sql", "database query"],
-    "DBMS": ["dbms", "normalization", "acid", "join"],
-    "Operating Systems": ["operating system", "os", "process", "thread"],
-    "Computer Networks": ["network", "cn", "tcp", "http"],
-    "OOP": ["oop", "object oriented", "polymorphism", "encapsulation"],
-    "Aptitude": ["aptitude", "reasoning", "quantitative"],
-    "Projects": ["project", "portfolio"],
-}
-
 ROLE_TOPIC_HINTS = {
     "backend": ["SQL", "DBMS", "Operating Systems", "Computer Networks", "OOP"],
     "fullstack": ["Projects", "SQL", "OOP"],
@@ -333,53 +328,160 @@ def _normalize_roadmap_content(content: object, days_per_week: int) -> dict:
     }
 
 
-@router.post("/generate", response_model=RoadmapResponse)
-def generate_roadmap(
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
-):
-    user_profile = {
-        "college": current_user.college,
-        "college_tier": current_user.college_tier,
-        "degree": current_user.degree,
-        "major": current_user.major,
-        "is_cs_background": current_user.is_cs_background,
-        "target_role": current_user.target_role,
-        "target_companies": current_user.target_companies,
-        "hours_per_day": current_user.hours_per_day,
-        "days_per_week": current_user.days_per_week,
-        "skills": current_user.skills,
-        "current_year": current_user.current_year,
-    }
-
-    # Step 1: Generate the plan skeleton + detailed Week 1
-    raw_response = bedrock_service.invoke_model(
-        ROADMAP_SYSTEM_PROMPT,
-        get_roadmap_plan_prompt(
-            user_profile,
-            _fetch_resource_context(
-                db,
-                current_user.target_role,
-                ", ".join(current_user.target_companies or []),
-                preferred_language=getattr(current_user, "preferred_language", "en"),
-                limit=12,
-            ),
-        ),
-        max_tokens=4096,
-        fallback_type="roadmap",
+def _get_owned_roadmap(db: Session, roadmap_id: str, user_id: str) -> Roadmap:
+    roadmap = (
+        db.query(Roadmap)
+        .filter(Roadmap.id == roadmap_id, Roadmap.user_id == user_id)
+        .first()
     )
-    parsed_json = bedrock_service.parse_json_response_safe(
-        raw_response,
-        fallback={
-            "title": "Personalized Learning Roadmap",
-            "total_weeks": 8,
-            "plan": [],
-            "week_1": {},
-            "fallback": True,
-            "message": "Generated fallback roadmap due to AI response parsing issues.",
-        },
+    if roadmap is None:
+        raise HTTPException(status_code=404, detail="Roadmap not found")
+    return roadmap
+
+
+def _deactivate_roadmaps(db: Session, user_id: str) -> None:
+    db.query(Roadmap).filter(
+        Roadmap.user_id == user_id,
+        Roadmap.is_active == True,
+    ).update({"is_active": False})
+
+
+def _insert_active_roadmap(
+    db: Session,
+    user_id: str,
+    target_role: str | None,
+    content: dict,
+    total_weeks: int,
+    active: bool = True,
+) -> Roadmap:
+    """
+    Add a new roadmap (not committed). An active one replaces the user's
+    current active roadmap; an inactive one leaves it alone.
+    """
+    if active:
+        _deactivate_roadmaps(db, user_id)
+
+    roadmap = Roadmap(
+        user_id=user_id,
+        content=content,
+        total_weeks=total_weeks,
+        is_active=active,
+        target_role=target_role,
     )
+    db.add(roadmap)
+    return roadmap
+
+
+def _save_new_roadmap(db: Session, user: User, content: dict, total_weeks: int) -> Roadmap:
+    """Enrich and persist a freshly generated roadmap as the user's active one."""
+    content = _enrich_roadmap_content(content, db)
+    roadmap = _insert_active_roadmap(db, user.id, user.target_role, content, total_weeks)
+    db.commit()
+    db.refresh(roadmap)
+    return roadmap
+
+
+def _update_content(db: Session, roadmap: Roadmap, mutate: Callable[[dict], bool | None], **values) -> bool:
+    """``update_roadmap_content`` with a persistent conflict surfaced as 409."""
+    try:
+        return update_roadmap_content(db, roadmap, mutate, **values)
+    except RoadmapConflictError as exc:
+        db.rollback()
+        raise HTTPException(status_code=409, detail="Roadmap was modified concurrently; please retry") from exc
+
+
+def _save_generated_week(
+    db: Session,
+    roadmap: Roadmap,
+    week_index: int,
+    normalized_week: dict,
+    final: bool = True,
+) -> Roadmap:
+    """
+    Write a generated week into the roadmap content and commit.
+
+    With ``final=False`` the week is a streaming checkpoint: it keeps its
+    pending flag so it is generated (resumed) again, and is not enriched.
+    """
+    # Replace the week — remove the pending flag
+    if final:
+        normalized_week.pop("pending", None)
+        normalized_week = _enrich_roadmap_content({"weeks": [normalized_week]}, db)["weeks"][0]
+    else:
+        normalized_week["pending"] = True
+
+    def write_week(content: dict) -> None:
+        updated_weeks = content.setdefault("weeks", [])
+        # Ensure weeks array is long enough
+        while len(updated_weeks) <= week_index:
+            updated_weeks.append({"week": len(updated_weeks) + 1, "title": f"Week {len(updated_weeks) + 1}", "days": [], "pending": True})
+        updated_weeks[week_index] = normalized_week
+
+    _update_content(db, roadmap, write_week)
+    db.commit()
+    db.refresh(roadmap)
+    return roadmap
+
+
+def _save_generated_weeks(db: Session, roadmap: Roadmap, generated: dict[int, dict]) -> Roadmap:
+    """Write several generated weeks (keyed by week number) into the roadmap in one commit."""
+    week_numbers = sorted(generated)
+    for week_number in week_numbers:
+        generated[week_number].pop("pending", None)
+    enriched = _enrich_roadmap_content({"weeks": [generated[n] for n in week_numbers]}, db)["weeks"]
+
+    def write_weeks(content: dict) -> None:
+        updated_weeks = content.get("weeks", [])
+        for week_number, normalized_week in zip(week_numbers, enriched):
+            if week_number <= len(updated_weeks):
+                updated_weeks[week_number - 1] = normalized_week
+
+    _update_content(db, roadmap, write_weeks)
+    db.commit()
+    db.refresh(roadmap)
+    return roadmap
+
+
+def _roadmap_profile(user: User) -> dict:
+    return {
+        "college": user.college,
+        "college_tier": user.college_tier,
+        "degree": user.degree,
+        "major": user.major,
+        "is_cs_background": user.is_cs_background,
+        "target_role": user.target_role,
+        "target_companies": user.target_companies,
+        "hours_per_day": user.hours_per_day,
+        "days_per_week": user.days_per_week,
+        "skills": user.skills,
+        "current_year": user.current_year,
+    }
 
+
+def _week_profile(user: User) -> dict:
+    return {
+        "college_tier": user.college_tier,
+        "is_cs_background": user.is_cs_background,
+        "target_role": user.target_role,
+        "target_companies": user.target_companies,
+        "hours_per_day": user.hours_per_day,
+        "days_per_week": user.days_per_week,
+        "preferred_language": getattr(user, "preferred_language", "en"),
+    }
+
+
+ROADMAP_PARSE_FALLBACK = {
+    "title": "Personalized Learning Roadmap",
+    "total_weeks": 8,
+    "plan": [],
+    "week_1": {},
+    "fallback": True,
+    "message": "Generated fallback roadmap due to AI response parsing issues.",
+}
+
+
+def _build_roadmap_content(parsed_json: dict, days_per_week: int) -> tuple[dict, int]:
+    """Turn the plan + Week 1 response into roadmap content with pending skeleton weeks."""
     plan = parsed_json.get("plan", [])
     week_1_data = parsed_json.get("week_1", {})
     total_weeks = _to_positive_int(parsed_json.get("total_weeks"), 8)
@@ -387,7 +489,7 @@ def generate_roadmap(
 
     # Build weeks array: Week 1 is detailed, rest are skeleton placeholders
     weeks = []
-    normalized_week_1 = _normalize_week(week_1_data, 1, current_user.days_per_week)
+    normalized_week_1 = _normalize_week(week_1_data, 1, days_per_week)
     weeks.append(normalized_week_1)
 
     for i in range(2, total_weeks + 1):
@@ -403,7 +505,7 @@ def generate_roadmap(
             "pending": True,  # Marker for frontend to know this week needs generation
         })
 
-    normalized_content = {
+    content = {
         "title": title or "Personalized Learning Roadmap",
         "total_weeks": total_weeks,
         "weeks": weeks,
@@ -411,126 +513,833 @@ def generate_roadmap(
         "fallback": bool(parsed_json.get("fallback", False)),
         "message": str(parsed_json.get("message") or ""),
     }
-    normalized_content = _enrich_roadmap_content(normalized_content, db)
+    return content, total_weeks
 
-    # Deactivate existing active roadmaps
-    db.query(Roadmap).filter(
-        Roadmap.user_id == current_user.id,
-        Roadmap.is_active == True,
-    ).update({"is_active": False})
 
-    roadmap = Roadmap(
+def _validate_week_number(roadmap: Roadmap, week_number: int) -> int:
+    """Check that a week can be generated and return its index."""
+    content = roadmap.content or {}
+    weeks = content.get("weeks", [])
+    total_weeks = content.get("total_weeks", len(weeks))
+
+    if week_number < 1 or week_number > total_weeks:
+        raise HTTPException(status_code=400, detail=f"Week number must be between 1 and {total_weeks}")
+
+    # Check if this week already has content (non-empty days and no pending flag)
+    week_index = week_number - 1
+    if week_index < len(weeks):
+        existing = weeks[week_index]
+        if isinstance(existing, dict) and existing.get("days") and not existing.get("pending"):
+            raise HTTPException(status_code=400, detail=f"Week {week_number} already has content")
+    return week_index
+
+
+def _is_pending_week(content: dict | None, week_number: int) -> bool:
+    weeks = (content or {}).get("weeks", [])
+    if week_number < 1 or week_number > len(weeks):
+        return False
+    week = weeks[week_number - 1]
+    return isinstance(week, dict) and (bool(week.get("pending")) or not week.get("days"))
+
+
+async def _pregenerated(roadmap: Roadmap, week_number: int) -> bool:
+    """True if a background job already produced this week."""
+    if _is_pending_week(roadmap.content, week_number):
+        return False
+    job = await week_jobs.get_async(roadmap.id, week_number)
+    return job is not None and job["status"] == DONE and job["source"] == PREGENERATE
+
+
+async def _claim_week(db: Session, roadmap: Roadmap, week_number: int, deadline: Deadline) -> bool:
+    """
+    Take over a week's generation for a generate-week request.
+
+    A queued pre-generation job is simply taken over. If one is already
+    running, wait for it instead of generating the week twice, but no
+    longer than the request's ``deadline``: a takeover after that could
+    not call Bedrock anyway.
+
+    Returns:
+        True if the caller owns the job and must finish it; False if a
+        background job produced the week meanwhile (``roadmap`` is refreshed)
+
+    Raises:
+        HTTPException: 409 if the week is still being generated elsewhere
+            when the wait ends; 503 if that attempt failed too late to take over
+    """
+    if await week_jobs.claim_async(roadmap.id, week_number, MANUAL):
+        return True
+
+    logger.info(f"Week {week_number} of roadmap {roadmap.id} is being pre-generated; waiting for it")
+    job = await week_jobs.wait_async(
+        roadmap.id, week_number, deadline.cap(settings.ROADMAP_WEEK_JOB_WAIT_SECONDS)
+    )
+    if job is not None and job["status"] == DONE:
+        await run_in_threadpool(db.refresh, roadmap)
+        return False
+    # The background attempt failed (or its lease ran out): generate it here
+    if not deadline.expired() and await week_jobs.claim_async(roadmap.id, week_number, MANUAL):
+        return True
+    if job is not None and job["status"] == FAILED:
+        raise HTTPException(
+            status_code=503,
+            detail=f"Background generation of week {week_number} failed; please try again",
+        )
+    raise HTTPException(
+        status_code=409,
+        detail=(
+            f"Week {week_number} is still being generated; "
+            f"check GET /api/roadmap/{roadmap.id}/week-jobs and retry once it has finished"
+        ),
+    )
+
+
+# ── Background pre-generation ─────────────────────────────────────────────
+# The next pending week is generated at BACKGROUND priority once the student
+# is far enough into the current one (see daily_plan.advance_to_next_day)
+# and right after a roadmap is created. Ownership of each week goes through
+# week_jobs, so a generate-week request for the same week either takes over
+# a job that has not started or waits for the running one.
+
+
+def next_pending_week(content: dict | None, after_week: int = 0) -> int | None:
+    """Number of the first pending week after ``after_week``, if any."""
+    weeks = (content or {}).get("weeks", [])
+    for week_number in range(after_week + 1, len(weeks) + 1):
+        if _is_pending_week(content, week_number):
+            return week_number
+    return None
+
+
+def schedule_week_pregeneration(background_tasks: BackgroundTasks, roadmap_id: str, week_number: int) -> bool:
+    """
+    Queue background generation of a pending week (blocking DB call).
+
+    Returns:
+        True if a job was queued; False if pre-generation is disabled or the
+        week is already queued, running or done
+    """
+    if not settings.ROADMAP_PREGENERATE_ENABLED:
+        return False
+    if not week_jobs.enqueue(roadmap_id, week_number):
+        return False
+    background_tasks.add_task(pregenerate_week, roadmap_id, week_number)
+    logger.info(f"Queued pre-generation of week {week_number} for roadmap {roadmap_id}")
+    return True
+
+
+def _load_roadmap_and_user(db: Session, roadmap_id: str) -> tuple[Roadmap | None, User | None]:
+    roadmap = db.query(Roadmap).filter(Roadmap.id == roadmap_id).first()
+    if roadmap is None:
+        return None, None
+    return roadmap, db.query(User).filter(User.id == roadmap.user_id).first()
+
+
+async def pregenerate_week(roadmap_id: str, week_number: int) -> None:
+    """
+    Generate a pending week in the background and save it into the roadmap.
+
+    Does nothing if a generate-week request claimed the week first. A week
+    the model could not produce is left pending (job marked failed) so the
+    on-demand endpoint still generates it.
+    """
+    if not await week_jobs.claim_async(roadmap_id, week_number, PREGENERATE):
+        return
+
+    error: str | None = "Pre-generation did not complete"
+    db = SessionLocal()
+    try:
+        roadmap, user = await run_in_threadpool(_load_roadmap_and_user, db, roadmap_id)
+        if roadmap is None or user is None or not _is_pending_week(roadmap.content, week_number):
+            error = None
+            return
+
+        raw_response = await bedrock_service.invoke_model_async(
+            ROADMAP_WEEK_SYSTEM_PROMPT,
+            await _build_week_prompt(db, roadmap, week_number, user),
+            max_tokens=4096,
+            fallback_type="roadmap_week",
+            priority=BACKGROUND,
+            user_id=user.id,
+        )
+        if bedrock_service.is_fallback_response(raw_response):
+            error = "AI service unavailable"
+            return
+        parsed_week = bedrock_service.parse_json_response_safe(raw_response, fallback={"days": []})
+        if not isinstance(parsed_week.get("days"), list) or not parsed_week["days"]:
+            error = "Model response had no days"
+            return
+
+        base_week = roadmap.content["weeks"][week_number - 1]
+        normalized_week = _normalize_week(parsed_week, week_number, user.days_per_week)
+        if base_week.get("description") and "description" not in normalized_week:
+            normalized_week["description"] = base_week["description"]
+
+        await run_in_threadpool(_store_streamed_week, roadmap_id, week_number - 1, normalized_week, True)
+        error = None
+        logger.info(f"Pre-generated week {week_number} for roadmap {roadmap_id}")
+    except Exception as exc:
+        error = str(exc) or type(exc).__name__
+        logger.warning(f"Pre-generation of week {week_number} for roadmap {roadmap_id} failed: {exc}")
+    finally:
+        db.close()
+        await week_jobs.finish_async(roadmap_id, week_number, error)
+
+
+async def _build_week_prompt(
+    db: Session,
+    roadmap: Roadmap,
+    week_number: int,
+    user: User,
+    completed_days: list[dict] | None = None,
+    previous_themes: list[str] | None = None,
+) -> str:
+    """
+    Build the generation prompt for one week.
+
+    ``previous_themes`` defaults to the titles of the weeks generated so
+    far; fan-out generation passes the planned themes instead.
+    """
+    content = roadmap.content or {}
+    weeks = content.get("weeks", [])
+    plan = content.get("plan", [])
+    week_index = week_number - 1
+    week_plan = next(
+        (entry for entry in plan if isinstance(entry, dict) and entry.get("week") == week_number),
+        {},
+    )
+
+    # Collect themes of already-generated weeks for context
+    if previous_themes is None:
+        previous_themes = []
+        for w in weeks[:week_index]:
+            if isinstance(w, dict) and w.get("days") and not w.get("pending"):
+                previous_themes.append(str(w.get("title") or w.get("theme") or f"Week {w.get('week', '?')}"))
+
+    resource_context = await run_in_threadpool(
+        _fetch_resource_context,
+        db,
+        str(week_plan.get("theme") or ""),
+        str(week_plan.get("focus") or ""),
+        user.target_role,
+        preferred_language=getattr(user, "preferred_language", "en"),
+        limit=10,
+    )
+
+    return get_roadmap_week_prompt(
+        _week_profile(user),
+        week_number,
+        plan,
+        previous_themes or None,
+        resource_context,
+        completed_days,
+    )
+
+
+# The generation endpoints are async so that the Bedrock round trip (5-30 s)
+# does not hold one of the threadpool workers shared by sync endpoints.
+# Database work is short and is pushed onto the threadpool explicitly.
+
+@router.post("/generate", response_model=RoadmapResponse)
+async def generate_roadmap(
+    background_tasks: BackgroundTasks,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+    deadline: Deadline = Depends(request_deadline),
+):
+    resource_context = await run_in_threadpool(
+        _fetch_resource_context,
+        db,
+        current_user.target_role,
+        ", ".join(current_user.target_companies or []),
+        preferred_language=getattr(current_user, "preferred_language", "en"),
+        limit=12,
+    )
+
+    # Step 1: Generate the plan skeleton + detailed Week 1
+    raw_response = await bedrock_service.invoke_model_async(
+        ROADMAP_SYSTEM_PROMPT,
+        get_roadmap_plan_prompt(_roadmap_profile(current_user), resource_context),
+        max_tokens=4096,
+        fallback_type="roadmap",
         user_id=current_user.id,
-        content=normalized_content,
-        total_weeks=total_weeks,
-        is_active=True,
-        target_role=current_user.target_role,
+        deadline=deadline,
     )
-    db.add(roadmap)
-    db.commit()
-    db.refresh(roadmap)
+    parsed_json = bedrock_service.parse_json_response_safe(
+        raw_response,
+        fallback=dict(ROADMAP_PARSE_FALLBACK),
+    )
+
+    normalized_content, total_weeks = _build_roadmap_content(parsed_json, current_user.days_per_week)
+
+    roadmap = await run_in_threadpool(_save_new_roadmap, db, current_user, normalized_content, total_weeks)
+    next_week = next_pending_week(roadmap.content)
+    if next_week is not None:
+        await run_in_threadpool(schedule_week_pregeneration, background_tasks, roadmap.id, next_week)
     return roadmap
 
 
 @router.post("/{roadmap_id}/generate-week", response_model=RoadmapResponse)
-def generate_week(
+async def generate_week(
     roadmap_id: str,
     body: GenerateWeekRequest,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
+    deadline: Deadline = Depends(request_deadline),
 ):
-    """Generate detailed content for a single week of an existing roadmap."""
-    roadmap = (
-        db.query(Roadmap)
-        .filter(Roadmap.id == roadmap_id, Roadmap.user_id == current_user.id)
-        .first()
-    )
-    if roadmap is None:
-        raise HTTPException(status_code=404, detail="Roadmap not found")
+    """
+    Generate detailed content for a single week of an existing roadmap.
+
+    If the week was pre-generated in the background (or is being generated
+    right now) the roadmap is returned without another Bedrock call.
+    """
+    roadmap = await run_in_threadpool(_get_owned_roadmap, db, roadmap_id, current_user.id)
 
-    content = roadmap.content or {}
-    weeks = content.get("weeks", [])
-    plan = content.get("plan", [])
-    total_weeks = content.get("total_weeks", len(weeks))
     week_number = body.week_number
-    week_plan = next(
-        (entry for entry in plan if isinstance(entry, dict) and entry.get("week") == week_number),
-        {},
+    if await _pregenerated(roadmap, week_number):
+        return roadmap
+    week_index = _validate_week_number(roadmap, week_number)
+    if not await _claim_week(db, roadmap, week_number, deadline):
+        return roadmap
+
+    error: str | None = "Week generation did not complete"
+    try:
+        raw_response = await bedrock_service.invoke_model_async(
+            ROADMAP_WEEK_SYSTEM_PROMPT,
+            await _build_week_prompt(db, roadmap, week_number, current_user),
+            max_tokens=4096,
+            fallback_type="roadmap_week",
+            user_id=current_user.id,
+            deadline=deadline,
+        )
+        parsed_week = bedrock_service.parse_json_response_safe(
+            raw_response,
+            fallback={"week": week_number, "theme": f"Week {week_number}", "days": []},
+        )
+
+        # Normalize the generated week
+        normalized_week = _normalize_week(parsed_week, week_number, current_user.days_per_week)
+
+        saved = await run_in_threadpool(_save_generated_week, db, roadmap, week_index, normalized_week)
+        error = None
+        return saved
+    finally:
+        await week_jobs.finish_async(roadmap.id, week_number, error)
+
+
+# ── Streaming generation (Server-Sent Events) ─────────────────────────────
+# Days are normalized and sent as soon as their JSON object is complete, and
+# each one is checkpointed into Roadmap.content with the week still marked
+# pending. A new roadmap is checkpointed inactive and only replaces the
+# user's active one in the final save, so an interrupted stream never
+# displaces a working roadmap. If the connection drops, POST
+# /{id}/generate-week/stream for that week resumes after the last saved day.
+#
+# The generators outlive the request's DB session, so they open their own.
+
+def _sse(event: str, data: dict) -> str:
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+def _store_streamed_roadmap(
+    roadmap_id: str | None,
+    user_id: str,
+    target_role: str | None,
+    content: dict,
+    total_weeks: int,
+    final: bool,
+) -> dict | None:
+    """
+    Create or update the roadmap being streamed; returns it serialized.
+
+    Checkpoints are stored inactive; the final save makes the roadmap the
+    user's active one.
+    """
+    db = SessionLocal()
+    try:
+        if final:
+            content = _enrich_roadmap_content(content, db)
+        if roadmap_id is None:
+            roadmap = _insert_active_roadmap(db, user_id, target_role, content, total_weeks, active=final)
+        else:
+            roadmap = db.query(Roadmap).filter(Roadmap.id == roadmap_id).first()
+            if roadmap is None:  # deleted while streaming
+                return None
+
+            def replace_content(current: dict) -> None:
+                current.clear()
+                current.update(content)
+
+            if final:
+                _deactivate_roadmaps(db, user_id)
+                _update_content(db, roadmap, replace_content, total_weeks=total_weeks, is_active=True)
+            else:
+                _update_content(db, roadmap, replace_content, total_weeks=total_weeks)
+        db.commit()
+        db.refresh(roadmap)
+        return RoadmapResponse.model_validate(roadmap).model_dump(mode="json")
+    finally:
+        db.close()
+
+
+def _store_streamed_week(roadmap_id: str, week_index: int, week: dict, final: bool) -> dict | None:
+    """Checkpoint (or finally save) a week being streamed; returns the roadmap serialized."""
+    db = SessionLocal()
+    try:
+        roadmap = db.query(Roadmap).filter(Roadmap.id == roadmap_id).first()
+        if roadmap is None:
+            return None
+        roadmap = _save_generated_week(db, roadmap, week_index, week, final=final)
+        return RoadmapResponse.model_validate(roadmap).model_dump(mode="json")
+    finally:
+        db.close()
+
+
+async def _stream_roadmap(
+    prompt: str,
+    user_id: str,
+    target_role: str | None,
+    days_per_week: int,
+    background_tasks: BackgroundTasks,
+    deadline: Deadline | None = None,
+) -> AsyncGenerator[str, None]:
+    parser = IncrementalJsonParser(("title",), ("total_weeks",), ("plan",), ("week_1", "days", "*"))
+    header: dict = {}
+    raw_days: list = []
+    roadmap_id: str | None = None
+
+    try:
+        async for chunk in bedrock_service.stream_model_async(
+            ROADMAP_SYSTEM_PROMPT,
+            prompt,
+            max_tokens=4096,
+            call_site="roadmap",
+            user_id=user_id,
+            deadline=deadline,
+        ):
+            for path, value in parser.feed(chunk):
+                if path != ("week_1", "days", "*"):
+                    header[path[0]] = value
+                    if path != ("plan",):
+                        continue
+                elif len(raw_days) < days_per_week:
+                    raw_days.append(value)
+                else:
+                    continue
+
+                # Checkpoint once the plan is known and after every day
+                content, total_weeks = _build_roadmap_content(header, days_per_week)
+                days = [_normalize_day(day, 1, index + 1) for index, day in enumerate(raw_days)]
+                content["weeks"][0] = {**content["weeks"][0], "days": days, "pending": True}
+                stored = await run_in_threadpool(
+                    _store_streamed_roadmap, roadmap_id, user_id, target_role, content, total_weeks, False
+                )
+                if roadmap_id is None and stored is not None:
+                    roadmap_id = stored["id"]
+                    yield _sse("roadmap", {"id": roadmap_id, "title": content["title"], "total_weeks": total_weeks})
+                if path == ("week_1", "days", "*"):
+                    yield _sse("day", {"week": 1, "day": days[-1]})
+    except Exception as exc:
+        detail = exc.detail if isinstance(exc, HTTPException) else "Roadmap generation was interrupted"
+        logger.warning(f"Streaming roadmap generation failed after {len(raw_days)} day(s): {exc}")
+        yield _sse("error", {"detail": detail, "roadmap_id": roadmap_id, "resumable": roadmap_id is not None})
+        return
+
+    parsed_json = bedrock_service.parse_json_response_safe(parser.text, fallback=dict(ROADMAP_PARSE_FALLBACK))
+    week_1 = parsed_json.get("week_1") if isinstance(parsed_json.get("week_1"), dict) else {}
+    if len(raw_days) > len(week_1.get("days") or []):
+        parsed_json["week_1"] = {**week_1, "days": raw_days}
+    content, total_weeks = _build_roadmap_content(parsed_json, days_per_week)
+
+    stored = await run_in_threadpool(
+        _store_streamed_roadmap, roadmap_id, user_id, target_role, content, total_weeks, True
+    )
+    if stored is None:
+        yield _sse("error", {"detail": "Roadmap not found", "roadmap_id": roadmap_id, "resumable": False})
+        return
+    next_week = next_pending_week(stored["content"])
+    if next_week is not None:
+        # Runs once the response has been sent (StreamingResponse background)
+        await run_in_threadpool(schedule_week_pregeneration, background_tasks, stored["id"], next_week)
+    yield _sse("done", stored)
+
+
+async def _stream_week(
+    prompt: str,
+    user_id: str,
+    roadmap_id: str,
+    week_number: int,
+    base_week: dict,
+    completed_days: list[dict],
+    days_per_week: int,
+    deadline: Deadline | None = None,
+) -> AsyncGenerator[str, None]:
+    # The caller claimed the week's job; it is finished here however the
+    # stream ends (a dropped connection leaves the checkpoint resumable)
+    error: str | None = "Stream closed before the week was saved"
+    try:
+        week_index = week_number - 1
+        parser = IncrementalJsonParser(("days", "*"))
+        days = list(completed_days)
+
+        for day in completed_days:
+            yield _sse("day", {"week": week_number, "day": day, "resumed": True})
+
+        try:
+            async for chunk in bedrock_service.stream_model_async(
+                ROADMAP_WEEK_SYSTEM_PROMPT,
+                prompt,
+                max_tokens=4096,
+                call_site="roadmap_week",
+                user_id=user_id,
+                deadline=deadline,
+            ):
+                for _, value in parser.feed(chunk):
+                    if len(days) >= days_per_week:
+                        continue
+                    day = _normalize_day(value, week_number, len(days) + 1)
+                    days.append(day)
+                    await run_in_threadpool(
+                        _store_streamed_week, roadmap_id, week_index, {**base_week, "days": list(days)}, False
+                    )
+                    yield _sse("day", {"week": week_number, "day": day})
+        except Exception as exc:
+            detail = exc.detail if isinstance(exc, HTTPException) else f"Week {week_number} generation was interrupted"
+            logger.warning(f"Streaming week {week_number} generation failed after {len(days)} day(s): {exc}")
+            yield _sse("error", {"detail": detail, "roadmap_id": roadmap_id, "resumable": True})
+            return
+
+        parsed_week = bedrock_service.parse_json_response_safe(
+            parser.text,
+            fallback={"week": week_number, "days": []},
+        )
+        new_days = parsed_week.get("days") if isinstance(parsed_week.get("days"), list) else []
+        # Days the incremental parser did not emit (e.g. recovered by repair)
+        for day in new_days[len(days) - len(completed_days):]:
+            if len(days) >= days_per_week:
+                break
+            days.append(_normalize_day(day, week_number, len(days) + 1))
+
+        week_data = {**parsed_week, "days": days}
+        week_data.setdefault("theme", base_week.get("title"))
+        normalized_week = _normalize_week(week_data, week_number, days_per_week)
+        if base_week.get("description") and "description" not in normalized_week:
+            normalized_week["description"] = base_week["description"]
+
+        stored = await run_in_threadpool(_store_streamed_week, roadmap_id, week_index, normalized_week, True)
+        if stored is None:
+            yield _sse("error", {"detail": "Roadmap not found", "roadmap_id": roadmap_id, "resumable": False})
+            return
+        error = None
+        yield _sse("done", stored)
+    finally:
+        await week_jobs.finish_async(roadmap_id, week_number, error)
+
+
+async def _replay_week(stored: dict, week_number: int) -> AsyncGenerator[str, None]:
+    """Stream a week that a background job already generated."""
+    week = stored["content"]["weeks"][week_number - 1]
+    for day in week.get("days") or []:
+        yield _sse("day", {"week": week_number, "day": day, "resumed": True})
+    yield _sse("done", stored)
+
+
+@router.post("/generate/stream")
+async def generate_roadmap_stream(
+    background_tasks: BackgroundTasks,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+    deadline: Deadline = Depends(request_deadline),
+):
+    """
+    Streaming variant of /generate.
+
+    Events: ``roadmap`` (id, once created), ``day`` (each Week 1 day as it
+    is generated), then ``done`` (the saved roadmap) or ``error``. Week 2
+    is pre-generated in the background after the stream ends.
+    """
+    resource_context = await run_in_threadpool(
+        _fetch_resource_context,
+        db,
+        current_user.target_role,
+        ", ".join(current_user.target_companies or []),
+        preferred_language=getattr(current_user, "preferred_language", "en"),
+        limit=12,
+    )
+    prompt = get_roadmap_plan_prompt(_roadmap_profile(current_user), resource_context)
+
+    return StreamingResponse(
+        _stream_roadmap(
+            prompt,
+            current_user.id,
+            current_user.target_role,
+            current_user.days_per_week,
+            background_tasks,
+            deadline,
+        ),
+        media_type="text/event-stream",
+        headers=SSE_HEADERS,
+        background=background_tasks,
     )
 
-    if week_number < 1 or week_number > total_weeks:
-        raise HTTPException(status_code=400, detail=f"Week number must be between 1 and {total_weeks}")
 
-    # Check if this week already has content (non-empty days and no pending flag)
-    week_index = week_number - 1
-    if week_index < len(weeks):
-        existing = weeks[week_index]
-        if isinstance(existing, dict) and existing.get("days") and not existing.get("pending"):
-            raise HTTPException(status_code=400, detail=f"Week {week_number} already has content")
+@router.post("/{roadmap_id}/generate-week/stream")
+async def generate_week_stream(
+    roadmap_id: str,
+    body: GenerateWeekRequest,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+    deadline: Deadline = Depends(request_deadline),
+):
+    """
+    Streaming variant of /generate-week.
 
-    # Build user profile for the prompt
-    user_profile = {
-        "college_tier": current_user.college_tier,
-        "is_cs_background": current_user.is_cs_background,
-        "target_role": current_user.target_role,
-        "target_companies": current_user.target_companies,
-        "hours_per_day": current_user.hours_per_day,
-        "days_per_week": current_user.days_per_week,
-        "preferred_language": getattr(current_user, "preferred_language", "en"),
-    }
+    Resumes after any days checkpointed by an earlier interrupted stream;
+    those are replayed first as ``day`` events with ``resumed: true``. A
+    week produced by background pre-generation is replayed the same way.
+    """
+    roadmap = await run_in_threadpool(_get_owned_roadmap, db, roadmap_id, current_user.id)
 
-    # Collect themes of already-generated weeks for context
-    previous_themes = []
-    for w in weeks[:week_index]:
-        if isinstance(w, dict) and w.get("days") and not w.get("pending"):
-            previous_themes.append(str(w.get("title") or w.get("theme") or f"Week {w.get('week', '?')}"))
-
-    raw_response = bedrock_service.invoke_model(
-        ROADMAP_WEEK_SYSTEM_PROMPT,
-        get_roadmap_week_prompt(
-            user_profile,
+    week_number = body.week_number
+    replay = await _pregenerated(roadmap, week_number)
+    if not replay:
+        week_index = _validate_week_number(roadmap, week_number)
+        replay = not await _claim_week(db, roadmap, week_number, deadline)
+    if replay:
+        stored = RoadmapResponse.model_validate(roadmap).model_dump(mode="json")
+        return StreamingResponse(
+            _replay_week(stored, week_number), media_type="text/event-stream", headers=SSE_HEADERS
+        )
+
+    weeks = (roadmap.content or {}).get("weeks", [])
+    existing = weeks[week_index] if week_index < len(weeks) and isinstance(weeks[week_index], dict) else {}
+    # A pending week with days is a checkpoint from an interrupted stream
+    completed_days = [day for day in existing.get("days") or [] if isinstance(day, dict)]
+    completed_days = completed_days[:current_user.days_per_week]
+    base_week = {key: value for key, value in existing.items() if key not in ("days", "pending")}
+    base_week.setdefault("week", week_number)
+
+    try:
+        prompt = await _build_week_prompt(db, roadmap, week_number, current_user, completed_days or None)
+    except Exception as exc:
+        await week_jobs.finish_async(roadmap.id, week_number, str(exc) or type(exc).__name__)
+        raise
+
+    return StreamingResponse(
+        _stream_week(
+            prompt,
+            current_user.id,
+            roadmap.id,
             week_number,
-            plan,
-            previous_themes or None,
-            _fetch_resource_context(
-                db,
-                str(week_plan.get("theme") or ""),
-                str(week_plan.get("focus") or ""),
-                current_user.target_role,
-                preferred_language=getattr(current_user, "preferred_language", "en"),
-                limit=10,
-            ),
+            base_week,
+            completed_days,
+            current_user.days_per_week,
+            deadline,
         ),
-        max_tokens=4096,
-        fallback_type="roadmap_week",
-    )
-    parsed_week = bedrock_service.parse_json_response_safe(
-        raw_response,
-        fallback={"week": week_number, "theme": f"Week {week_number}", "days": []},
+        media_type="text/event-stream",
+        headers=SSE_HEADERS,
     )
 
-    # Normalize the generated week
-    normalized_week = _normalize_week(parsed_week, week_number, current_user.days_per_week)
 
-    # Update the roadmap content — use deepcopy + flag_modified for SQLAlchemy
-    updated_content = copy.deepcopy(content)
-    updated_weeks = updated_content.get("weeks", [])
+# ── Fan-out generation of all remaining weeks ─────────────────────────────
+# Instead of one generate-week round trip per week, every pending week is
+# requested at once (bounded by ROADMAP_FANOUT_CONCURRENCY). Each prompt is
+# given the planned themes of the weeks before it rather than waiting for
+# them to be generated. Weeks are streamed back as they complete and merged
+# into Roadmap.content in one transaction at the end.
 
-    # Ensure weeks array is long enough
-    while len(updated_weeks) <= week_index:
-        updated_weeks.append({"week": len(updated_weeks) + 1, "title": f"Week {len(updated_weeks) + 1}", "days": [], "pending": True})
 
-    # Replace the week — remove the pending flag
-    normalized_week.pop("pending", None)
-    updated_weeks[week_index] = normalized_week
-    updated_content["weeks"] = updated_weeks
-    updated_content = _enrich_roadmap_content(updated_content, db)
+def _planned_themes(plan: list, week_number: int) -> list[str]:
+    return [
+        str(entry.get("theme") or f"Week {entry.get('week')}")
+        for entry in sorted(
+            (entry for entry in plan if isinstance(entry, dict) and isinstance(entry.get("week"), int)),
+            key=lambda entry: entry["week"],
+        )
+        if entry["week"] < week_number
+    ]
 
-    roadmap.content = updated_content
-    attributes.flag_modified(roadmap, "content")
-    db.commit()
-    db.refresh(roadmap)
-    return roadmap
+
+def _store_generated_weeks(roadmap_id: str, generated: dict[int, dict]) -> dict | None:
+    db = SessionLocal()
+    try:
+        roadmap = db.query(Roadmap).filter(Roadmap.id == roadmap_id).first()
+        if roadmap is None:
+            return None
+        roadmap = _save_generated_weeks(db, roadmap, generated)
+        return RoadmapResponse.model_validate(roadmap).model_dump(mode="json")
+    finally:
+        db.close()
+
+
+def _load_stored_week(roadmap_id: str, week_number: int) -> dict | None:
+    db = SessionLocal()
+    try:
+        roadmap = db.query(Roadmap).filter(Roadmap.id == roadmap_id).first()
+        weeks = (roadmap.content or {}).get("weeks", []) if roadmap is not None else []
+        return weeks[week_number - 1] if week_number <= len(weeks) else None
+    finally:
+        db.close()
+
+
+async def _generate_fanout_week(
+    semaphore: asyncio.Semaphore,
+    prompt: str,
+    user_id: str,
+    week_number: int,
+    base_week: dict,
+    days_per_week: int,
+) -> dict:
+    async with semaphore:
+        raw_response = await bedrock_service.invoke_model_async(
+            ROADMAP_WEEK_SYSTEM_PROMPT,
+            prompt,
+            max_tokens=4096,
+            fallback_type="roadmap_week",
+            user_id=user_id,
+        )
+    if bedrock_service.is_fallback_response(raw_response):
+        raise RuntimeError("AI service unavailable")
+    parsed_week = bedrock_service.parse_json_response_safe(raw_response, fallback={"days": []})
+    if not isinstance(parsed_week.get("days"), list) or not parsed_week["days"]:
+        raise ValueError("Model response had no days")
+
+    normalized_week = _normalize_week(parsed_week, week_number, days_per_week)
+    if base_week.get("description") and "description" not in normalized_week:
+        normalized_week["description"] = base_week["description"]
+    return normalized_week
+
+
+async def _stream_remaining_weeks(
+    roadmap_id: str,
+    user_id: str,
+    prompts: dict[int, str],
+    base_weeks: dict[int, dict],
+    waiting: list[int],
+    days_per_week: int,
+) -> AsyncGenerator[str, None]:
+    """
+    Generate the claimed weeks concurrently and merge them in one commit.
+
+    ``waiting`` are weeks another job is generating; their result is
+    reported when that job finishes. Every claimed week's job is finished
+    here, also when the client disconnects (weeks completed so far are
+    still saved).
+    """
+    semaphore = asyncio.Semaphore(max(1, settings.ROADMAP_FANOUT_CONCURRENCY))
+    tasks: dict[asyncio.Task, tuple[str, int]] = {}
+    for week_number, prompt in prompts.items():
+        task = asyncio.create_task(
+            _generate_fanout_week(
+                semaphore, prompt, user_id, week_number, base_weeks[week_number], days_per_week
+            )
+        )
+        tasks[task] = ("generate", week_number)
+    for week_number in waiting:
+        task = asyncio.create_task(
+            week_jobs.wait_async(roadmap_id, week_number, settings.ROADMAP_WEEK_JOB_WAIT_SECONDS)
+        )
+        tasks[task] = ("wait", week_number)
+
+    generated: dict[int, dict] = {}
+    errors: dict[int, str] = {}
+    merged = False
+    yield _sse("plan", {"roadmap_id": roadmap_id, "weeks": sorted(prompts), "waiting": sorted(waiting)})
+
+    try:
+        pending = set(tasks)
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in sorted(done, key=lambda t: tasks[t][1]):
+                kind, week_number = tasks[task]
+                exc = task.exception()
+                if kind == "generate" and exc is None:
+                    generated[week_number] = task.result()
+                    yield _sse("week", {"week": week_number, "data": generated[week_number]})
+                elif kind == "generate":
+                    errors[week_number] = str(exc) or type(exc).__name__
+                    logger.warning(f"Fan-out generation of week {week_number} for roadmap {roadmap_id} failed: {exc}")
+                    yield _sse("week_error", {"week": week_number, "detail": f"Week {week_number} could not be generated"})
+                else:
+                    job = task.result() if exc is None else None
+                    week = await run_in_threadpool(_load_stored_week, roadmap_id, week_number)
+                    if job is not None and job["status"] == DONE and week is not None:
+                        yield _sse("week", {"week": week_number, "data": week})
+                    else:
+                        yield _sse("week_error", {"week": week_number, "detail": f"Week {week_number} is still being generated"})
+
+        stored = await run_in_threadpool(_store_generated_weeks, roadmap_id, generated)
+        merged = True
+        if stored is None:
+            yield _sse("error", {"detail": "Roadmap not found", "roadmap_id": roadmap_id, "resumable": False})
+            return
+        yield _sse("done", stored)
+    finally:
+        for task in tasks:
+            task.cancel()
+        if not merged and generated:
+            await run_in_threadpool(_store_generated_weeks, roadmap_id, generated)
+        for week_number in prompts:
+            if week_number in generated:
+                error = None
+            else:
+                error = errors.get(week_number, "Fan-out generation did not complete")
+            await week_jobs.finish_async(roadmap_id, week_number, error)
+
+
+@router.post("/{roadmap_id}/generate-remaining/stream")
+async def generate_remaining_weeks_stream(
+    roadmap_id: str,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """
+    Generate every pending week of a roadmap at once.
+
+    Events: ``plan`` (weeks being generated, and weeks already being
+    generated by another job), then ``week`` or ``week_error`` per week as
+    each finishes, then ``done`` (the saved roadmap). Failed weeks stay
+    pending for /generate-week.
+    """
+    roadmap = await run_in_threadpool(_get_owned_roadmap, db, roadmap_id, current_user.id)
+    content = roadmap.content or {}
+    weeks = content.get("weeks", [])
+    plan = content.get("plan", [])
+
+    claimed: list[int] = []
+    waiting: list[int] = []
+    week_number = next_pending_week(content)
+    while week_number is not None:
+        if await week_jobs.claim_async(roadmap.id, week_number, MANUAL):
+            claimed.append(week_number)
+        else:
+            waiting.append(week_number)
+        week_number = next_pending_week(content, week_number)
+    if not claimed and not waiting:
+        raise HTTPException(status_code=400, detail="All weeks already have content")
+
+    # Prompts are built up front: they share this request's DB session
+    prompts: dict[int, str] = {}
+    base_weeks: dict[int, dict] = {}
+    try:
+        for week_number in claimed:
+            existing = weeks[week_number - 1]
+            base_weeks[week_number] = {key: value for key, value in existing.items() if key not in ("days", "pending")}
+            prompts[week_number] = await _build_week_prompt(
+                db, roadmap, week_number, current_user, previous_themes=_planned_themes(plan, week_number)
+            )
+    except Exception as exc:
+        for week_number in claimed:
+            await week_jobs.finish_async(roadmap.id, week_number, str(exc) or type(exc).__name__)
+        raise
+
+    return StreamingResponse(
+        _stream_remaining_weeks(
+            roadmap.id, current_user.id, prompts, base_weeks, waiting, current_user.days_per_week
+        ),
+        media_type="text/event-stream",
+        headers=SSE_HEADERS,
+    )
 
 
 @router.get("", response_model=RoadmapResponse)
@@ -567,6 +1376,17 @@ def list_all_roadmaps(
     )
 
 
+@router.get("/{roadmap_id}/week-jobs", response_model=list[RoadmapWeekJobResponse])
+async def list_week_jobs(
+    roadmap_id: str,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """Generation status of each week that was queued or generated since the roadmap was created."""
+    roadmap = await run_in_threadpool(_get_owned_roadmap, db, roadmap_id, current_user.id)
+    return await run_in_threadpool(week_jobs.list, roadmap.id)
+
+
 @router.get("/{roadmap_id}", response_model=RoadmapResponse)
 def get_roadmap_by_id(
     roadmap_id: str,
@@ -185,6 +185,15 @@ class GenerateWeekRequest(BaseModel):
     week_number: int
 
 
+class RoadmapWeekJobResponse(BaseModel):
+    week_number: int
+    status: str  # queued | running | done | failed
+    source: str  # pregenerate | manual
+    attempts: int
+    error: Optional[str] = None
+    updated_at: Optional[datetime] = None
+
+
 # ── Daily Plan ────────────────────────────────────────────────────────────
 
 class DailyPlanResponse(BaseModel):
@@ -217,6 +226,14 @@ class InterviewRespondRequest(BaseModel):
     message: str
 
 
+class InterviewMessageResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    role: str  # assistant | user
+    content: str
+    assessment: Optional[dict] = None  # per-answer micro-assessment, user messages only
+
+
 class InterviewResponse(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
@@ -224,9 +241,10 @@ class InterviewResponse(BaseModel):
     user_id: str
     role: str
     company: Optional[str] = None
-    messages: list[dict]
+    messages: list[InterviewMessageResponse]
     score: Optional[int] = None
     feedback: Optional[str] = None
+    status: str = "active"  # active | evaluating | completed | evaluation_failed
     created_at: datetime
 
 
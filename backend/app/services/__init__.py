@@ -1,8 +1,17 @@
 """Services module for AI and translation operations."""
 
-from app.services.bedrock import BedrockService, bedrock_service
-from app.services.translate import TranslateService, translate_service
-from app.services.content_service import ContentService, content_service
+import importlib
+
+# Re-exports are resolved on first access, so importing one service module
+# (e.g. app.services.week_jobs from a script) does not load all of them
+_EXPORTS = {
+    "BedrockService": "app.services.bedrock",
+    "bedrock_service": "app.services.bedrock",
+    "TranslateService": "app.services.translate",
+    "translate_service": "app.services.translate",
+    "ContentService": "app.services.content_service",
+    "content_service": "app.services.content_service",
+}
 
 __all__ = [
     "BedrockService",
@@ -12,3 +21,10 @@ __all__ = [
     "ContentService",
     "content_service",
 ]
+
+
+def __getattr__(name: str):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module), name)
@@ -0,0 +1,103 @@
+"""
+Shared boto3 clients for the AWS services the API calls.
+Clients are created on first use (not at import), once per process, with
+connection pools sized for our executors and timeouts that fit the
+request deadlines.
+"""
+
+import logging
+import threading
+import time
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class AWSClientFactory:
+    """
+    Lazily built, process-wide boto3 clients keyed by service name.
+
+    boto3 clients are thread-safe once created, but creating them is not,
+    so construction happens under a lock on a private boto3 Session. Each
+    client gets a tuned botocore ``Config``: a connection pool of
+    ``AWS_MAX_POOL_CONNECTIONS`` (botocore's default of 10 would serialize
+    a busy Bedrock executor), TCP keep-alive, a short connect timeout and a
+    per-service read timeout and attempt count. boto3 itself (a large
+    import) is only loaded when the first client is built.
+    """
+
+    def __init__(
+        self,
+        endpoint_url: str | None = None,
+        max_pool_connections: int | None = None,
+    ) -> None:
+        self._endpoint_url = endpoint_url
+        self._max_pool_connections = max_pool_connections or settings.AWS_MAX_POOL_CONNECTIONS
+        self._lock = threading.Lock()
+        self._session = None  # boto3 Session, created with the first client
+        self._clients: dict = {}
+        self._created_ms: dict[str, float] = {}
+
+    def _service_options(self, service_name: str) -> tuple[float, int]:
+        """Read timeout and botocore attempts for a service."""
+        if service_name == "bedrock-runtime":
+            # BedrockService runs its own retry loop under the request deadline
+            return settings.BEDROCK_READ_TIMEOUT_SECONDS, settings.BEDROCK_CLIENT_MAX_ATTEMPTS
+        if service_name == "translate":
+            return settings.TRANSLATE_READ_TIMEOUT_SECONDS, settings.TRANSLATE_CLIENT_MAX_ATTEMPTS
+        return 60.0, 3
+
+    def config_for(self, service_name: str):
+        """botocore ``Config`` for a service's client."""
+        from botocore.config import Config
+
+        read_timeout, max_attempts = self._service_options(service_name)
+        return Config(
+            region_name=settings.AWS_REGION,
+            max_pool_connections=self._max_pool_connections,
+            connect_timeout=settings.AWS_CONNECT_TIMEOUT_SECONDS,
+            read_timeout=read_timeout,
+            tcp_keepalive=settings.AWS_TCP_KEEPALIVE,
+            retries={"mode": "standard", "total_max_attempts": max(1, max_attempts)},
+        )
+
+    def get(self, service_name: str):
+        """Return the shared client for ``service_name``, creating it on first use."""
+        client = self._clients.get(service_name)
+        if client is not None:
+            return client
+        with self._lock:
+            client = self._clients.get(service_name)
+            if client is None:
+                started = time.perf_counter()
+                if self._session is None:
+                    import boto3
+
+                    self._session = boto3.session.Session(
+                        aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
+                        aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
+                        region_name=settings.AWS_REGION,
+                    )
+                client = self._session.client(
+                    service_name,
+                    endpoint_url=self._endpoint_url,
+                    config=self.config_for(service_name),
+                )
+                self._clients[service_name] = client
+                self._created_ms[service_name] = round((time.perf_counter() - started) * 1000, 1)
+                logger.info(f"Created {service_name} client in {self._created_ms[service_name]}ms")
+        return client
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "max_pool_connections": self._max_pool_connections,
+                "clients": {
+                    name: {"created_ms": created_ms} for name, created_ms in self._created_ms.items()
+                },
+            }
+
+
+# Global instance
+aws_clients = AWSClientFactory()
@@ -3,18 +3,31 @@ Bedrock Service for AI model invocations.
 Provides retry logic, error handling, and streaming support.
 """
 
+import asyncio
+import functools
 import json
 import logging
 import random
-import re
+import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import AsyncGenerator
 
-import boto3
 from botocore.exceptions import BotoCoreError, ClientError
 from fastapi import HTTPException
 
 from app.config import settings
+from app.services.aws_clients import aws_clients
+from app.services.circuit_breaker import CircuitBreaker
+from app.services.concurrency_limiter import AdaptiveConcurrencyLimiter
+from app.services.hedging import HedgePolicy
+from app.services.llm_scheduler import BACKGROUND, INTERACTIVE, PRIORITY_CLASSES, STANDARD
+from app.services.llm_cache import InMemoryLRUCache, ResponseCache, make_cache_key
+from app.services.retry_budget import RetryBudget
+from app.services.singleflight import AsyncSingleFlight, SingleFlight
+from app.services.telemetry import CallTrace, LLMTelemetry, llm_telemetry
+from app.utils.deadline import Deadline
+from app.utils.json_repair import extract_json, parse_json_or_repair, repair_truncated_json
 
 logger = logging.getLogger(__name__)
 
@@ -49,6 +62,11 @@ class BedrockValidationError(BedrockError):
     pass
 
 
+class BedrockDeadlineError(BedrockError):
+    """Raised when the request's deadline leaves no time for a call."""
+    pass
+
+
 class BedrockService:
     """Service for invoking Amazon Bedrock models with retry logic and comprehensive error handling."""
     
@@ -72,14 +90,137 @@ class BedrockService:
         "default": "I apologize, but I'm experiencing technical difficulties. Please try again in a moment."
     }
     
-    def __init__(self) -> None:
-        self._client = boto3.client(
-            "bedrock-runtime",
-            region_name=settings.AWS_REGION,
-            aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
-            aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
-        )
+    # Response cache TTLs (seconds) per call site (call_site, else
+    # fallback_type). Only call sites listed here are cached; their output
+    # depends only on the prompt in practice.
+    CACHE_TTLS = {
+        "explanation": 24 * 3600,
+        "jd_analysis": 6 * 3600,
+        "roadmap": 3600,
+    }
+    
+    # Model id fragments of Bedrock models that accept cachePoint blocks.
+    # Matched as substrings so cross-region profiles ("us.amazon.nova-...")
+    # are covered too.
+    PROMPT_CACHE_MODELS = (
+        "amazon.nova-micro",
+        "amazon.nova-lite",
+        "amazon.nova-pro",
+        "amazon.nova-premier",
+        "anthropic.claude-3-5-haiku",
+        "anthropic.claude-3-7-sonnet",
+        "anthropic.claude-sonnet-4",
+        "anthropic.claude-opus-4",
+    )
+    CACHE_POINT = {"cachePoint": {"type": "default"}}
+    
+    # Model tier per call site (call_site, else fallback_type). "fast" and
+    # "strong" map to BEDROCK_FAST_MODEL_ID / BEDROCK_STRONG_MODEL_ID;
+    # anything not listed uses BEDROCK_MODEL_ID. BEDROCK_MODEL_ROUTES
+    # overrides entries with a tier name or an explicit model id.
+    MODEL_ROUTES = {
+        "interview": "fast",
+        "interview_start": "fast",
+        "task_translation": "fast",
+        "roadmap": "strong",
+        "roadmap_week": "strong",
+        "interview_evaluation": "strong",
+        "interview_summary": "fast",
+        "interview_bank": "fast",
+        "interview_assessment": "fast",
+        "interview_stream": "fast",
+    }
+    
+    # Scheduling class per call site (call_site, else fallback_type) when the
+    # caller does not pass one; anything not listed is STANDARD.
+    PRIORITIES = {
+        "interview": INTERACTIVE,
+        "interview_start": INTERACTIVE,
+        "interview_assessment": INTERACTIVE,
+        "interview_stream": INTERACTIVE,
+        "explanation": INTERACTIVE,
+        "roadmap": STANDARD,
+        "roadmap_week": STANDARD,
+        "interview_evaluation": STANDARD,
+        "translation": BACKGROUND,
+        "task_translation": BACKGROUND,
+        "interview_summary": BACKGROUND,
+        "interview_bank": BACKGROUND,
+    }
+    
+    # Error types that mean the model is throttled rather than broken, so
+    # the secondary model is worth a try
+    THROTTLE_ERRORS = {"rate_limit", "aws_retryable"}
+    
+    def __init__(
+        self,
+        response_cache: ResponseCache | None = None,
+        telemetry: LLMTelemetry | None = None,
+        client=None,
+    ) -> None:
+        # None = the shared client, created on the first call
+        self._client_override = client
         self._model_id = settings.BEDROCK_MODEL_ID
+        # boto3 is blocking, so async callers run converse() on a dedicated pool
+        # instead of anyio's shared worker threads used by sync endpoints.
+        self._executor = ThreadPoolExecutor(
+            max_workers=settings.BEDROCK_MAX_WORKERS,
+            thread_name_prefix="bedrock",
+        )
+        if response_cache is None and settings.LLM_CACHE_ENABLED:
+            response_cache = InMemoryLRUCache(max_entries=settings.LLM_CACHE_MAX_ENTRIES)
+        self._cache = response_cache
+        self._cache_counters: dict[str, dict[str, int]] = {}
+        # Identical concurrent prompts share one Converse call
+        self._inflight = SingleFlight("bedrock")
+        self._inflight_async = AsyncSingleFlight("bedrock_async")
+        self._stats_lock = threading.Lock()
+        # Throttling storms and outages trip the breaker; while it is open
+        # callers get their fallback without spending retries on Bedrock.
+        self._breaker = CircuitBreaker(
+            "bedrock",
+            failure_threshold=settings.BEDROCK_BREAKER_FAILURE_THRESHOLD,
+            recovery_timeout=settings.BEDROCK_BREAKER_RECOVERY_SECONDS,
+        )
+        # Bounds in-flight Converse calls so a burst of requests does not
+        # run into account-level throttling
+        self._limiter = AdaptiveConcurrencyLimiter(
+            "bedrock",
+            initial_limit=settings.BEDROCK_CONCURRENCY_INITIAL_LIMIT,
+            min_limit=settings.BEDROCK_CONCURRENCY_MIN_LIMIT,
+            max_limit=settings.BEDROCK_CONCURRENCY_MAX_LIMIT,
+            max_wait=settings.BEDROCK_QUEUE_MAX_WAIT_SECONDS,
+            background_share=settings.BEDROCK_BACKGROUND_SHARE,
+        )
+        # Shared by every retry loop: retries stay a fixed share of calls
+        self._retry_budget = RetryBudget(
+            "bedrock",
+            ratio=settings.BEDROCK_RETRY_BUDGET_RATIO,
+            max_tokens=settings.BEDROCK_RETRY_BUDGET_MAX_TOKENS,
+        )
+        self._deadline_stops = 0
+        # Opt-in duplicate requests for calls stuck past their usual latency
+        self._hedge = HedgePolicy(
+            "bedrock",
+            percentile=settings.BEDROCK_HEDGE_PERCENTILE,
+            min_samples=settings.BEDROCK_HEDGE_MIN_SAMPLES,
+            max_ratio=settings.BEDROCK_HEDGE_MAX_RATIO,
+            max_tokens=settings.BEDROCK_HEDGE_MAX_TOKENS,
+        )
+        self._telemetry = telemetry or llm_telemetry
+        routes = self.routing_table()
+        logger.info(
+            f"Bedrock model routing: default={self._model_id} "
+            f"secondary={routes['secondary_model']} routes={routes['routes']}"
+        )
+    
+    @property
+    def _client(self):
+        return self._client_override or aws_clients.get("bedrock-runtime")
+    
+    @_client.setter
+    def _client(self, client) -> None:
+        self._client_override = client
     
     def _calculate_delay(self, attempt: int) -> float:
         """
@@ -102,6 +243,18 @@ class BedrockService:
         error_message = str(error).lower()
         error_type = "unknown"
         
+        # Short-circuited by our own breaker - do not retry or count it
+        if "circuit breaker is open" in error_message:
+            return False, True, "circuit_open"
+        
+        # Waited too long for a concurrency slot - Bedrock was never called
+        if "concurrency queue wait exceeded" in error_message:
+            return False, True, "queue_timeout"
+        
+        # Out of time for this request - says nothing about Bedrock's health
+        if "request deadline exceeded" in error_message:
+            return False, True, "deadline_exceeded"
+        
         # Rate limit errors - retryable with backoff
         if any(x in error_message for x in ["rate limit", "throttling", "too many requests", "throttlingexception"]):
             error_type = "rate_limit"
@@ -173,85 +326,367 @@ class BedrockService:
         except (json.JSONDecodeError, TypeError):
             return fallback
     
-    def invoke_model(
-        self,
-        system_prompt: str,
-        user_prompt: str,
-        max_tokens: int = 4096,
-        temperature: float = 0.7,
-        fallback_type: str = "default",
-    ) -> str:
+    def is_fallback_response(self, response: str) -> bool:
+        """Return True if ``response`` is one of FALLBACK_RESPONSES rather than model output."""
+        if not response:
+            return False
+        if response in self.FALLBACK_RESPONSES.values():
+            return True
+        if '"fallback": true' not in response:
+            return False
+        try:
+            data = json.loads(response)
+        except json.JSONDecodeError:
+            return False
+        return isinstance(data, dict) and data.get("fallback") is True and "error_info" in data
+    
+    def _tier_model(self, tier: str) -> str:
+        if tier == "fast":
+            return settings.BEDROCK_FAST_MODEL_ID or self._model_id
+        if tier == "strong":
+            return settings.BEDROCK_STRONG_MODEL_ID or self._model_id
+        if tier == "default":
+            return self._model_id
+        return tier  # explicit model id
+    
+    def resolve_model(self, call_site: str | None, fallback_type: str = "default") -> str:
         """
-        Invoke Bedrock model with retry logic and fallback handling.
-        Uses the Converse API for model-agnostic compatibility.
+        Pick the model for a call from the routing table.
         
         Args:
-            system_prompt: System context/persona
-            user_prompt: User message
-            max_tokens: Maximum tokens to generate
-            temperature: Sampling temperature
-            fallback_type: Type of fallback response if all retries fail
+            call_site: Telemetry tag of the call, checked first
+            fallback_type: Used when the call site has no route
             
         Returns:
-            Model response text
-            
-        Raises:
-            HTTPException: If all retries are exhausted and no fallback available
+            Bedrock model id
         """
-        # Validate inputs before sending
-        is_valid, error_msg = self.validate_prompt_inputs(system_prompt, user_prompt, max_tokens)
+        overrides = settings.BEDROCK_MODEL_ROUTES
+        for key in (call_site, fallback_type):
+            if not key:
+                continue
+            route = overrides.get(key) or self.MODEL_ROUTES.get(key)
+            if route:
+                return self._tier_model(route)
+        return self._model_id
+    
+    def routing_table(self) -> dict:
+        """Return the effective model per routed call site for the stats endpoint."""
+        keys = sorted({*self.MODEL_ROUTES, *settings.BEDROCK_MODEL_ROUTES})
+        return {
+            "default_model": self._model_id,
+            "secondary_model": settings.BEDROCK_SECONDARY_MODEL_ID,
+            "routes": {key: self.resolve_model(key) for key in keys},
+        }
+    
+    def resolve_priority(
+        self,
+        call_site: str | None,
+        fallback_type: str = "default",
+        priority: str | None = None,
+    ) -> str:
+        """Scheduling class for a call: explicit ``priority``, else PRIORITIES, else STANDARD."""
+        if priority is not None:
+            if priority not in PRIORITY_CLASSES:
+                raise ValueError(f"Unknown priority class: {priority}")
+            return priority
+        for key in (call_site, fallback_type):
+            if key and key in self.PRIORITIES:
+                return self.PRIORITIES[key]
+        return STANDARD
+    
+    def supports_prompt_cache(self, model_id: str | None = None) -> bool:
+        """Return True if cachePoint blocks should be sent to ``model_id``."""
+        if not settings.BEDROCK_PROMPT_CACHE_ENABLED:
+            return False
+        model_id = model_id or self._model_id
+        return any(marker in model_id for marker in self.PROMPT_CACHE_MODELS)
+    
+    def _build_converse_request(
+        self,
+        system_prompt: str,
+        messages: list[dict],
+        max_tokens: int,
+        temperature: float,
+        model_id: str | None = None,
+    ) -> dict:
+        """
+        Build the keyword arguments for a Converse API call.
+        
+        On models with prompt caching the system prompt is followed by a
+        cache checkpoint, so the identical system prefix shared by every
+        call of a feature is read from cache instead of re-processed.
+        """
+        model_id = model_id or self._model_id
+        system = [{"text": system_prompt}]
+        if self.supports_prompt_cache(model_id):
+            system.append(dict(self.CACHE_POINT))
+        return {
+            "modelId": model_id,
+            "messages": messages,
+            "system": system,
+            "inferenceConfig": {
+                "maxTokens": max_tokens,
+                "temperature": temperature,
+            },
+        }
+    
+    @staticmethod
+    def _join_prompt(cacheable_prefix: str | None, user_prompt: str) -> str:
+        """The user prompt as the model sees it: static prefix, then dynamic part."""
+        if not cacheable_prefix:
+            return user_prompt
+        return f"{cacheable_prefix}\n\n{user_prompt}"
+    
+    def _prepare_single_turn(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        max_tokens: int,
+        temperature: float,
+        cacheable_prefix: str | None = None,
+        model_id: str | None = None,
+    ) -> dict:
+        """
+        Validate a single-turn prompt and build its Converse request.
+        
+        ``cacheable_prefix`` is static instruction text that goes before
+        ``user_prompt`` in the user turn; with prompt caching it is closed
+        by its own cache checkpoint so only the dynamic suffix is billed
+        as fresh input.
+        """
+        is_valid, error_msg = self.validate_prompt_inputs(
+            system_prompt, self._join_prompt(cacheable_prefix, user_prompt), max_tokens
+        )
         if not is_valid:
             logger.error(f"Invalid prompt inputs: {error_msg}")
             raise HTTPException(status_code=400, detail=error_msg)
         
-        last_error = None
-        error_type = None
+        if not cacheable_prefix:
+            content = [{"text": user_prompt}]
+        elif self.supports_prompt_cache(model_id):
+            content = [{"text": cacheable_prefix}, dict(self.CACHE_POINT), {"text": user_prompt}]
+        else:
+            content = [{"text": self._join_prompt(cacheable_prefix, user_prompt)}]
         
-        for attempt in range(self.MAX_RETRIES):
-            try:
-                logger.debug(f"Invoking Bedrock model (attempt {attempt + 1}/{self.MAX_RETRIES})")
-                
-                response = self._client.converse(
-                    modelId=self._model_id,
-                    messages=[
-                        {"role": "user", "content": [{"text": user_prompt}]}
-                    ],
-                    system=[{"text": system_prompt}],
-                    inferenceConfig={
-                        "maxTokens": max_tokens,
-                        "temperature": temperature,
-                    },
-                )
-                
-                content = response["output"]["message"]["content"][0]["text"]
-                
-                logger.info(f"Bedrock invocation successful on attempt {attempt + 1}")
-                return content
-                
-            except Exception as exc:
-                last_error = exc
-                is_retryable, should_fallback, error_type = self._classify_error(exc)
-                
-                logger.warning(
-                    f"Attempt {attempt + 1} failed with {error_type}: {exc}"
-                )
-                
-                if not is_retryable:
-                    logger.error(f"Non-retryable error ({error_type}): {exc}")
-                    break
-                
-                if attempt < self.MAX_RETRIES - 1:
-                    delay = self._calculate_delay(attempt)
-                    logger.info(f"Retrying in {delay:.2f}s...")
-                    time.sleep(delay)
+        return self._build_converse_request(
+            system_prompt,
+            [{"role": "user", "content": content}],
+            max_tokens,
+            temperature,
+            model_id,
+        )
+    
+    def _prepare_history(
+        self,
+        system_prompt: str,
+        messages: list[dict],
+        max_tokens: int,
+        temperature: float,
+        model_id: str | None = None,
+    ) -> dict:
+        """Validate a conversation history and build its Converse request."""
+        if not messages or not isinstance(messages, list):
+            raise HTTPException(status_code=400, detail="Messages must be a non-empty list")
+        
+        return self._build_converse_request(
+            system_prompt,
+            self._convert_messages_to_converse_format(messages),
+            max_tokens,
+            temperature,
+            model_id,
+        )
+    
+    def _retarget_request(self, request: dict, model_id: str) -> dict:
+        """Copy a Converse request for another model, dropping cache checkpoints it cannot take."""
+        retargeted = {**request, "modelId": model_id}
+        if self.supports_prompt_cache(model_id):
+            return retargeted
+        
+        def strip(blocks: list[dict]) -> list[dict]:
+            merged: list[dict] = []
+            for block in blocks:
+                if "cachePoint" in block:
+                    continue
+                if merged and "text" in block and "text" in merged[-1]:
+                    merged[-1] = {"text": f"{merged[-1]['text']}\n\n{block['text']}"}
                 else:
-                    logger.error(f"All {self.MAX_RETRIES} attempts exhausted")
+                    merged.append(block)
+            return merged
+        
+        retargeted["system"] = strip(request["system"])
+        retargeted["messages"] = [
+            {**message, "content": strip(message["content"])} for message in request["messages"]
+        ]
+        return retargeted
+    
+    def _secondary_request(self, request: dict, error_type: str, trace: CallTrace) -> dict | None:
+        """
+        Return ``request`` moved to the secondary model if the routed model
+        was throttled and the call has not already switched, else None.
+        """
+        secondary = settings.BEDROCK_SECONDARY_MODEL_ID
+        if trace.secondary or error_type not in self.THROTTLE_ERRORS:
+            return None
+        if not secondary or secondary == request["modelId"]:
+            return None
+        logger.warning(
+            f"{trace.call_site}: {request['modelId']} throttled; retrying on secondary model {secondary}"
+        )
+        trace.secondary = True
+        return self._retarget_request(request, secondary)
+    
+    @staticmethod
+    def _extract_text(response: dict) -> str:
+        """Pull the generated text out of a Converse API response."""
+        return response["output"]["message"]["content"][0]["text"]
+    
+    def _should_retry(self, exc: Exception, attempt: int) -> tuple[bool, str]:
+        """
+        Classify a failed attempt and decide whether another attempt is allowed.
+        
+        Returns:
+            Tuple of (retry, error_type)
+        """
+        is_retryable, _, error_type = self._classify_error(exc)
+        logger.warning(f"Attempt {attempt + 1} failed with {error_type}: {exc}")
+        
+        if error_type in ("queue_timeout", "deadline_exceeded"):
+            # Never reached Bedrock (or was cut off by us), so it says
+            # nothing about its health
+            return False, error_type
+        
+        if not is_retryable:
+            # Bedrock answered; the request itself was the problem
+            self._breaker.record_success()
+            logger.error(f"Non-retryable error ({error_type}): {exc}")
+            return False, error_type
         
-        # Return fallback response instead of raising
+        self._breaker.record_failure(error_type)
+        if self._breaker.state == CircuitBreaker.OPEN:
+            logger.error(f"Circuit breaker opened after {error_type}; not retrying")
+            return False, error_type
+        
+        if attempt >= self.MAX_RETRIES - 1:
+            logger.error(f"All {self.MAX_RETRIES} attempts exhausted")
+            return False, error_type
+        
+        return True, error_type
+    
+    def _circuit_open_error(self) -> BedrockServiceUnavailableError:
+        snapshot = self._breaker.snapshot()
+        logger.warning(
+            f"Bedrock circuit breaker is {snapshot['state']}; short-circuiting call "
+            f"(last error: {snapshot['last_error_type']})"
+        )
+        return BedrockServiceUnavailableError("Bedrock circuit breaker is open")
+    
+    def circuit_breaker_state(self) -> dict:
+        """Breaker state for the health endpoint."""
+        return self._breaker.snapshot()
+    
+    def _queue_timeout_error(self) -> BedrockRateLimitError:
+        snapshot = self._limiter.snapshot()
+        logger.warning(
+            f"No Bedrock concurrency slot within {snapshot['max_wait_seconds']}s "
+            f"(limit={snapshot['limit']}, queue_depth={snapshot['queue_depth']})"
+        )
+        return BedrockRateLimitError("Bedrock concurrency queue wait exceeded")
+    
+    def _limiter_outcome(self, exc: BaseException) -> str:
+        """How a failed call should move the concurrency limit."""
+        if not isinstance(exc, Exception):
+            return AdaptiveConcurrencyLimiter.DROPPED
+        _, _, error_type = self._classify_error(exc)
+        if error_type in self.THROTTLE_ERRORS:
+            return AdaptiveConcurrencyLimiter.THROTTLED
+        return AdaptiveConcurrencyLimiter.DROPPED
+    
+    def concurrency_stats(self) -> dict:
+        """Current concurrency limit, in-flight calls and per-class queue depth and wait."""
+        return self._limiter.snapshot()
+    
+    def _queue_timeout(self, priority: str, deadline: Deadline | None = None) -> float | None:
+        timeout = None  # limiter default
+        if priority == BACKGROUND:
+            timeout = settings.BEDROCK_BACKGROUND_QUEUE_MAX_WAIT_SECONDS
+        if deadline is not None:
+            timeout = deadline.cap(self._limiter.max_wait if timeout is None else timeout)
+        return timeout
+    
+    @staticmethod
+    def _deadline_error() -> BedrockDeadlineError:
+        return BedrockDeadlineError("Request deadline exceeded before Bedrock answered")
+    
+    def _retry_allowed(self, delay: float, attempt_seconds: float, deadline: Deadline | None) -> bool:
+        """
+        Decide whether a retry (or a switch to the secondary model) may be sent.
+        
+        The backoff ``delay`` plus one more attempt must fit in what is left
+        of the deadline; an attempt is assumed to take as long as the one
+        that just failed, and at least BEDROCK_MIN_ATTEMPT_SECONDS. The
+        retry also needs a token from the process-wide retry budget.
+        """
+        needed = delay + max(attempt_seconds, settings.BEDROCK_MIN_ATTEMPT_SECONDS)
+        if deadline is not None and not deadline.fits(needed):
+            with self._stats_lock:
+                self._deadline_stops += 1
+            logger.warning(
+                f"Not retrying: {deadline.remaining():.1f}s left before the deadline, "
+                f"a retry needs about {needed:.1f}s"
+            )
+            return False
+        if not self._retry_budget.try_spend():
+            logger.warning("Not retrying: Bedrock retry budget exhausted")
+            return False
+        return True
+    
+    def retry_stats(self) -> dict:
+        """Retry budget tokens and counters, and retries skipped for lack of time."""
+        with self._stats_lock:
+            deadline_stops = self._deadline_stops
+        return {**self._retry_budget.snapshot(), "deadline_stops": deadline_stops}
+    
+    def hedge_stats(self) -> dict:
+        """Hedge thresholds per call site and how many hedges were sent and won."""
+        return {"enabled": settings.BEDROCK_HEDGING_ENABLED, **self._hedge.snapshot()}
+    
+    def _converse_limited(self, request: dict, trace: CallTrace, deadline: Deadline | None = None) -> dict:
+        """Blocking Converse call holding a concurrency slot for its duration."""
+        if deadline is not None and deadline.expired():
+            raise self._deadline_error()
+        if not self._limiter.acquire(
+            self._queue_timeout(trace.priority, deadline), trace.priority, trace.user_id
+        ):
+            raise self._queue_timeout_error()
+        call_site = trace.call_site
+        started = time.monotonic()
+        try:
+            response = self._client.converse(**request)
+        except BaseException as exc:
+            self._limiter.release(self._limiter_outcome(exc), started=started)
+            raise
+        self._limiter.release(
+            AdaptiveConcurrencyLimiter.OK,
+            latency=time.monotonic() - started,
+            key=f"{call_site}:{request['modelId']}",
+            started=started,
+        )
+        return response
+    
+    def _fallback_or_raise(
+        self,
+        fallback_type: str,
+        last_error: Exception | None,
+        error_type: str | None,
+    ) -> str:
+        """Return the configured fallback response, or raise 503 if there is none."""
         error_info = {
             "error_type": error_type,
             "error_message": str(last_error),
-            "retries_exhausted": True
+            "retries_exhausted": error_type not in ("circuit_open", "queue_timeout", "deadline_exceeded"),
+            "circuit_open": error_type == "circuit_open",
+            "queue_timeout": error_type == "queue_timeout",
+            "deadline_exceeded": error_type == "deadline_exceeded",
         }
         
         if fallback_type in self.FALLBACK_RESPONSES:
@@ -261,12 +696,416 @@ class BedrockService:
             )
             return self._get_fallback_response(fallback_type, error_info)
         
-        # If no fallback defined, raise the error
         raise HTTPException(
             status_code=503,
             detail=f"Bedrock service unavailable after {self.MAX_RETRIES} attempts: {last_error}",
         ) from last_error
     
+    def _cache_lookup(self, request_key: str, call_site: str) -> str | None:
+        """Return a cached response if this call site has opted in to caching."""
+        if self._cache is None or call_site not in self.CACHE_TTLS:
+            return None
+        
+        cached = self._cache.get(request_key)
+        with self._stats_lock:
+            counters = self._cache_counters.setdefault(call_site, {"hits": 0, "misses": 0})
+            counters["hits" if cached is not None else "misses"] += 1
+        if cached is not None:
+            logger.debug(f"Response cache hit for {call_site}")
+        return cached
+    
+    def _cache_store(self, request_key: str | None, call_site: str, content: str) -> None:
+        """Store a successful model response. Fallback responses never reach here."""
+        if request_key is None or self._cache is None or call_site not in self.CACHE_TTLS:
+            return
+        self._cache.set(request_key, content, self.CACHE_TTLS[call_site])
+    
+    def cache_stats(self) -> dict:
+        """Return response cache counters, overall and per call site."""
+        if self._cache is None:
+            return {"enabled": False}
+        return {
+            "enabled": True,
+            **self._cache.stats(),
+            "by_call_site": {
+                name: dict(counters) for name, counters in self._cache_counters.items()
+            },
+        }
+    
+    def coalescing_stats(self) -> dict:
+        """Return counters for identical in-flight calls that were collapsed."""
+        return {
+            "sync": self._inflight.stats(),
+            "async": self._inflight_async.stats(),
+        }
+    
+    def _converse_with_retries(
+        self,
+        request: dict,
+        fallback_type: str,
+        request_key: str | None = None,
+        call_site: str | None = None,
+        priority: str = STANDARD,
+        user_id: str | None = None,
+        deadline: Deadline | None = None,
+    ) -> str:
+        """Blocking retry loop around a single Converse request."""
+        trace = CallTrace(call_site or fallback_type, priority=priority, user_id=user_id)
+        last_error = None
+        error_type = None
+        self._retry_budget.record_request()
+        
+        try:
+            for attempt in range(self.MAX_RETRIES):
+                if not self._breaker.allow_request():
+                    last_error = self._circuit_open_error()
+                    error_type = "circuit_open"
+                    break
+                trace.attempts = attempt + 1
+                trace.model_id = request["modelId"]
+                attempt_started = time.monotonic()
+                try:
+                    logger.debug(f"Invoking Bedrock model (attempt {attempt + 1}/{self.MAX_RETRIES})")
+                    response = self._converse_limited(request, trace, deadline)
+                    self._breaker.record_success()
+                    content = self._extract_text(response)
+                    trace.add_usage(response.get("usage"), response.get("metrics"))
+                    logger.info(f"Bedrock invocation successful on attempt {attempt + 1}")
+                    self._cache_store(request_key, trace.call_site, content)
+                    return content
+                except Exception as exc:
+                    last_error = exc
+                    attempt_seconds = time.monotonic() - attempt_started
+                    retry, error_type = self._should_retry(exc, attempt)
+                    secondary = None
+                    if attempt < self.MAX_RETRIES - 1:
+                        secondary = self._secondary_request(request, error_type, trace)
+                    if secondary is not None:
+                        # Throttling is per model: go straight to the secondary
+                        if not self._retry_allowed(0.0, attempt_seconds, deadline):
+                            break
+                        request = secondary
+                        continue
+                    if not retry:
+                        break
+                    delay = self._calculate_delay(attempt)
+                    if not self._retry_allowed(delay, attempt_seconds, deadline):
+                        break
+                    logger.info(f"Retrying in {delay:.2f}s...")
+                    time.sleep(delay)
+            
+            trace.error_type = error_type or "unknown"
+            trace.fallback = fallback_type in self.FALLBACK_RESPONSES
+            return self._fallback_or_raise(fallback_type, last_error, error_type)
+        finally:
+            self._telemetry.record(trace)
+    
+    def _submit_converse(self, request: dict, key: str) -> Future:
+        """
+        Send a Converse call on the Bedrock executor; the caller holds a
+        concurrency slot, which is released when the call finishes.
+        """
+        started = time.monotonic()
+        
+        def release(future) -> None:
+            if future.cancelled():
+                self._limiter.release(AdaptiveConcurrencyLimiter.DROPPED)
+            elif future.exception() is not None:
+                self._limiter.release(self._limiter_outcome(future.exception()), started=started)
+            else:
+                latency = time.monotonic() - started
+                self._hedge.observe(key, latency)
+                self._limiter.release(
+                    AdaptiveConcurrencyLimiter.OK,
+                    latency=latency,
+                    key=key,
+                    started=started,
+                )
+        
+        future = self._executor.submit(functools.partial(self._client.converse, **request))
+        future.add_done_callback(release)
+        return future
+    
+    async def _await_hedged(self, first: Future, request: dict, trace: CallTrace, key: str) -> dict:
+        """
+        Await ``first``, sending an identical backup request if it runs past
+        the call site's hedge threshold; the first answer wins.
+        
+        The backup needs a hedge token and a free concurrency slot (it never
+        queues). The losing call is cancelled if it has not started; one
+        already in flight finishes in the background and is discarded.
+        """
+        primary = asyncio.wrap_future(first)
+        delay = self._hedge.delay(key)
+        if delay is None:
+            return await primary
+        done, _ = await asyncio.wait({primary}, timeout=delay)
+        if done or not self._hedge.try_hedge():
+            return await primary
+        if not self._limiter.try_acquire(trace.priority):
+            self._hedge.refund()
+            return await primary
+        
+        logger.info(f"Hedging {key} after {delay * 1000:.0f}ms")
+        trace.hedged = True
+        backup = asyncio.wrap_future(self._submit_converse(request, key))
+        pending = {primary, backup}
+        error: BaseException | None = None
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for call in done:
+                    if call.exception() is None:
+                        if call is backup:
+                            self._hedge.record_win()
+                        return call.result()
+                    error = call.exception()
+            raise error
+        finally:
+            for call in pending:
+                call.cancel()
+    
+    async def _converse_async(
+        self,
+        request: dict,
+        trace: CallTrace,
+        deadline: Deadline | None = None,
+        hedge: bool = False,
+    ) -> dict:
+        """
+        Run a blocking Converse call on the Bedrock executor.
+        
+        Waits (without a thread) for a concurrency slot first. Cancelling
+        the awaiting task cancels the pending executor job; a call that is
+        already in flight finishes in the background and is discarded, and
+        keeps its slot until it does. Reaching ``deadline`` while waiting
+        abandons the call the same way. With ``hedge`` a slow call may be
+        raced against a backup request (see ``_await_hedged``).
+        """
+        if deadline is not None and deadline.expired():
+            raise self._deadline_error()
+        if not await self._limiter.acquire_async(
+            self._queue_timeout(trace.priority, deadline), trace.priority, trace.user_id
+        ):
+            raise self._queue_timeout_error()
+        key = f"{trace.call_site}:{request['modelId']}"
+        future = self._submit_converse(request, key)
+        if hedge and settings.BEDROCK_HEDGING_ENABLED:
+            waiter = self._await_hedged(future, request, trace, key)
+        else:
+            waiter = asyncio.wrap_future(future)
+        if deadline is None:
+            return await waiter
+        try:
+            return await asyncio.wait_for(waiter, deadline.remaining())
+        except asyncio.TimeoutError:
+            raise self._deadline_error() from None
+    
+    async def _converse_with_retries_async(
+        self,
+        request: dict,
+        fallback_type: str,
+        request_key: str | None = None,
+        call_site: str | None = None,
+        priority: str = STANDARD,
+        user_id: str | None = None,
+        deadline: Deadline | None = None,
+        hedge: bool = False,
+    ) -> str:
+        """Non-blocking retry loop around a single Converse request."""
+        trace = CallTrace(call_site or fallback_type, priority=priority, user_id=user_id)
+        last_error = None
+        error_type = None
+        self._retry_budget.record_request()
+        
+        try:
+            for attempt in range(self.MAX_RETRIES):
+                if not self._breaker.allow_request():
+                    last_error = self._circuit_open_error()
+                    error_type = "circuit_open"
+                    break
+                trace.attempts = attempt + 1
+                trace.model_id = request["modelId"]
+                attempt_started = time.monotonic()
+                try:
+                    logger.debug(f"Invoking Bedrock model async (attempt {attempt + 1}/{self.MAX_RETRIES})")
+                    response = await self._converse_async(request, trace, deadline, hedge)
+                    self._breaker.record_success()
+                    content = self._extract_text(response)
+                    trace.add_usage(response.get("usage"), response.get("metrics"))
+                    logger.info(f"Bedrock invocation successful on attempt {attempt + 1}")
+                    self._cache_store(request_key, trace.call_site, content)
+                    return content
+                except Exception as exc:
+                    last_error = exc
+                    attempt_seconds = time.monotonic() - attempt_started
+                    retry, error_type = self._should_retry(exc, attempt)
+                    secondary = None
+                    if attempt < self.MAX_RETRIES - 1:
+                        secondary = self._secondary_request(request, error_type, trace)
+                    if secondary is not None:
+                        # Throttling is per model: go straight to the secondary
+                        if not self._retry_allowed(0.0, attempt_seconds, deadline):
+                            break
+                        request = secondary
+                        continue
+                    if not retry:
+                        break
+                    delay = self._calculate_delay(attempt)
+                    if not self._retry_allowed(delay, attempt_seconds, deadline):
+                        break
+                    logger.info(f"Retrying in {delay:.2f}s...")
+                    await asyncio.sleep(delay)
+            
+            trace.error_type = error_type or "unknown"
+            trace.fallback = fallback_type in self.FALLBACK_RESPONSES
+            return self._fallback_or_raise(fallback_type, last_error, error_type)
+        except asyncio.CancelledError:
+            trace.error_type = "cancelled"
+            raise
+        finally:
+            self._telemetry.record(trace)
+    
+    def invoke_model(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        max_tokens: int = 4096,
+        temperature: float = 0.7,
+        fallback_type: str = "default",
+        call_site: str | None = None,
+        cacheable_prefix: str | None = None,
+        priority: str | None = None,
+        user_id: str | None = None,
+        deadline: Deadline | None = None,
+    ) -> str:
+        """
+        Invoke Bedrock model with retry logic and fallback handling.
+        Uses the Converse API for model-agnostic compatibility.
+        
+        Blocks the calling thread; request handlers should use
+        ``invoke_model_async`` instead.
+        
+        Args:
+            system_prompt: System context/persona
+            user_prompt: User message
+            max_tokens: Maximum tokens to generate
+            temperature: Sampling temperature
+            fallback_type: Type of fallback response if all retries fail
+            call_site: Telemetry tag and routing key; defaults to fallback_type
+            cacheable_prefix: Static text sent before user_prompt and marked
+                for prompt caching
+            priority: Scheduling class; defaults to the call site's entry in PRIORITIES
+            user_id: Requesting user, for fair queueing between users
+            deadline: End-to-end deadline of the request; queue waits and
+                retries only happen if they fit in the time left
+            
+        Returns:
+            Model response text
+            
+        Raises:
+            HTTPException: If all retries are exhausted and no fallback available
+        """
+        model_id = self.resolve_model(call_site, fallback_type)
+        request = self._prepare_single_turn(
+            system_prompt, user_prompt, max_tokens, temperature, cacheable_prefix, model_id
+        )
+        request_key = make_cache_key(
+            model_id,
+            system_prompt,
+            self._join_prompt(cacheable_prefix, user_prompt),
+            temperature,
+            max_tokens,
+        )
+        cached = self._cache_lookup(request_key, call_site or fallback_type)
+        if cached is not None:
+            self._telemetry.record_cache_hit(call_site or fallback_type)
+            return cached
+        return self._inflight.do(
+            f"{fallback_type}:{request_key}",
+            lambda: self._converse_with_retries(
+                request,
+                fallback_type,
+                request_key,
+                call_site,
+                self.resolve_priority(call_site, fallback_type, priority),
+                user_id,
+                deadline,
+            ),
+        )
+    
+    async def invoke_model_async(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        max_tokens: int = 4096,
+        temperature: float = 0.7,
+        fallback_type: str = "default",
+        call_site: str | None = None,
+        cacheable_prefix: str | None = None,
+        priority: str | None = None,
+        user_id: str | None = None,
+        deadline: Deadline | None = None,
+        hedge: bool = False,
+    ) -> str:
+        """
+        Awaitable version of ``invoke_model``.
+        
+        The Converse call runs on the Bedrock executor and retry backoff uses
+        ``asyncio.sleep``, so neither the event loop nor a request worker
+        thread is held while waiting on the model.
+        
+        Args:
+            system_prompt: System context/persona
+            user_prompt: User message
+            max_tokens: Maximum tokens to generate
+            temperature: Sampling temperature
+            fallback_type: Type of fallback response if all retries fail
+            call_site: Telemetry tag and routing key; defaults to fallback_type
+            cacheable_prefix: Static text sent before user_prompt and marked
+                for prompt caching
+            priority: Scheduling class; defaults to the call site's entry in PRIORITIES
+            user_id: Requesting user, for fair queueing between users
+            deadline: End-to-end deadline of the request; queue waits and
+                retries only happen if they fit in the time left
+            hedge: Race a backup request against an attempt that runs past
+                the call site's usual latency (latency-critical calls only)
+            
+        Returns:
+            Model response text
+            
+        Raises:
+            HTTPException: If all retries are exhausted and no fallback available
+        """
+        model_id = self.resolve_model(call_site, fallback_type)
+        request = self._prepare_single_turn(
+            system_prompt, user_prompt, max_tokens, temperature, cacheable_prefix, model_id
+        )
+        request_key = make_cache_key(
+            model_id,
+            system_prompt,
+            self._join_prompt(cacheable_prefix, user_prompt),
+            temperature,
+            max_tokens,
+        )
+        cached = self._cache_lookup(request_key, call_site or fallback_type)
+        if cached is not None:
+            self._telemetry.record_cache_hit(call_site or fallback_type)
+            return cached
+        return await self._inflight_async.do(
+            f"{fallback_type}:{request_key}",
+            lambda: self._converse_with_retries_async(
+                request,
+                fallback_type,
+                request_key,
+                call_site,
+                self.resolve_priority(call_site, fallback_type, priority),
+                user_id,
+                deadline,
+                hedge,
+            ),
+        )
+    
     def _convert_messages_to_converse_format(self, messages: list[dict]) -> list[dict]:
         """
         Convert messages from simple format to Converse API format.
@@ -293,6 +1132,10 @@ class BedrockService:
         max_tokens: int = 4096,
         temperature: float = 0.7,
         fallback_type: str = "default",
+        call_site: str | None = None,
+        priority: str | None = None,
+        user_id: str | None = None,
+        deadline: Deadline | None = None,
     ) -> str:
         """
         Invoke Bedrock model with conversation history and retry logic.
@@ -304,68 +1147,253 @@ class BedrockService:
             max_tokens: Maximum tokens to generate
             temperature: Sampling temperature
             fallback_type: Type of fallback response if all retries fail
+            call_site: Telemetry tag and routing key; defaults to fallback_type
+            priority: Scheduling class; defaults to the call site's entry in PRIORITIES
+            user_id: Requesting user, for fair queueing between users
+            deadline: End-to-end deadline of the request; queue waits and
+                retries only happen if they fit in the time left
             
         Returns:
             Model response text
         """
-        # Validate inputs
-        if not messages or not isinstance(messages, list):
-            raise HTTPException(status_code=400, detail="Messages must be a non-empty list")
+        request = self._prepare_history(
+            system_prompt, messages, max_tokens, temperature, self.resolve_model(call_site, fallback_type)
+        )
+        return self._converse_with_retries(
+            request,
+            fallback_type,
+            call_site=call_site,
+            priority=self.resolve_priority(call_site, fallback_type, priority),
+            user_id=user_id,
+            deadline=deadline,
+        )
+    
+    async def invoke_model_with_history_async(
+        self,
+        system_prompt: str,
+        messages: list[dict],
+        max_tokens: int = 4096,
+        temperature: float = 0.7,
+        fallback_type: str = "default",
+        call_site: str | None = None,
+        priority: str | None = None,
+        user_id: str | None = None,
+        deadline: Deadline | None = None,
+        hedge: bool = False,
+    ) -> str:
+        """
+        Awaitable version of ``invoke_model_with_history``.
         
-        # Convert messages to Converse API format
-        converse_messages = self._convert_messages_to_converse_format(messages)
+        Args:
+            system_prompt: System context/persona
+            messages: List of message dicts with 'role' and 'content'
+            max_tokens: Maximum tokens to generate
+            temperature: Sampling temperature
+            fallback_type: Type of fallback response if all retries fail
+            call_site: Telemetry tag and routing key; defaults to fallback_type
+            priority: Scheduling class; defaults to the call site's entry in PRIORITIES
+            user_id: Requesting user, for fair queueing between users
+            deadline: End-to-end deadline of the request; queue waits and
+                retries only happen if they fit in the time left
+            hedge: Race a backup request against an attempt that runs past
+                the call site's usual latency (latency-critical calls only)
+            
+        Returns:
+            Model response text
+        """
+        request = self._prepare_history(
+            system_prompt, messages, max_tokens, temperature, self.resolve_model(call_site, fallback_type)
+        )
+        return await self._converse_with_retries_async(
+            request,
+            fallback_type,
+            call_site=call_site,
+            priority=self.resolve_priority(call_site, fallback_type, priority),
+            user_id=user_id,
+            deadline=deadline,
+            hedge=hedge,
+        )
+    
+    async def _open_stream_async(
+        self,
+        request: dict,
+        trace: CallTrace,
+        deadline: Deadline | None = None,
+    ) -> dict:
+        """
+        Start a ConverseStream call on the Bedrock executor.
         
-        last_error = None
-        error_type = None
+        Opening the stream gets the same retry, circuit breaker and
+        concurrency handling as a Converse call; once text is flowing nothing
+        is retried. On success the concurrency slot stays taken until the
+        caller releases it at the end of the stream. If the awaiting task is
+        cancelled while the call is in flight, the call keeps its slot until
+        it finishes, and the stream it opened is closed unread.
+        """
+        last_error: Exception | None = None
+        self._retry_budget.record_request()
         
         for attempt in range(self.MAX_RETRIES):
+            if not self._breaker.allow_request():
+                trace.error_type = "circuit_open"
+                raise self._circuit_open_error()
+            trace.attempts = attempt + 1
+            trace.model_id = request["modelId"]
+            if deadline is not None and deadline.expired():
+                trace.error_type = "deadline_exceeded"
+                raise self._deadline_error()
+            if not await self._limiter.acquire_async(
+                self._queue_timeout(trace.priority, deadline), trace.priority, trace.user_id
+            ):
+                trace.error_type = "queue_timeout"
+                raise self._queue_timeout_error()
+            started = time.monotonic()
+            future = self._executor.submit(functools.partial(self._client.converse_stream, **request))
             try:
-                logger.debug(f"Invoking Bedrock with history (attempt {attempt + 1}/{self.MAX_RETRIES})")
-                
-                response = self._client.converse(
-                    modelId=self._model_id,
-                    messages=converse_messages,
-                    system=[{"text": system_prompt}],
-                    inferenceConfig={
-                        "maxTokens": max_tokens,
-                        "temperature": temperature,
-                    },
-                )
-                
-                content = response["output"]["message"]["content"][0]["text"]
-                
-                logger.info(f"Bedrock invocation with history successful on attempt {attempt + 1}")
-                return content
-                
+                response = await asyncio.wrap_future(future)
+                self._breaker.record_success()
+                return response
+            except asyncio.CancelledError:
+                future.cancel()  # only stops a call that has not started
+                future.add_done_callback(self._release_abandoned_stream)
+                raise
             except Exception as exc:
+                self._limiter.release(self._limiter_outcome(exc), started=started)
                 last_error = exc
-                is_retryable, _, error_type = self._classify_error(exc)
-                
-                if not is_retryable or attempt >= self.MAX_RETRIES - 1:
+                attempt_seconds = time.monotonic() - started
+                retry, trace.error_type = self._should_retry(exc, attempt)
+                secondary = None
+                if attempt < self.MAX_RETRIES - 1:
+                    secondary = self._secondary_request(request, trace.error_type, trace)
+                if secondary is not None:
+                    if not self._retry_allowed(0.0, attempt_seconds, deadline):
+                        break
+                    request = secondary
+                    continue
+                if not retry:
                     break
-                
                 delay = self._calculate_delay(attempt)
-                logger.warning(f"Attempt {attempt + 1} failed: {exc}. Retrying in {delay:.2f}s...")
-                time.sleep(delay)
+                if not self._retry_allowed(delay, attempt_seconds, deadline):
+                    break
+                logger.info(f"Retrying stream in {delay:.2f}s...")
+                await asyncio.sleep(delay)
         
-        # Return fallback response
-        error_info = {
-            "error_type": error_type,
-            "error_message": str(last_error),
-            "retries_exhausted": True
-        }
+        raise last_error
+    
+    def _release_abandoned_stream(self, future: Future) -> None:
+        """Done-callback of a ConverseStream call nobody awaits any more: close its stream, free its slot."""
+        if future.cancelled():
+            self._limiter.release(AdaptiveConcurrencyLimiter.DROPPED)
+            return
+        if future.exception() is not None:
+            self._limiter.release(self._limiter_outcome(future.exception()))
+            return
+        stream = future.result().get("stream")
+        close = getattr(stream, "close", None)
+        if close is not None:
+            try:
+                close()
+            except Exception as exc:
+                logger.warning(f"Closing an abandoned Bedrock stream failed: {exc}")
+        self._limiter.release(AdaptiveConcurrencyLimiter.DROPPED)
+    
+    async def stream_model_async(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        max_tokens: int = 4096,
+        temperature: float = 0.7,
+        call_site: str = "stream",
+        cacheable_prefix: str | None = None,
+        priority: str | None = None,
+        user_id: str | None = None,
+        deadline: Deadline | None = None,
+    ) -> AsyncGenerator[str, None]:
+        """
+        Stream generated text without blocking the event loop.
         
-        if fallback_type in self.FALLBACK_RESPONSES:
-            logger.warning(
-                f"Returning fallback response for {fallback_type}. "
-                f"Last error ({error_type}): {last_error}"
-            )
-            return self._get_fallback_response(fallback_type, error_info)
+        Each read from the botocore event stream runs on the Bedrock
+        executor. Unlike ``invoke_model_async`` there is no fallback: errors
+        are raised so the caller can decide what to keep of a partial
+        response.
         
-        raise HTTPException(
-            status_code=503,
-            detail=f"Bedrock invocation failed after {self.MAX_RETRIES} attempts: {last_error}",
-        ) from last_error
+        Args:
+            system_prompt: System context/persona
+            user_prompt: User message
+            max_tokens: Maximum tokens to generate
+            temperature: Sampling temperature
+            call_site: Telemetry tag and routing key
+            cacheable_prefix: Static text sent before user_prompt and marked
+                for prompt caching
+            priority: Scheduling class; defaults to the call site's entry in PRIORITIES
+            user_id: Requesting user, for fair queueing between users
+            deadline: End-to-end deadline of the request; queue waits and
+                retries only happen if they fit in the time left
+            
+        Yields:
+            Text chunks as they are generated
+        """
+        request = self._prepare_single_turn(
+            system_prompt,
+            user_prompt,
+            max_tokens,
+            temperature,
+            cacheable_prefix,
+            self.resolve_model(call_site),
+        )
+        trace = CallTrace(
+            call_site,
+            streamed=True,
+            priority=self.resolve_priority(call_site, priority=priority),
+            user_id=user_id,
+        )
+        stream = None
+        holds_slot = False
+        
+        try:
+            response = await self._open_stream_async(request, trace, deadline)
+            trace.error_type = None
+            holds_slot = True
+            stream = response["stream"]
+            events = iter(stream)
+            loop = asyncio.get_running_loop()
+            
+            while True:
+                event = await loop.run_in_executor(self._executor, next, events, None)
+                if event is None:
+                    break
+                if "contentBlockDelta" in event:
+                    text = event["contentBlockDelta"].get("delta", {}).get("text")
+                    if text:
+                        trace.mark_first_token()
+                        yield text
+                elif "metadata" in event:
+                    trace.add_usage(event["metadata"].get("usage"), event["metadata"].get("metrics"))
+        except Exception as exc:
+            if stream is not None:
+                is_retryable, _, trace.error_type = self._classify_error(exc)
+                if is_retryable:
+                    self._breaker.record_failure(trace.error_type)
+                logger.error(f"Bedrock stream failed mid-response ({trace.error_type}): {exc}")
+            trace.error_type = trace.error_type or "unknown"
+            raise
+        except (asyncio.CancelledError, GeneratorExit):
+            trace.error_type = "cancelled"
+            raise
+        finally:
+            if stream is not None:
+                close = getattr(stream, "close", None)
+                if close is not None:
+                    close()
+            if holds_slot:
+                if trace.error_type in self.THROTTLE_ERRORS:
+                    outcome = AdaptiveConcurrencyLimiter.THROTTLED
+                elif trace.error_type:
+                    outcome = AdaptiveConcurrencyLimiter.DROPPED
+                else:
+                    outcome = AdaptiveConcurrencyLimiter.OK
+                self._limiter.release(outcome)
+            self._telemetry.record(trace)
     
     async def generate_streaming_response(
         self,
@@ -385,33 +1413,17 @@ class BedrockService:
             temperature: Sampling temperature
             
         Yields:
-            Chunks of the response as they're generated
+            Chunks of the response as they're generated, followed by an
+            error notice if generation fails
         """
         try:
-            response = self._client.converse_stream(
-                modelId=self._model_id,
-                messages=[
-                    {"role": "user", "content": [{"text": user_prompt}]}
-                ],
-                system=[{"text": system_prompt}],
-                inferenceConfig={
-                    "maxTokens": max_tokens,
-                    "temperature": temperature,
-                },
-            )
-            
-            # Process the streaming response (Converse Stream API format)
-            for event in response["stream"]:
-                if "contentBlockDelta" in event:
-                    delta = event["contentBlockDelta"].get("delta", {})
-                    if "text" in delta:
-                        yield delta["text"]
-                elif "messageStop" in event:
-                    break
-                    
+            async for chunk in self.stream_model_async(system_prompt, user_prompt, max_tokens, temperature):
+                yield chunk
+        except HTTPException:
+            raise
         except Exception as exc:
             logger.error(f"Streaming response failed: {exc}")
-            error_type, _, _ = self._classify_error(exc)
+            _, _, error_type = self._classify_error(exc)
             yield f"\n\n[Error: Service temporarily unavailable ({error_type}). Please try again.]"
     
     def invoke_model_simple(
@@ -440,7 +1452,8 @@ class BedrockService:
     
     def parse_json_response(self, response: str) -> dict:
         """
-        Parse JSON from model response, handling markdown code blocks.
+        Parse JSON from model response, handling markdown code blocks
+        and prose around the JSON document.
         
         Args:
             response: Raw model response
@@ -451,91 +1464,16 @@ class BedrockService:
         Raises:
             json.JSONDecodeError: If response cannot be parsed
         """
-        if not response or not isinstance(response, str):
-            raise json.JSONDecodeError("Empty or invalid response", "", 0)
-        
-        # Try to find JSON in markdown code blocks
-        match = re.search(
-            r"```(?:json)?\s*(\{.*?\}|\[.*?\])\s*```", response, re.DOTALL
-        )
-        if match:
-            try:
-                return json.loads(match.group(1))
-            except json.JSONDecodeError:
-                pass
-        
-        # Try to find JSON without markdown
-        match = re.search(r"(\{.*\}|\[.*\])", response, re.DOTALL)
-        if match:
-            try:
-                return json.loads(match.group(1))
-            except json.JSONDecodeError:
-                pass
-        
-        # Try parsing the entire response
-        return json.loads(response)
+        return extract_json(response)
     
     @staticmethod
     def _repair_truncated_json(text: str) -> str | None:
         """
         Repair a JSON string that was truncated mid-generation by Nova.
-        Records every position after a complete value was closed (}/ ]) and
-        tries to reconstruct valid JSON from the most recent such position.
+        Keeps everything up to the last fully closed object/array and closes
+        the brackets still open at that point.
         """
-        text = text.strip()
-        if not text:
-            return None
-
-        # Find where JSON starts
-        start = next((i for i, c in enumerate(text) if c in ('{', '[')), None)
-        if start is None:
-            return None
-        text = text[start:]
-
-        # Walk forward tracking state.
-        # At every position AFTER a closing `}` or `]` (while NOT in a string),
-        # record: (char_index_exclusive, open_bracket_stack_snapshot)
-        # These are "cut points" — places we can legally truncate.
-        in_string = False
-        escape_next = False
-        stack: list[str] = []   # open bracket stack
-
-        # cut_points: list of (end_index, stack_snapshot)
-        # stack_snapshot is what `stack` looks like AFTER processing index i
-        cut_points: list[tuple[int, list[str]]] = []
-
-        for i, ch in enumerate(text):
-            if escape_next:
-                escape_next = False
-                continue
-            if ch == '\\' and in_string:
-                escape_next = True
-                continue
-            if ch == '"':
-                in_string = not in_string
-                continue
-            if in_string:
-                continue
-
-            if ch in ('{', '['):
-                stack.append(ch)
-            elif ch in ('}', ']'):
-                if stack:
-                    stack.pop()
-                # Record a valid cut point after this closing bracket
-                cut_points.append((i + 1, list(stack)))
-
-        # Try cut points from most recent to oldest
-        for end_idx, remaining_stack in reversed(cut_points):
-            closing = ''.join('}' if c == '{' else ']' for c in reversed(remaining_stack))
-            candidate = text[:end_idx] + closing
-            try:
-                json.loads(candidate)
-                return candidate
-            except json.JSONDecodeError:
-                continue
-
-        return None
+        return repair_truncated_json(text)
 
     def parse_json_response_safe(
         self,
@@ -554,20 +1492,12 @@ class BedrockService:
             Parsed JSON or fallback
         """
         try:
-            return self.parse_json_response(response)
+            parsed, repaired = parse_json_or_repair(response)
+            if repaired:
+                logger.info("Successfully recovered truncated JSON response")
+            return parsed
         except json.JSONDecodeError as exc:
             logger.warning(f"Failed to parse JSON response: {exc}")
-
-            # Attempt to repair truncated JSON before falling back
-            repaired = self._repair_truncated_json(response)
-            if repaired:
-                try:
-                    parsed = json.loads(repaired)
-                    logger.info("Successfully recovered truncated JSON response")
-                    return parsed
-                except json.JSONDecodeError:
-                    pass
-
             logger.error("JSON repair failed — using fallback")
             return fallback or {
                 "error": "Failed to parse response",
@@ -629,7 +1559,9 @@ class BedrockService:
                 "status": "healthy",
                 "model_id": self._model_id,
                 "region": settings.AWS_REGION,
-                "response_received": True
+                "response_received": True,
+                "circuit_breaker": self._breaker.snapshot(),
+                "prompt_cache": self.supports_prompt_cache(),
             }
         except Exception as exc:
             logger.error(f"Bedrock health check failed: {exc}")
@@ -638,7 +1570,9 @@ class BedrockService:
                 "model_id": self._model_id,
                 "region": settings.AWS_REGION,
                 "error": str(exc),
-                "error_type": "connection_error"
+                "error_type": "connection_error",
+                "circuit_breaker": self._breaker.snapshot(),
+                "prompt_cache": self.supports_prompt_cache(),
             }
 
 
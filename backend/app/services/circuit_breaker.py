@@ -0,0 +1,123 @@
+"""
+Circuit breaker for upstream AI services.
+Stops sending traffic to a failing dependency so callers get a fallback
+immediately instead of spending their retries on it.
+"""
+
+import logging
+import threading
+import time
+from datetime import datetime, timezone
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitBreaker:
+    """
+    Thread-safe closed / open / half-open circuit breaker.
+
+    - closed: calls flow; consecutive upstream failures are counted.
+    - open: calls are rejected until ``recovery_timeout`` has passed.
+    - half_open: one probe call is let through per ``recovery_timeout``;
+      a success closes the circuit, a failure opens it again.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+    ) -> None:
+        self.name = name
+        self.failure_threshold = max(1, failure_threshold)
+        self.recovery_timeout = recovery_timeout
+        self._lock = threading.Lock()
+        self._state = self.CLOSED
+        self._consecutive_failures = 0
+        self._opened_at: float | None = None
+        self._next_probe_at = 0.0
+        self._last_error_type: str | None = None
+        self._last_state_change = time.time()
+        self._short_circuited = 0
+        self._times_opened = 0
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._state
+
+    def _transition(self, state: str) -> None:
+        if state == self._state:
+            return
+        logger.warning(f"Circuit breaker '{self.name}' {self._state} -> {state}")
+        self._state = state
+        self._last_state_change = time.time()
+
+    def allow_request(self) -> bool:
+        """Return True if a call may be sent upstream now."""
+        now = time.monotonic()
+        with self._lock:
+            if self._state == self.CLOSED:
+                return True
+
+            if self._state == self.OPEN and now - self._opened_at >= self.recovery_timeout:
+                self._transition(self.HALF_OPEN)
+
+            if self._state == self.HALF_OPEN and now >= self._next_probe_at:
+                # Admit one probe; if it never reports back (e.g. cancelled),
+                # another is admitted after the next recovery interval.
+                self._next_probe_at = now + self.recovery_timeout
+                return True
+
+            self._short_circuited += 1
+            return False
+
+    def record_success(self) -> None:
+        """Record a call that reached the service and got an answer."""
+        with self._lock:
+            self._consecutive_failures = 0
+            if self._state != self.CLOSED:
+                self._transition(self.CLOSED)
+                self._opened_at = None
+
+    def record_failure(self, error_type: str) -> None:
+        """Record an upstream failure (throttling, unavailability, timeouts)."""
+        now = time.monotonic()
+        with self._lock:
+            self._consecutive_failures += 1
+            self._last_error_type = error_type
+
+            should_open = (
+                self._state == self.HALF_OPEN
+                or (self._state == self.CLOSED and self._consecutive_failures >= self.failure_threshold)
+            )
+            if should_open:
+                self._transition(self.OPEN)
+                self._opened_at = now
+                self._times_opened += 1
+
+    def snapshot(self) -> dict:
+        """Return the breaker state for health and stats endpoints."""
+        now = time.monotonic()
+        with self._lock:
+            retry_in = None
+            if self._state == self.OPEN and self._opened_at is not None:
+                retry_in = max(0.0, round(self.recovery_timeout - (now - self._opened_at), 2))
+            return {
+                "name": self.name,
+                "state": self._state,
+                "consecutive_failures": self._consecutive_failures,
+                "failure_threshold": self.failure_threshold,
+                "recovery_timeout_seconds": self.recovery_timeout,
+                "probe_in_seconds": retry_in,
+                "last_error_type": self._last_error_type,
+                "last_state_change": datetime.fromtimestamp(
+                    self._last_state_change, tz=timezone.utc
+                ).isoformat(),
+                "times_opened": self._times_opened,
+                "short_circuited_calls": self._short_circuited,
+            }
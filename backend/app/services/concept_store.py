@@ -0,0 +1,134 @@
+"""
+Shared store for concept explanations.
+Serves repeat explanation requests from memory or the database so only
+concepts nobody has asked about yet reach Bedrock.
+"""
+
+import json
+import logging
+from typing import Callable
+
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.database import SessionLocal
+from app.models import ConceptExplanation
+from app.services.concepts import normalize_concept
+from app.services.llm_cache import InMemoryLRUCache
+
+logger = logging.getLogger(__name__)
+
+
+class ConceptExplanationStore:
+    """
+    Two-tier explanation store keyed on (concept id, level, language, format).
+
+    The memory tier is a per-process LRU; the database tier is shared by all
+    workers. ``format`` separates the short /api/content/explain payload
+    ("summary") from the structured ContentService payload ("detailed").
+    """
+
+    MEMORY_TTL = 6 * 3600  # seconds; stored explanations do not go stale quickly
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session] = SessionLocal,
+        memory_entries: int = 2048,
+    ) -> None:
+        self._session_factory = session_factory
+        self._memory = InMemoryLRUCache(max_entries=memory_entries)
+
+    @staticmethod
+    def _memory_key(concept_id: str, difficulty_level: str, language: str, fmt: str) -> str:
+        return f"{fmt}:{language}:{difficulty_level}:{concept_id}"
+
+    def get(self, concept: str, difficulty_level: str, language: str, fmt: str) -> dict | None:
+        """
+        Return a stored explanation payload, or None if nobody has asked yet.
+
+        Blocking; async callers should use ``get_async``.
+        """
+        concept_id = normalize_concept(concept)
+        key = self._memory_key(concept_id, difficulty_level, language, fmt)
+
+        cached = self._memory.get(key)
+        if cached is not None:
+            return json.loads(cached)
+        return self._load(concept_id, difficulty_level, language, fmt)
+
+    def _load(self, concept_id: str, difficulty_level: str, language: str, fmt: str) -> dict | None:
+        """Read an explanation from the database and warm the memory tier."""
+        db = self._session_factory()
+        try:
+            row = (
+                db.query(ConceptExplanation)
+                .filter(
+                    ConceptExplanation.concept_id == concept_id,
+                    ConceptExplanation.difficulty_level == difficulty_level,
+                    ConceptExplanation.language == language,
+                    ConceptExplanation.format == fmt,
+                )
+                .first()
+            )
+            if row is None:
+                return None
+            payload = row.payload
+        finally:
+            db.close()
+
+        key = self._memory_key(concept_id, difficulty_level, language, fmt)
+        self._memory.set(key, json.dumps(payload), self.MEMORY_TTL)
+        return payload
+
+    def put(self, concept: str, difficulty_level: str, language: str, fmt: str, payload: dict) -> None:
+        """
+        Persist an explanation generated by the model.
+
+        Concurrent writers for the same key are harmless: the first insert
+        wins and later ones are dropped. If the database write fails the
+        explanation is simply regenerated next time.
+        """
+        concept_id = normalize_concept(concept)
+        key = self._memory_key(concept_id, difficulty_level, language, fmt)
+
+        db = self._session_factory()
+        try:
+            db.add(
+                ConceptExplanation(
+                    concept_id=concept_id,
+                    concept=concept.strip(),
+                    difficulty_level=difficulty_level,
+                    language=language,
+                    format=fmt,
+                    payload=payload,
+                )
+            )
+            db.commit()
+            self._memory.set(key, json.dumps(payload), self.MEMORY_TTL)
+            logger.info(f"Stored {fmt} explanation for concept '{concept_id}' ({difficulty_level}, {language})")
+        except IntegrityError:
+            db.rollback()
+        except Exception as exc:
+            db.rollback()
+            logger.warning(f"Failed to store explanation for '{concept_id}': {exc}")
+        finally:
+            db.close()
+
+    async def get_async(self, concept: str, difficulty_level: str, language: str, fmt: str) -> dict | None:
+        """Memory hits return without leaving the event loop; misses check the database."""
+        concept_id = normalize_concept(concept)
+        cached = self._memory.get(self._memory_key(concept_id, difficulty_level, language, fmt))
+        if cached is not None:
+            return json.loads(cached)
+        return await run_in_threadpool(self._load, concept_id, difficulty_level, language, fmt)
+
+    async def put_async(self, concept: str, difficulty_level: str, language: str, fmt: str, payload: dict) -> None:
+        await run_in_threadpool(self.put, concept, difficulty_level, language, fmt, payload)
+
+    def stats(self) -> dict:
+        return {"memory": self._memory.stats()}
+
+
+# Global instance
+concept_store = ConceptExplanationStore()
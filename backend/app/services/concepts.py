@@ -0,0 +1,121 @@
+"""
+Concept vocabulary shared by roadmap generation and concept explanations.
+Maps the many ways students name a topic onto one canonical concept id.
+"""
+
+import re
+
+TOPIC_KEYWORDS = {
+    "Arrays": ["array", "hash", "prefix sum", "two pointer", "sliding window"],
+    "Strings": ["string", "substring", "anagram", "palindrome"],
+    "Linked List": ["linked list"],
+    "Stacks & Queues": ["stack", "queue", "monotonic"],
+    "Binary Trees": ["tree", "binary tree", "traversal"],
+    "BST": ["bst", "binary search tree"],
+    "Graphs": ["graph", "bfs", "dfs", "topological", "union find"],
+    "Dynamic Programming": ["dynamic programming", "dp", "memoization"],
+    "Greedy": ["greedy", "interval"],
+    "Backtracking": ["backtracking", "permutation", "combination"],
+    "Binary Search": ["binary search", "search"],
+    "Heap": ["heap", "priority queue"],
+    "SQL": ["sql", "database query"],
+    "DBMS": ["dbms", "normalization", "acid", "join"],
+    "Operating Systems": ["operating system", "os", "process", "thread"],
+    "Computer Networks": ["network", "cn", "tcp", "http"],
+    "OOP": ["oop", "object oriented", "polymorphism", "encapsulation"],
+    "Aptitude": ["aptitude", "reasoning", "quantitative"],
+    "Projects": ["project", "portfolio"],
+}
+
+# Phrases that name the same concept. The key is the canonical phrase.
+# TOPIC_KEYWORDS only lists search keywords, so abbreviations and spelled-out
+# forms that should share one explanation are declared here.
+CONCEPT_SYNONYMS = {
+    "bfs": ["breadth first search", "breadth first traversal"],
+    "dfs": ["depth first search", "depth first traversal"],
+    "dynamic programming": ["dp"],
+    "binary search tree": ["bst"],
+    "heap": ["priority queue", "min heap", "max heap"],
+    "oop": ["oops", "object oriented", "object oriented programming"],
+    "dbms": ["database management system"],
+    "operating system": ["os", "operating systems"],
+    "computer network": ["cn", "computer networks", "networking"],
+    "linked list": ["linkedlist"],
+    "stacks and queues": ["stack and queue"],
+    "union find": ["disjoint set", "disjoint set union", "dsu"],
+    "two pointer": ["two pointer technique"],
+    "topological sort": ["topological", "topological sorting", "toposort"],
+    "hash map": ["hash", "hashmap", "hash table", "hashing"],
+    "acid": ["acid properties"],
+    "normalization": ["normal form", "database normalization"],
+    "sql": ["structured query language"],
+}
+
+# Words that do not change which concept is being asked about.
+_FILLER_WORDS = {
+    "a", "an", "the", "what", "is", "are", "explain", "concept", "concepts",
+    "algorithm", "algorithms", "algo", "technique",
+}
+
+
+def _clean(phrase: str) -> str:
+    """Lowercase, spell out '&', and collapse punctuation to single spaces."""
+    text = phrase.lower().replace("&", " and ")
+    text = re.sub(r"[^a-z0-9+#]+", " ", text)
+    tokens = [token for token in text.split() if token not in _FILLER_WORDS]
+    return " ".join(tokens)
+
+
+def _slug(phrase: str) -> str:
+    return phrase.replace(" ", "-")
+
+
+def _singularize(phrase: str) -> str:
+    return " ".join(
+        token[:-1] if len(token) > 3 and token.endswith("s") and not token.endswith("ss") else token
+        for token in phrase.split()
+    )
+
+
+def _build_alias_table() -> dict[str, str]:
+    """Seed phrase -> concept id from TOPIC_KEYWORDS, then merge synonyms."""
+    aliases: dict[str, str] = {}
+    for topic, keywords in TOPIC_KEYWORDS.items():
+        cleaned_keywords = [_clean(keyword) for keyword in keywords]
+        for cleaned in cleaned_keywords:
+            aliases.setdefault(cleaned, _slug(cleaned))
+
+        # "Graphs" and "graph" are the same concept
+        topic_key = _clean(topic)
+        singular = _singularize(topic_key)
+        topic_id = singular if singular in cleaned_keywords else topic_key
+        aliases.setdefault(topic_key, _slug(topic_id))
+
+    for canonical, synonyms in CONCEPT_SYNONYMS.items():
+        concept_id = _slug(_clean(canonical))
+        for phrase in (canonical, *synonyms):
+            aliases[_clean(phrase)] = concept_id
+
+    return aliases
+
+
+CONCEPT_ALIASES = _build_alias_table()
+
+
+def normalize_concept(concept: str) -> str:
+    """
+    Map a free-text concept name onto a canonical concept id.
+
+    "BFS", "Breadth First Search" and "bfs algorithm" all map to "bfs".
+    Unknown concepts fall back to a slug of the cleaned, singularized phrase
+    so repeated long-tail requests still share an id.
+    """
+    cleaned = _clean(concept)
+    if not cleaned:
+        return _slug(concept.strip().lower())
+
+    if cleaned in CONCEPT_ALIASES:
+        return CONCEPT_ALIASES[cleaned]
+
+    singular = _singularize(cleaned)
+    return CONCEPT_ALIASES.get(singular, _slug(singular))
@@ -0,0 +1,296 @@
+"""
+Adaptive concurrency limiter for outbound AI service calls.
+Caps in-flight calls per process with an AIMD limit that backs off on
+throttling or latency spikes; callers over the limit queue by priority class
+and user with a bounded wait.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from typing import Callable
+
+from app.services.llm_scheduler import BACKGROUND, PRIORITY_CLASSES, STANDARD, FairPriorityQueue
+from app.services.telemetry import LATENCY_BUCKETS_MS, Histogram
+
+logger = logging.getLogger(__name__)
+
+
+class _Waiter:
+    __slots__ = ("wake", "granted", "priority", "user")
+
+    def __init__(self, wake: Callable[[], None], priority: str, user: str | None) -> None:
+        self.wake = wake
+        self.granted = False
+        self.priority = priority
+        self.user = user
+
+
+class _ClassStats:
+    def __init__(self) -> None:
+        self.admitted = 0
+        self.queued = 0
+        self.timeouts = 0
+        self.wait_ms = Histogram(LATENCY_BUCKETS_MS)
+
+
+def _resolve(future: asyncio.Future) -> None:
+    if not future.done():
+        future.set_result(None)
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    Thread-safe AIMD concurrency limiter usable from threads and event loops.
+
+    - A call that completes normally while the limit is at least half used
+      grows the limit by ``1 / limit`` (about +1 per limit's worth of calls).
+    - Throttling multiplies the limit by ``backoff_ratio``; a call much
+      slower than usual for its key multiplies it by ``latency_backoff_ratio``.
+      Only calls started after the previous decrease can trigger another,
+      so one burst of throttled calls does not collapse the limit to the
+      minimum.
+    - Waiters are admitted highest priority class first and round-robin
+      across users within a class (see ``FairPriorityQueue``); they give up
+      after ``max_wait`` seconds unless the caller passes another timeout.
+    - Background calls may only use ``background_share`` of the limit, so
+      interactive work arriving during a batch finds free slots.
+    """
+
+    OK = "ok"
+    THROTTLED = "throttled"
+    DROPPED = "dropped"  # failed for reasons that say nothing about load
+
+    # Per-key latency baseline (EWMA) and how far above it counts as slow
+    LATENCY_ALPHA = 0.1
+    LATENCY_WARMUP = 5
+
+    def __init__(
+        self,
+        name: str,
+        initial_limit: int = 16,
+        min_limit: int = 1,
+        max_limit: int = 64,
+        max_wait: float = 10.0,
+        backoff_ratio: float = 0.5,
+        latency_backoff_ratio: float = 0.9,
+        latency_tolerance: float = 2.0,
+        background_share: float = 0.5,
+    ) -> None:
+        self.name = name
+        self.min_limit = max(1, min_limit)
+        self.max_limit = max(self.min_limit, max_limit)
+        self.max_wait = max_wait
+        self.backoff_ratio = backoff_ratio
+        self.latency_backoff_ratio = latency_backoff_ratio
+        self.latency_tolerance = latency_tolerance
+        self.background_share = background_share
+        self._lock = threading.Lock()
+        self._limit = float(min(max(initial_limit, self.min_limit), self.max_limit))
+        self._in_flight = 0
+        self._queue = FairPriorityQueue()
+        self._last_decrease = 0.0
+        self._latency: dict[str, tuple[float, int]] = {}
+        # Counters for the stats endpoint
+        self._peak_queue_depth = 0
+        self._classes = {priority: _ClassStats() for priority in PRIORITY_CLASSES}
+        self._throttle_decreases = 0
+        self._latency_decreases = 0
+
+    @property
+    def limit(self) -> int:
+        with self._lock:
+            return int(self._limit)
+
+    # ── Acquire / release ──────────────────────────────────────────────────
+
+    def _capacity(self, priority: str) -> int:
+        limit = int(self._limit)
+        if priority == BACKGROUND:
+            return max(1, int(limit * self.background_share))
+        return limit
+
+    def _try_acquire(self, priority: str) -> bool:
+        # Newcomers may not overtake queued callers of the same or a higher class
+        if self._queue.waiting_at_or_above(priority) or self._in_flight >= self._capacity(priority):
+            return False
+        self._in_flight += 1
+        stats = self._classes[priority]
+        stats.admitted += 1
+        stats.wait_ms.observe(0.0)
+        return True
+
+    def _enqueue(self, waiter: _Waiter) -> None:
+        self._queue.push(waiter.priority, waiter.user, waiter)
+        self._classes[waiter.priority].queued += 1
+        self._peak_queue_depth = max(self._peak_queue_depth, len(self._queue))
+
+    def _grant(self) -> None:
+        while True:
+            for priority in PRIORITY_CLASSES:
+                if self._queue.depth(priority) and self._in_flight < self._capacity(priority):
+                    waiter = self._queue.pop(priority)
+                    waiter.granted = True
+                    self._in_flight += 1
+                    waiter.wake()
+                    break
+            else:
+                return
+
+    def _finish_wait(self, waiter: _Waiter, waited: float) -> bool:
+        """Record a finished wait; drop the waiter from the queue if it was not served."""
+        stats = self._classes[waiter.priority]
+        stats.wait_ms.observe(waited * 1000)
+        if waiter.granted:
+            stats.admitted += 1
+            return True
+        self._queue.remove(waiter.priority, waiter.user, waiter)
+        stats.timeouts += 1
+        return False
+
+    def acquire(
+        self,
+        timeout: float | None = None,
+        priority: str = STANDARD,
+        user: str | None = None,
+    ) -> bool:
+        """
+        Take a slot, blocking up to ``timeout`` (default ``max_wait``) seconds.
+
+        Args:
+            timeout: Longest time to wait for a slot
+            priority: One of PRIORITY_CLASSES
+            user: Fairness key; calls of one user are spread between others'
+
+        Returns:
+            True if a slot was taken; the caller must ``release`` it
+        """
+        timeout = self.max_wait if timeout is None else timeout
+        with self._lock:
+            if self._try_acquire(priority):
+                return True
+            event = threading.Event()
+            waiter = _Waiter(event.set, priority, user)
+            self._enqueue(waiter)
+
+        started = time.monotonic()
+        event.wait(timeout)
+        with self._lock:
+            return self._finish_wait(waiter, time.monotonic() - started)
+
+    def try_acquire(self, priority: str = STANDARD) -> bool:
+        """Take a free slot without waiting; never queues behind other callers."""
+        with self._lock:
+            return self._try_acquire(priority)
+
+    async def acquire_async(
+        self,
+        timeout: float | None = None,
+        priority: str = STANDARD,
+        user: str | None = None,
+    ) -> bool:
+        """Awaitable ``acquire``; waiting does not hold a thread."""
+        timeout = self.max_wait if timeout is None else timeout
+        with self._lock:
+            if self._try_acquire(priority):
+                return True
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            waiter = _Waiter(lambda: loop.call_soon_threadsafe(_resolve, future), priority, user)
+            self._enqueue(waiter)
+
+        started = time.monotonic()
+        try:
+            await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            pass
+        except asyncio.CancelledError:
+            with self._lock:
+                if self._finish_wait(waiter, time.monotonic() - started):
+                    # Served just as we were cancelled: hand the slot back
+                    self._in_flight -= 1
+                    self._grant()
+            raise
+        with self._lock:
+            return self._finish_wait(waiter, time.monotonic() - started)
+
+    def release(
+        self,
+        outcome: str = OK,
+        latency: float | None = None,
+        key: str | None = None,
+        started: float | None = None,
+    ) -> None:
+        """
+        Return a slot and feed the call's outcome into the limit.
+
+        Args:
+            outcome: OK, THROTTLED or DROPPED
+            latency: Seconds the call took, for OK outcomes
+            key: Groups latencies of similar calls (e.g. the call site)
+            started: ``time.monotonic()`` when the call was sent; calls sent
+                before the last decrease cannot trigger another one
+        """
+        with self._lock:
+            in_flight = self._in_flight
+            self._in_flight = max(0, in_flight - 1)
+
+            if outcome == self.THROTTLED:
+                self._decrease(self.backoff_ratio, "throttling", started)
+            elif outcome == self.OK:
+                if latency is not None and key and self._is_slow(key, latency):
+                    self._decrease(self.latency_backoff_ratio, "latency", started)
+                elif in_flight * 2 >= self._limit:
+                    self._limit = min(float(self.max_limit), self._limit + 1.0 / self._limit)
+
+            self._grant()
+
+    def _is_slow(self, key: str, latency: float) -> bool:
+        baseline, samples = self._latency.get(key, (latency, 0))
+        slow = samples >= self.LATENCY_WARMUP and latency > baseline * self.latency_tolerance
+        self._latency[key] = (baseline + self.LATENCY_ALPHA * (latency - baseline), samples + 1)
+        return slow
+
+    def _decrease(self, ratio: float, reason: str, started: float | None) -> None:
+        if started is not None and started < self._last_decrease:
+            return
+        self._last_decrease = time.monotonic()
+        previous = int(self._limit)
+        self._limit = max(float(self.min_limit), self._limit * ratio)
+        if reason == "throttling":
+            self._throttle_decreases += 1
+        else:
+            self._latency_decreases += 1
+        logger.warning(
+            f"Concurrency limiter '{self.name}' limit {previous} -> {int(self._limit)} ({reason})"
+        )
+
+    def snapshot(self) -> dict:
+        """Return the current limit, queue depths and per-class counters for the stats endpoint."""
+        with self._lock:
+            return {
+                "name": self.name,
+                "limit": int(self._limit),
+                "min_limit": self.min_limit,
+                "max_limit": self.max_limit,
+                "background_limit": self._capacity(BACKGROUND),
+                "in_flight": self._in_flight,
+                "queue_depth": len(self._queue),
+                "peak_queue_depth": self._peak_queue_depth,
+                "queue_timeouts": sum(stats.timeouts for stats in self._classes.values()),
+                "classes": {
+                    priority: {
+                        "queue_depth": self._queue.depth(priority),
+                        "waiting_users": self._queue.waiting_users(priority),
+                        "admitted": stats.admitted,
+                        "queued_calls": stats.queued,
+                        "queue_timeouts": stats.timeouts,
+                        "queue_wait_ms": stats.wait_ms.snapshot(),
+                    }
+                    for priority, stats in self._classes.items()
+                },
+                "max_wait_seconds": self.max_wait,
+                "throttle_decreases": self._throttle_decreases,
+                "latency_decreases": self._latency_decreases,
+            }
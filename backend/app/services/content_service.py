@@ -7,7 +7,10 @@ import json
 import logging
 from typing import AsyncGenerator
 
+from fastapi.concurrency import run_in_threadpool
+
 from app.services.bedrock import BedrockService, bedrock_service
+from app.services.concept_store import concept_store
 from app.services.prompts import (
     get_content_explanation_prompt,
     get_resource_recommendations_prompt,
@@ -63,8 +66,9 @@ class ContentService:
         }
     }
     
-    def __init__(self, bedrock_service: BedrockService = None) -> None:
-        self._bedrock = bedrock_service or BedrockService()
+    def __init__(self, bedrock: BedrockService = None) -> None:
+        # Share the module-level client and executor unless a service is injected
+        self._bedrock = bedrock or bedrock_service
     
     def _is_language_supported(self, language: str) -> bool:
         """Check if a language is supported."""
@@ -106,6 +110,20 @@ class ContentService:
             logger.warning(f"Language {language} not supported, falling back to English")
             language = "en"
         
+        # Context-free explanations are shared between students via the store
+        shareable = not context and include_examples
+        if shareable:
+            stored = await concept_store.get_async(concept, user_level, language, "detailed")
+            if stored is not None:
+                stored["_meta"] = {
+                    "requested_language": original_language,
+                    "response_language": language,
+                    "user_level": user_level,
+                    "fallback_used": False,
+                    "from_store": True,
+                }
+                return stored
+        
         try:
             prompt = get_content_explanation_prompt(
                 concept=concept,
@@ -115,7 +133,7 @@ class ContentService:
                 examples_requested=include_examples
             )
             
-            response = self._bedrock.invoke_model(
+            response = await self._bedrock.invoke_model_async(
                 system_prompt=CONTENT_EXPLANATION_SYSTEM_PROMPT,
                 user_prompt=prompt,
                 max_tokens=4096,
@@ -142,6 +160,9 @@ class ContentService:
                     **{k: v for k, v in result.items() if k not in ["simple_definition", "detailed_explanation"]}
                 }
             
+            if shareable and not result.get("fallback", False):
+                await concept_store.put_async(concept, user_level, language, "detailed", result)
+            
             # Add metadata
             result["_meta"] = {
                 "requested_language": original_language,
@@ -221,7 +242,7 @@ class ContentService:
                 preferred_language=preferred_language
             )
             
-            response = self._bedrock.invoke_model(
+            response = await self._bedrock.invoke_model_async(
                 system_prompt="You are an expert curator of learning resources for Indian students. Provide specific, actionable recommendations with real platforms and creators.",
                 user_prompt=prompt,
                 max_tokens=4096,
@@ -285,7 +306,7 @@ class ContentService:
             # For complex educational content, use AI-based translation
             prompt = get_roadmap_translation_prompt(roadmap_content, target_language)
             
-            response = self._bedrock.invoke_model(
+            response = await self._bedrock.invoke_model_async(
                 system_prompt="You are an expert translator specializing in educational content for Indian students. Keep technical terms in English.",
                 user_prompt=prompt,
                 max_tokens=4096,
@@ -347,12 +368,13 @@ class ContentService:
             # Try AI-based translation first for better quality
             prompt = get_tasks_translation_prompt(tasks, target_language)
             
-            response = self._bedrock.invoke_model(
+            response = await self._bedrock.invoke_model_async(
                 system_prompt="You are a translator for educational task descriptions. Keep technical terms in English.",
                 user_prompt=prompt,
                 max_tokens=2048,
                 temperature=0.3,
-                fallback_type="translation"
+                fallback_type="translation",
+                call_site="task_translation",
             )
             
             result = self._bedrock.parse_json_response(response)
@@ -470,7 +492,8 @@ class ContentService:
                 return [translate_value(item) for item in value]
             return value
         
-        return translate_value(content)
+        # Amazon Translate calls are blocking; keep them off the event loop
+        return await run_in_threadpool(translate_value, content)
     
     async def _translate_tasks_with_amazon(
         self,
@@ -480,8 +503,7 @@ class ContentService:
         """Translate tasks using Amazon Translate."""
         target_code = self._get_translate_code(target_language)
         
-        translated_tasks = []
-        for task in tasks:
+        def translate_task(task: dict) -> dict:
             translated_task = task.copy()
             
             # Translate text fields
@@ -496,9 +518,10 @@ class ContentService:
                     except Exception as exc:
                         logger.warning(f"Failed to translate task field {field}: {exc}")
             
-            translated_tasks.append(translated_task)
+            return translated_task
         
-        return translated_tasks
+        # Amazon Translate calls are blocking; keep them off the event loop
+        return await run_in_threadpool(lambda: [translate_task(task) for task in tasks])
     
     def _get_fallback_explanation(self, concept: str, language: str) -> dict:
         """Generate a fallback explanation when AI service fails."""
@@ -0,0 +1,117 @@
+"""
+Request hedging for latency-critical upstream AI calls.
+Tracks recent latencies per call site; a call still running past the
+site's learned percentile may send one identical backup request, within a
+budget that keeps hedges a small share of traffic.
+"""
+
+import threading
+from collections import deque
+
+
+class HedgePolicy:
+    """
+    Per-key hedge thresholds plus a token-bucket cap on hedge rate.
+
+    ``observe`` feeds successful call latencies into a sliding window per
+    key; ``delay`` is the ``percentile`` of that window once it holds
+    ``min_samples``. Each hedge-eligible call deposits ``max_ratio`` tokens
+    and each hedge withdraws one, so at most about ``max_ratio`` of eligible
+    calls are duplicated (plus a burst of ``max_tokens``).
+    """
+
+    def __init__(
+        self,
+        name: str,
+        percentile: float = 0.9,
+        window: int = 200,
+        min_samples: int = 20,
+        max_ratio: float = 0.05,
+        max_tokens: float = 5.0,
+    ) -> None:
+        self.name = name
+        self.percentile = min(max(percentile, 0.0), 1.0)
+        self.window = max(1, window)
+        self.min_samples = max(1, min_samples)
+        self.max_ratio = max(0.0, max_ratio)
+        self.max_tokens = max(1.0, max_tokens)
+        self._lock = threading.Lock()
+        self._latency: dict[str, deque[float]] = {}
+        self._tokens = self.max_tokens
+        self._eligible = 0
+        self._hedged = 0
+        self._hedge_wins = 0
+        self._denied = 0
+
+    def observe(self, key: str, seconds: float) -> None:
+        """Record the latency of a call that succeeded."""
+        with self._lock:
+            samples = self._latency.get(key)
+            if samples is None:
+                samples = self._latency[key] = deque(maxlen=self.window)
+            samples.append(seconds)
+
+    def _delay_locked(self, key: str) -> float | None:
+        samples = self._latency.get(key)
+        if samples is None or len(samples) < self.min_samples:
+            return None
+        ordered = sorted(samples)
+        return ordered[min(len(ordered) - 1, int(self.percentile * len(ordered)))]
+
+    def delay(self, key: str) -> float | None:
+        """
+        Seconds to wait for the first attempt before hedging; counts the
+        call as hedge-eligible.
+
+        Returns:
+            The key's latency percentile, or None while there are too few
+            samples to hedge at all
+        """
+        with self._lock:
+            self._eligible += 1
+            self._tokens = min(self.max_tokens, self._tokens + self.max_ratio)
+            return self._delay_locked(key)
+
+    def try_hedge(self) -> bool:
+        """Take a token for a hedge; False means the hedge must not be sent."""
+        with self._lock:
+            if self._tokens >= 1.0:
+                self._tokens -= 1.0
+                self._hedged += 1
+                return True
+            self._denied += 1
+            return False
+
+    def refund(self) -> None:
+        """Return the token of a hedge that could not be sent after all."""
+        with self._lock:
+            self._tokens = min(self.max_tokens, self._tokens + 1.0)
+            self._hedged -= 1
+            self._denied += 1
+
+    def record_win(self) -> None:
+        """The hedged request answered before the original one."""
+        with self._lock:
+            self._hedge_wins += 1
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            thresholds = {}
+            for key, samples in sorted(self._latency.items()):
+                delay = self._delay_locked(key)
+                thresholds[key] = {
+                    "samples": len(samples),
+                    "hedge_after_ms": None if delay is None else round(delay * 1000),
+                }
+            return {
+                "name": self.name,
+                "percentile": self.percentile,
+                "max_ratio": self.max_ratio,
+                "tokens": round(self._tokens, 2),
+                "eligible_calls": self._eligible,
+                "hedged": self._hedged,
+                "hedge_wins": self._hedge_wins,
+                "hedges_denied": self._denied,
+                "hedge_rate": round(self._hedged / self._eligible, 4) if self._eligible else 0.0,
+                "keys": thresholds,
+            }
@@ -0,0 +1,261 @@
+"""
+Bounded transcript context for interview prompts.
+Earlier exchanges are folded into a short rolling summary (one cheap model
+call every few turns) and only recent turns are sent verbatim, so
+follow-up and evaluation prompts stay under a fixed token budget however
+long the candidate's answers are.
+"""
+
+import logging
+from typing import Callable
+
+from fastapi import HTTPException
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.database import SessionLocal
+from app.models import Interview
+from app.services.bedrock import bedrock_service
+from app.services.interview_messages import load_messages
+from app.services.llm_scheduler import STANDARD
+from app.services.prompts import INTERVIEW_SUMMARY_SYSTEM_PROMPT, get_interview_summary_prompt
+from app.utils.deadline import Deadline
+
+logger = logging.getLogger(__name__)
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Rough token count: UTF-8 bytes / 4.
+
+    About right for English and code, and conservative for Indic scripts
+    (3 bytes per character), which tokenize to more tokens per character.
+    """
+    return (len(text.encode("utf-8")) + 3) // 4
+
+
+def clip_text(text: str, max_tokens: int) -> str:
+    """Keep the start and end of ``text`` within ``max_tokens``, marking the cut."""
+    tokens = estimate_tokens(text)
+    if tokens <= max_tokens:
+        return text
+    keep = max(0, int(len(text) * max_tokens / tokens) - 40)
+    head = text[: keep * 2 // 3]
+    tail = text[len(text) - keep // 3:] if keep // 3 else ""
+    return f"{head}\n[... {len(text) - len(head) - len(tail)} characters omitted ...]\n{tail}"
+
+
+def _speaker(message: dict) -> str:
+    return "Interviewer" if message.get("role") == "assistant" else "Candidate"
+
+
+def _since(messages: list[dict], seq: int) -> list[dict]:
+    return [message for message in messages if message["seq"] >= seq]
+
+
+def format_messages(messages: list[dict], max_message_tokens: int | None = None) -> str:
+    lines = []
+    for message in messages:
+        content = str(message.get("content") or "")
+        if max_message_tokens is not None:
+            content = clip_text(content, max_message_tokens)
+        lines.append(f"{_speaker(message)}: {content}")
+    return "\n".join(lines)
+
+
+class InterviewContextManager:
+    """
+    Builds the transcript part of follow-up and evaluation prompts.
+
+    ``Interview.summary`` covers the messages with ``seq`` below
+    ``summarized_messages``. Callers pass the transcript as dicts from
+    ``load_messages`` (only the unsummarized tail is needed). The rest is
+    rendered verbatim, newest first into the budget, each message
+    clipped to ``INTERVIEW_MESSAGE_MAX_TOKENS``; whatever does not fit is
+    dropped with a marker. ``summarize`` folds older messages into the
+    summary and is meant to run as a background task after a turn.
+    """
+
+    def __init__(self, session_factory: Callable[[], Session] = SessionLocal) -> None:
+        self._session_factory = session_factory
+
+    @staticmethod
+    def _summary_cutoff(message_count: int) -> int:
+        """Seq up to which messages may be summarized (all but the recent window)."""
+        return max(0, message_count - settings.INTERVIEW_RECENT_MESSAGES)
+
+    def needs_summary(self, interview: Interview) -> bool:
+        """True once enough messages have left the recent window since the last summary."""
+        pending = self._summary_cutoff(interview.message_count or 0) - (interview.summarized_messages or 0)
+        return pending >= settings.INTERVIEW_SUMMARY_EVERY_MESSAGES
+
+    def render(
+        self,
+        summary: str | None,
+        messages: list[dict],
+        budget_tokens: int,
+    ) -> str:
+        """
+        Summary plus as many of ``messages`` (newest kept first) as fit in
+        ``budget_tokens``.
+        """
+        parts: list[str] = []
+        if summary:
+            summary = clip_text(summary, settings.INTERVIEW_SUMMARY_MAX_TOKENS)
+            parts.append(f"Summary of earlier exchanges:\n{summary}")
+        remaining = budget_tokens - sum(estimate_tokens(part) for part in parts)
+
+        kept: list[str] = []
+        for message in reversed(messages):
+            line = format_messages([message], settings.INTERVIEW_MESSAGE_MAX_TOKENS)
+            cost = estimate_tokens(line) + 1
+            if cost > remaining:
+                if not kept and remaining > 50:
+                    # Always show something of the most recent message
+                    kept.append(clip_text(line, remaining - 20))
+                break
+            kept.append(line)
+            remaining -= cost
+
+        omitted = len(messages) - len(kept)
+        if omitted:
+            parts.append(f"[{omitted} earlier message(s) omitted]")
+        if kept:
+            parts.append("\n".join(reversed(kept)))
+        return "\n\n".join(parts)
+
+    def followup_context(self, interview: Interview, messages: list[dict]) -> tuple[str, str]:
+        """
+        Conversation before the candidate's latest answer, and that answer,
+        together within ``INTERVIEW_FOLLOWUP_CONTEXT_TOKENS``.
+        """
+        last_answer = clip_text(str(messages[-1].get("content") or ""), settings.INTERVIEW_MESSAGE_MAX_TOKENS)
+        start = min(interview.summarized_messages or 0, messages[-1]["seq"])
+        conversation = self.render(
+            interview.summary if start else None,
+            _since(messages[:-1], start),
+            settings.INTERVIEW_FOLLOWUP_CONTEXT_TOKENS - estimate_tokens(last_answer),
+        )
+        return conversation, last_answer
+
+    def excerpt(self, interview: Interview, messages: list[dict], budget_tokens: int) -> str:
+        """Stored summary plus the latest messages within ``budget_tokens``; never calls the model."""
+        start = interview.summarized_messages or 0
+        return self.render(interview.summary if start else None, _since(messages, start), budget_tokens)
+
+    async def evaluation_transcript(
+        self,
+        interview: Interview,
+        messages: list[dict],
+        deadline: Deadline | None = None,
+    ) -> str:
+        """
+        Transcript for the final evaluation within ``INTERVIEW_EVAL_CONTEXT_TOKENS``.
+
+        If the unsummarized messages do not fit, they are summarized first
+        (kept in memory only) so nothing is silently dropped.
+        """
+        summary = interview.summary
+        start = interview.summarized_messages or 0
+        budget = settings.INTERVIEW_EVAL_CONTEXT_TOKENS
+
+        verbatim = format_messages(_since(messages, start), settings.INTERVIEW_MESSAGE_MAX_TOKENS)
+        if estimate_tokens(verbatim) + estimate_tokens(summary or "") > budget:
+            cutoff = self._summary_cutoff(interview.message_count or 0)
+            if cutoff > start:
+                pending = [message for message in _since(messages, start) if message["seq"] < cutoff]
+                refreshed = await self._summarize_messages(interview, summary, pending, deadline, priority=STANDARD)
+                if refreshed is not None:
+                    summary, start = refreshed, cutoff
+        return self.render(summary if start else None, _since(messages, start), budget)
+
+    async def _summarize_messages(
+        self,
+        interview: Interview,
+        summary: str | None,
+        messages: list[dict],
+        deadline: Deadline | None = None,
+        priority: str | None = None,
+    ) -> str | None:
+        """
+        Previous summary + ``messages`` -> new summary, or None if the call
+        failed. Runs as background work unless ``priority`` says otherwise.
+        """
+        try:
+            result = await bedrock_service.invoke_model_async(
+                INTERVIEW_SUMMARY_SYSTEM_PROMPT,
+                get_interview_summary_prompt(
+                    interview.role,
+                    interview.company,
+                    summary,
+                    format_messages(messages, settings.INTERVIEW_MESSAGE_MAX_TOKENS),
+                    settings.INTERVIEW_SUMMARY_MAX_TOKENS * 3 // 4,
+                ),
+                max_tokens=settings.INTERVIEW_SUMMARY_MAX_TOKENS,
+                temperature=0.2,
+                fallback_type="interview_summary",  # no fallback text: failures raise
+                call_site="interview_summary",
+                priority=priority,
+                user_id=interview.user_id,
+                deadline=deadline,
+            )
+        except HTTPException as exc:
+            logger.warning(f"Interview {interview.id} summary failed; keeping the previous one: {exc.detail}")
+            return None
+        return result.strip() or None
+
+    def _load(self, interview_id: str) -> tuple[Interview, list[dict]] | None:
+        """The interview and the messages that are due to be summarized."""
+        db = self._session_factory()
+        try:
+            interview = db.get(Interview, interview_id)
+            if interview is None:
+                return None
+            pending = load_messages(
+                db,
+                interview_id,
+                since_seq=interview.summarized_messages or 0,
+                until_seq=self._summary_cutoff(interview.message_count or 0),
+            )
+            return interview, pending
+        finally:
+            db.close()
+
+    def _store(self, interview_id: str, expected_count: int, summary: str, count: int) -> bool:
+        """Save a summary unless another one was stored since ``expected_count`` was read."""
+        db = self._session_factory()
+        try:
+            result = db.execute(
+                update(Interview)
+                .where(Interview.id == interview_id, Interview.summarized_messages == expected_count)
+                .values(summary=summary, summarized_messages=count)
+            )
+            db.commit()
+            return result.rowcount == 1
+        finally:
+            db.close()
+
+    async def summarize(self, interview_id: str) -> None:
+        """
+        Background task: fold messages that left the recent window into the
+        interview's summary.
+        """
+        loaded = await run_in_threadpool(self._load, interview_id)
+        if loaded is None:
+            return
+        interview, pending = loaded
+        if interview.score is not None or not self.needs_summary(interview):
+            return
+        start = interview.summarized_messages or 0
+        cutoff = self._summary_cutoff(interview.message_count or 0)
+        summary = await self._summarize_messages(interview, interview.summary if start else None, pending)
+        if summary is None:
+            return
+        if not await run_in_threadpool(self._store, interview_id, start, summary, cutoff):
+            logger.info(f"Interview {interview_id} summary was updated concurrently; discarding this one")
+
+
+# Global instance
+interview_context = InterviewContextManager()
@@ -0,0 +1,553 @@
+"""
+Scoring of mock interviews.
+Each answer gets a cheap micro-assessment as it arrives. Ending an interview
+queues a background job that averages those scores, has the model write the
+feedback, retries failed attempts with backoff and records the outcome on
+the interview, which clients poll via GET /api/interview/{id}.
+"""
+
+import asyncio
+import json
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Callable
+
+from fastapi import HTTPException
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import or_
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.database import SessionLocal
+from app.models import Interview, InterviewEvaluationJob, User
+from app.services.bedrock import bedrock_service
+from app.services.interview_context import clip_text, interview_context
+from app.services.interview_messages import load_messages
+from app.services.prompts import (
+    INTERVIEW_ASSESSMENT_SYSTEM_PROMPT,
+    get_interview_answer_assessment_prompt,
+    get_interview_evaluate_prompt,
+    get_interview_feedback_prompt,
+    get_interview_system_prompt,
+)
+from app.utils.deadline import Deadline
+from app.utils.json_repair import extract_json
+
+logger = logging.getLogger(__name__)
+
+# Interview.status
+ACTIVE = "active"
+EVALUATING = "evaluating"
+COMPLETED = "completed"
+EVALUATION_FAILED = "evaluation_failed"
+
+# Sub-scores (1-10) of a per-answer assessment and of the final evaluation
+ASSESSMENT_DIMENSIONS = ("technical_score", "communication_score", "problem_solving_score")
+
+# InterviewEvaluationJob.status
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+
+
+class InterviewEvaluationError(Exception):
+    """The model's evaluation could not be turned into a score."""
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def _job_to_dict(job: InterviewEvaluationJob) -> dict:
+    return {
+        "interview_id": job.interview_id,
+        "status": job.status,
+        "attempts": job.attempts,
+        "error": job.error,
+        "next_attempt_at": job.next_attempt_at,
+        "lease_expires_at": job.lease_expires_at,
+        "updated_at": job.updated_at,
+    }
+
+
+def parse_evaluation(raw: str) -> tuple[int, str]:
+    """
+    Score (0-100) and feedback JSON from the model's evaluation.
+
+    The score is the weighted average of the sub-scores when all three are
+    present (technical 40%, problem-solving 35%, communication 25%), else
+    the overall score, scaled from 1-10 where needed.
+
+    Raises:
+        InterviewEvaluationError: If the response has no usable score
+    """
+    try:
+        data = extract_json(raw)
+
+        tech = data.get("technical_score")
+        comm = data.get("communication_score")
+        ps = data.get("problem_solving_score")
+
+        if tech is not None and comm is not None and ps is not None:
+            weighted = int(tech) * 0.40 + int(ps) * 0.35 + int(comm) * 0.25
+            score = round(weighted * 10)          # 1-10 → 0-100
+        else:
+            raw_score = data.get("score")
+            score = int(raw_score) if raw_score is not None else None
+            if score is not None and score <= 10:
+                score = score * 10
+    except (ValueError, TypeError, AttributeError) as exc:
+        raise InterviewEvaluationError(f"Unparseable evaluation: {exc}") from exc
+
+    if score is None:
+        raise InterviewEvaluationError("Evaluation has no score")
+    # Store the full evaluation JSON so the frontend can render it.
+    return max(0, min(100, score)), json.dumps(data)
+
+
+def parse_assessment(raw: str) -> dict | None:
+    """
+    Per-answer assessment from the model's JSON, or None if unusable.
+
+    Scores outside 1-10 (or not numbers) are treated as "no evidence".
+    """
+    try:
+        data = extract_json(raw)
+    except ValueError:
+        return None
+    if not isinstance(data, dict):
+        return None
+
+    assessment: dict = {}
+    for dimension in ASSESSMENT_DIMENSIONS:
+        try:
+            value = round(float(data.get(dimension)))
+        except (TypeError, ValueError):
+            value = None
+        assessment[dimension] = value if value is not None and 1 <= value <= 10 else None
+    assessment["topic"] = str(data.get("topic") or "")[:60]
+    assessment["note"] = str(data.get("note") or "")[:300]
+    return assessment
+
+
+def question_before(messages: list[dict], index: int) -> str:
+    """The interviewer message the answer at ``index`` replies to."""
+    for message in reversed(messages[:index]):
+        if message.get("role") == "assistant":
+            return str(message.get("content") or "")
+    return ""
+
+
+async def assess_answer(
+    interview: Interview,
+    question: str,
+    answer: str,
+    deadline: Deadline | None = None,
+) -> dict | None:
+    """
+    Score one candidate answer with a cheap model call.
+
+    Returns:
+        The assessment, or None if the call failed or returned nothing usable
+    """
+    try:
+        raw = await bedrock_service.invoke_model_async(
+            INTERVIEW_ASSESSMENT_SYSTEM_PROMPT,
+            get_interview_answer_assessment_prompt(
+                interview.role,
+                interview.company,
+                clip_text(question, settings.INTERVIEW_MESSAGE_MAX_TOKENS),
+                clip_text(answer, settings.INTERVIEW_MESSAGE_MAX_TOKENS),
+            ),
+            max_tokens=settings.INTERVIEW_ASSESSMENT_MAX_TOKENS,
+            temperature=0.2,
+            fallback_type="interview_assessment",  # no fallback text: failures raise
+            call_site="interview_assessment",
+            user_id=interview.user_id,
+            deadline=deadline,
+        )
+    except HTTPException as exc:
+        logger.warning(f"Interview {interview.id} answer assessment failed: {exc.detail}")
+        return None
+    assessment = parse_assessment(raw)
+    if assessment is None:
+        logger.warning(f"Interview {interview.id} answer assessment was not valid JSON")
+    return assessment
+
+
+async def _answer_assessments(
+    interview: Interview,
+    messages: list[dict],
+    deadline: Deadline | None = None,
+) -> list[dict]:
+    """
+    Assessments of every candidate answer in ``messages``, in order.
+
+    Stored ones are reused; answers without one (normally just the last
+    answer, which ends the interview) are assessed now, in parallel.
+    """
+    answers = [index for index, message in enumerate(messages) if message.get("role") == "user"]
+    missing = [index for index in answers if not messages[index].get("assessment")]
+    fresh = await asyncio.gather(*(
+        assess_answer(interview, question_before(messages, index), str(messages[index].get("content") or ""), deadline)
+        for index in missing
+    ))
+    assessed = dict(zip(missing, fresh))
+    assessments = []
+    for index in answers:
+        assessment = messages[index].get("assessment") or assessed.get(index)
+        if assessment:
+            assessments.append(assessment)
+    return assessments
+
+
+def aggregate_assessments(assessments: list[dict]) -> dict | None:
+    """
+    Mean score per dimension over the answers that gave evidence for it.
+
+    Returns:
+        The three sub-scores (1-10), or None if any dimension has no
+        assessed answer at all
+    """
+    scores = {}
+    for dimension in ASSESSMENT_DIMENSIONS:
+        values = [assessment[dimension] for assessment in assessments if assessment.get(dimension) is not None]
+        if not values:
+            return None
+        scores[dimension] = round(sum(values) / len(values))
+    return scores
+
+
+def format_assessments(assessments: list[dict]) -> str:
+    """One line per assessed answer for the feedback prompt."""
+    def fmt(value: int | None) -> str:
+        return "-" if value is None else str(value)
+
+    return "\n".join(
+        f"{number}. {assessment.get('topic') or 'answer'}: technical {fmt(assessment.get('technical_score'))}, "
+        f"problem solving {fmt(assessment.get('problem_solving_score'))}, "
+        f"communication {fmt(assessment.get('communication_score'))}. {assessment.get('note') or ''}".rstrip()
+        for number, assessment in enumerate(assessments, start=1)
+    )
+
+
+async def evaluate_interview(
+    interview: Interview,
+    messages: list[dict],
+    preferred_language: str | None = None,
+    deadline: Deadline | None = None,
+) -> tuple[int, str]:
+    """
+    Call Bedrock to evaluate a completed interview from its full transcript
+    (``load_messages``).
+
+    With per-answer assessments the sub-scores are their averages and the
+    model only writes the feedback, from the assessment notes and a short
+    transcript excerpt (no summarizing call needed). Without them (the
+    feature is off, or no answer gave evidence for some dimension) the
+    model scores the whole transcript.
+
+    Returns:
+        Tuple of (score, feedback JSON)
+
+    Raises:
+        HTTPException: If Bedrock could not be reached (there is no fallback text)
+        InterviewEvaluationError: If the response has no usable score
+    """
+    system_prompt = get_interview_system_prompt(preferred_language)
+    scores = None
+    if settings.INTERVIEW_TURN_ASSESSMENT_ENABLED:
+        assessments = await _answer_assessments(interview, messages, deadline)
+        scores = aggregate_assessments(assessments)
+
+    if scores is None:
+        raw = await bedrock_service.invoke_model_async(
+            system_prompt,
+            get_interview_evaluate_prompt(
+                interview.role,
+                interview.company,
+                await interview_context.evaluation_transcript(interview, messages, deadline),
+            ),
+            fallback_type="interview_evaluation",  # no fallback text: failures raise
+            call_site="interview_evaluation",
+            user_id=interview.user_id,
+            deadline=deadline,
+        )
+        return parse_evaluation(raw)
+
+    raw = await bedrock_service.invoke_model_async(
+        system_prompt,
+        get_interview_feedback_prompt(
+            interview.role,
+            interview.company,
+            scores,
+            format_assessments(assessments),
+            interview_context.excerpt(interview, messages, settings.INTERVIEW_FEEDBACK_CONTEXT_TOKENS),
+        ),
+        fallback_type="interview_evaluation",
+        call_site="interview_evaluation",
+        user_id=interview.user_id,
+        deadline=deadline,
+    )
+    try:
+        feedback = extract_json(raw)
+    except ValueError as exc:
+        raise InterviewEvaluationError(f"Unparseable feedback: {exc}") from exc
+    if not isinstance(feedback, dict):
+        raise InterviewEvaluationError("Feedback is not a JSON object")
+    feedback.update(scores)
+    feedback["answer_assessments"] = assessments
+    return parse_evaluation(json.dumps(feedback))
+
+
+class InterviewEvaluationJobs:
+    """
+    One evaluation job per interview, retried from the job table.
+
+    ``enqueue`` marks the interview as evaluating and queues its job;
+    ``run`` claims it (a lease of ``INTERVIEW_EVAL_JOB_LEASE_SECONDS``),
+    evaluates, and either completes the interview or schedules the next
+    attempt. After ``INTERVIEW_EVAL_MAX_ATTEMPTS`` failures the interview
+    is marked ``evaluation_failed`` and ending it again starts over. Jobs
+    left behind by a dead worker are picked up by ``resume_pending`` at
+    start-up, or when the interview is polled.
+    """
+
+    def __init__(self, session_factory: Callable[[], Session] = SessionLocal) -> None:
+        self._session_factory = session_factory
+
+    @staticmethod
+    def _lease_expiry() -> datetime:
+        return _utcnow() + timedelta(seconds=settings.INTERVIEW_EVAL_JOB_LEASE_SECONDS)
+
+    @staticmethod
+    def _retry_delay(attempts: int) -> float:
+        return settings.INTERVIEW_EVAL_RETRY_BASE_SECONDS * 2 ** max(0, attempts - 1)
+
+    @staticmethod
+    def _claimable(now: datetime):
+        return or_(
+            (InterviewEvaluationJob.status == QUEUED)
+            & (
+                InterviewEvaluationJob.next_attempt_at.is_(None)
+                | (InterviewEvaluationJob.next_attempt_at <= now)
+            ),
+            (InterviewEvaluationJob.status == RUNNING) & (InterviewEvaluationJob.lease_expires_at < now),
+        )
+
+    def _query(self, db: Session, interview_id: str):
+        return db.query(InterviewEvaluationJob).filter(InterviewEvaluationJob.interview_id == interview_id)
+
+    def enqueue(self, interview_id: str) -> bool:
+        """
+        Queue an interview's evaluation and mark the interview as evaluating.
+
+        A job that failed for good starts over with a fresh attempt count.
+
+        Returns:
+            True if a job was queued and the caller should ``run`` it; False
+            if one is already queued or running
+        """
+        db = self._session_factory()
+        try:
+            db.add(InterviewEvaluationJob(interview_id=interview_id, status=QUEUED, attempts=0))
+            db.query(Interview).filter(Interview.id == interview_id).update(
+                {"status": EVALUATING}, synchronize_session=False
+            )
+            db.commit()
+            return True
+        except IntegrityError:
+            db.rollback()
+        finally:
+            db.close()
+
+        db = self._session_factory()
+        try:
+            updated = (
+                self._query(db, interview_id)
+                .filter(InterviewEvaluationJob.status == FAILED)
+                .update(
+                    {"status": QUEUED, "attempts": 0, "error": None, "next_attempt_at": None},
+                    synchronize_session=False,
+                )
+            )
+            db.query(Interview).filter(Interview.id == interview_id, Interview.score.is_(None)).update(
+                {"status": EVALUATING}, synchronize_session=False
+            )
+            db.commit()
+            return updated == 1
+        finally:
+            db.close()
+
+    def claim(self, interview_id: str) -> bool:
+        """
+        Take ownership of a due job.
+
+        Returns:
+            True if the caller now owns the job and must ``complete`` or ``fail`` it
+        """
+        db = self._session_factory()
+        try:
+            updated = (
+                self._query(db, interview_id)
+                .filter(self._claimable(_utcnow()))
+                .update(
+                    {
+                        "status": RUNNING,
+                        "attempts": InterviewEvaluationJob.attempts + 1,
+                        "lease_expires_at": self._lease_expiry(),
+                    },
+                    synchronize_session=False,
+                )
+            )
+            db.commit()
+            return updated == 1
+        finally:
+            db.close()
+
+    def complete(self, interview_id: str, score: int, feedback: str) -> None:
+        """Store the evaluation on the interview and close the job, in one transaction."""
+        db = self._session_factory()
+        try:
+            db.query(Interview).filter(Interview.id == interview_id).update(
+                {"score": score, "feedback": feedback, "status": COMPLETED}, synchronize_session=False
+            )
+            self._query(db, interview_id).update(
+                {"status": DONE, "error": None, "lease_expires_at": None, "next_attempt_at": None},
+                synchronize_session=False,
+            )
+            db.commit()
+        finally:
+            db.close()
+
+    def fail(self, interview_id: str, error: str) -> float | None:
+        """
+        Record a failed attempt.
+
+        Returns:
+            Seconds until the job may be retried, or None if it has used up
+            its attempts (the interview is then marked evaluation_failed)
+        """
+        db = self._session_factory()
+        try:
+            job = self._query(db, interview_id).first()
+            if job is None:
+                return None
+            if job.attempts >= settings.INTERVIEW_EVAL_MAX_ATTEMPTS:
+                job.status = FAILED
+                job.next_attempt_at = None
+                db.query(Interview).filter(Interview.id == interview_id).update(
+                    {"status": EVALUATION_FAILED}, synchronize_session=False
+                )
+                delay = None
+            else:
+                delay = self._retry_delay(job.attempts)
+                job.status = QUEUED
+                job.next_attempt_at = _utcnow() + timedelta(seconds=delay)
+            job.error = error[:500]
+            job.lease_expires_at = None
+            db.commit()
+            return delay
+        finally:
+            db.close()
+
+    def get(self, interview_id: str) -> dict | None:
+        db = self._session_factory()
+        try:
+            job = self._query(db, interview_id).first()
+            return _job_to_dict(job) if job is not None else None
+        finally:
+            db.close()
+
+    @staticmethod
+    def is_due(job: dict) -> bool:
+        """True if nobody is working on ``job`` and it may run now."""
+        now = _utcnow()
+        if job["status"] == QUEUED:
+            return job["next_attempt_at"] is None or job["next_attempt_at"] <= now
+        return job["status"] == RUNNING and job["lease_expires_at"] is not None and job["lease_expires_at"] < now
+
+    def due(self, limit: int = 100) -> list[str]:
+        """Interview ids of jobs that may run now."""
+        db = self._session_factory()
+        try:
+            rows = (
+                db.query(InterviewEvaluationJob.interview_id)
+                .filter(self._claimable(_utcnow()))
+                .order_by(InterviewEvaluationJob.created_at.asc())
+                .limit(limit)
+                .all()
+            )
+            return [interview_id for (interview_id,) in rows]
+        finally:
+            db.close()
+
+    def _load(self, interview_id: str) -> tuple[Interview, list[dict], str | None] | None:
+        """The interview, its transcript and its owner's preferred language."""
+        db = self._session_factory()
+        try:
+            row = (
+                db.query(Interview, User.preferred_language)
+                .join(User, User.id == Interview.user_id)
+                .filter(Interview.id == interview_id)
+                .first()
+            )
+            if row is None:
+                return None
+            return row[0], load_messages(db, interview_id), row[1]
+        finally:
+            db.close()
+
+    async def enqueue_async(self, interview_id: str) -> bool:
+        return await run_in_threadpool(self.enqueue, interview_id)
+
+    async def get_async(self, interview_id: str) -> dict | None:
+        return await run_in_threadpool(self.get, interview_id)
+
+    async def run(self, interview_id: str) -> None:
+        """
+        Background task: evaluate the interview, retrying failed attempts
+        after their backoff while this process is alive.
+        """
+        while await run_in_threadpool(self.claim, interview_id):
+            loaded = await run_in_threadpool(self._load, interview_id)
+            if loaded is None:
+                return
+            interview, messages, preferred_language = loaded
+            try:
+                score, feedback = await evaluate_interview(
+                    interview,
+                    messages,
+                    preferred_language,
+                    Deadline(settings.INTERVIEW_EVAL_DEADLINE_SECONDS),
+                )
+            except Exception as exc:
+                error = str(getattr(exc, "detail", "") or exc) or type(exc).__name__
+                delay = await run_in_threadpool(self.fail, interview_id, error)
+                if delay is None:
+                    logger.error(f"Interview {interview_id} evaluation failed for good: {error}")
+                    return
+                logger.warning(f"Interview {interview_id} evaluation failed, retrying in {delay:.1f}s: {error}")
+                await asyncio.sleep(delay)
+                continue
+
+            await run_in_threadpool(self.complete, interview_id, score, feedback)
+            logger.info(f"Interview {interview_id} evaluated: score {score}")
+            return
+
+    async def resume_pending(self) -> None:
+        """Run every job that is due, e.g. ones a restarted worker left behind."""
+        try:
+            interview_ids = await run_in_threadpool(self.due)
+        except Exception as exc:
+            logger.warning(f"Could not look up pending interview evaluations: {exc}")
+            return
+        if interview_ids:
+            logger.info(f"Resuming {len(interview_ids)} interview evaluation(s)")
+            await asyncio.gather(*(self.run(interview_id) for interview_id in interview_ids))
+
+
+# Global instance
+evaluation_jobs = InterviewEvaluationJobs()
@@ -0,0 +1,88 @@
+"""
+Interview transcript storage.
+Messages are rows in interview_messages that are only ever appended, so a
+turn writes its two new messages instead of rewriting the whole transcript,
+and prompts can read just the tail they need.
+"""
+
+from sqlalchemy.orm import Session
+from sqlalchemy.orm.attributes import set_committed_value
+
+from app.models import Interview, InterviewMessage
+
+
+class ConcurrentTurnError(Exception):
+    """The transcript grew, or the interview ended, after it was read."""
+
+
+def message_to_dict(row: InterviewMessage) -> dict:
+    message = {"seq": row.seq, "role": row.role, "content": row.content}
+    if row.assessment:
+        message["assessment"] = row.assessment
+    return message
+
+
+def load_messages(
+    db: Session,
+    interview_id: str,
+    since_seq: int = 0,
+    until_seq: int | None = None,
+) -> list[dict]:
+    """
+    Messages with ``since_seq <= seq < until_seq``, in order, as dicts with
+    ``seq``, ``role``, ``content`` and, for assessed answers, ``assessment``.
+    """
+    query = db.query(InterviewMessage).filter(
+        InterviewMessage.interview_id == interview_id,
+        InterviewMessage.seq >= since_seq,
+    )
+    if until_seq is not None:
+        query = query.filter(InterviewMessage.seq < until_seq)
+    return [message_to_dict(row) for row in query.order_by(InterviewMessage.seq).all()]
+
+
+def append_messages(db: Session, interview: Interview, messages: list[dict]) -> None:
+    """
+    Add ``messages`` after the interview's last message; the caller commits.
+
+    ``Interview.message_count`` is moved on with a compare-and-set against
+    the count the caller read, in the same transaction as the inserts, so
+    of two turns submitted against the same transcript only the first one
+    is saved. ``interview`` may be detached (e.g. cached between turns).
+
+    Raises:
+        ConcurrentTurnError: If the transcript changed since ``interview`` was
+            loaded, or the interview is no longer active
+    """
+    expected = interview.message_count or 0
+    updated = (
+        db.query(Interview)
+        .filter(
+            Interview.id == interview.id,
+            Interview.message_count == expected,
+            Interview.status == "active",
+        )
+        .update({"message_count": expected + len(messages)}, synchronize_session=False)
+    )
+    if updated != 1:
+        raise ConcurrentTurnError(f"Interview {interview.id} changed after it was read at {expected} messages")
+
+    for offset, message in enumerate(messages):
+        db.add(
+            InterviewMessage(
+                interview_id=interview.id,
+                seq=expected + offset,
+                role=message["role"],
+                content=message["content"],
+                assessment=message.get("assessment"),
+            )
+        )
+    set_committed_value(interview, "message_count", expected + len(messages))
+
+
+def set_assessment(db: Session, interview_id: str, seq: int, assessment: dict) -> None:
+    """Attach a micro-assessment to an answer that was saved before it was scored; the caller commits."""
+    db.query(InterviewMessage).filter(
+        InterviewMessage.interview_id == interview_id,
+        InterviewMessage.seq == seq,
+    ).update({"assessment": assessment}, synchronize_session=False)
@@ -0,0 +1,434 @@
+"""
+Live mock-interview sessions (WebSocket).
+A session keeps the interview and its unsummarized transcript tail in memory
+between turns, streams the interviewer's reply as it is generated and saves
+each message as soon as it exists.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import AsyncGenerator, Callable, Coroutine
+
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+from sqlalchemy.orm.attributes import set_committed_value
+
+from app.config import settings
+from app.database import SessionLocal
+from app.models import Interview
+from app.services.bedrock import bedrock_service
+from app.services.interview_context import interview_context
+from app.services.interview_evaluation import (
+    ACTIVE,
+    EVALUATING,
+    assess_answer,
+    evaluation_jobs,
+    question_before,
+)
+from app.services.interview_messages import (
+    ConcurrentTurnError,
+    append_messages,
+    load_messages,
+    set_assessment,
+)
+from app.services.prompts import (
+    INTERVIEW_FOLLOWUP_RULES,
+    get_interview_followup_prompt,
+    get_interview_system_prompt,
+)
+from app.services.telemetry import LATENCY_BUCKETS_MS, Histogram
+from app.utils.deadline import Deadline
+
+logger = logging.getLogger(__name__)
+
+# Same limit as POST /api/interview/respond: 8 Q&A pairs
+MAX_MESSAGES = 16
+
+
+class InterviewSession:
+    """
+    In-memory state of one interview between turns.
+
+    ``interview`` is a detached row kept in step with what the session
+    writes; ``messages`` holds the transcript from
+    ``interview.summarized_messages`` on, as ``load_messages`` dicts.
+    Turns on one session run one at a time under ``lock``.
+    """
+
+    def __init__(self, interview: Interview, messages: list[dict], preferred_language: str | None) -> None:
+        self.interview = interview
+        self.messages = messages
+        self.preferred_language = preferred_language
+        self.lock = asyncio.Lock()
+        self.touched = time.monotonic()
+
+    @property
+    def awaiting_reply(self) -> bool:
+        """True if the last answer was saved but its reply was not (the worker stopped mid-turn)."""
+        return (
+            self.interview.status == ACTIVE
+            and bool(self.messages)
+            and self.messages[-1]["role"] == "user"
+        )
+
+
+class InterviewSessionManager:
+    """
+    Per-worker cache of live interview sessions, and the turn logic.
+
+    Sessions are kept for ``INTERVIEW_SESSION_TTL_SECONDS`` after their
+    last use, at most ``INTERVIEW_SESSION_CACHE_SIZE`` of them, so a
+    reconnecting client does not reload the interview either. Another
+    worker or a REST call may change the interview meanwhile: appends are
+    compare-and-set on ``Interview.message_count``, and on a conflict the
+    session is reloaded and the client told to refresh. Time to first
+    token is measured per turn, from the answer arriving to the first
+    reply chunk being ready to send.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session] = SessionLocal,
+        max_entries: int | None = None,
+        ttl_seconds: float | None = None,
+    ) -> None:
+        self._session_factory = session_factory
+        self._max_entries = max_entries or settings.INTERVIEW_SESSION_CACHE_SIZE
+        self._ttl = ttl_seconds or settings.INTERVIEW_SESSION_TTL_SECONDS
+        self._sessions: OrderedDict[str, InterviewSession] = OrderedDict()
+        self._tasks: set[asyncio.Task] = set()
+        self._lock = threading.Lock()
+        self._loads = 0
+        self._reuses = 0
+        self._conflicts = 0
+        self._turns = 0
+        self._interrupted = 0
+        self._turn_ttft_ms = Histogram(LATENCY_BUCKETS_MS)
+        self._turn_ms = Histogram(LATENCY_BUCKETS_MS)
+
+    # ── Session cache (event loop only) ──────────────────────────────────
+
+    def _cached(self, interview_id: str, user_id: str) -> InterviewSession | None:
+        now = time.monotonic()
+        for key in [key for key, session in self._sessions.items() if now - session.touched > self._ttl]:
+            del self._sessions[key]
+        session = self._sessions.get(interview_id)
+        if session is None or session.interview.user_id != user_id:
+            return None
+        self._sessions.move_to_end(interview_id)
+        session.touched = now
+        return session
+
+    def _remember(self, session: InterviewSession) -> None:
+        self._sessions[session.interview.id] = session
+        self._sessions.move_to_end(session.interview.id)
+        while len(self._sessions) > self._max_entries:
+            self._sessions.popitem(last=False)
+
+    def forget(self, interview_id: str) -> None:
+        self._sessions.pop(interview_id, None)
+
+    def _spawn(self, coroutine: Coroutine) -> None:
+        """Run background work without tying it to the connection."""
+        task = asyncio.create_task(coroutine)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    # ── Database (threadpool) ────────────────────────────────────────────
+
+    def _load(self, interview_id: str, user_id: str) -> tuple[Interview, list[dict]] | None:
+        """The interview (detached once the session closes) and its unsummarized messages."""
+        db = self._session_factory()
+        try:
+            interview = (
+                db.query(Interview)
+                .filter(Interview.id == interview_id, Interview.user_id == user_id)
+                .first()
+            )
+            if interview is None:
+                return None
+            return interview, load_messages(db, interview_id, since_seq=interview.summarized_messages or 0)
+        finally:
+            db.close()
+
+    def _summary_state(self, interview_id: str) -> tuple[str | None, int] | None:
+        db = self._session_factory()
+        try:
+            row = (
+                db.query(Interview.summary, Interview.summarized_messages)
+                .filter(Interview.id == interview_id)
+                .first()
+            )
+            return (row[0], row[1] or 0) if row is not None else None
+        finally:
+            db.close()
+
+    def _append(
+        self,
+        interview: Interview,
+        messages: list[dict],
+        status: str | None = None,
+        assessment: tuple[int, dict] | None = None,
+    ) -> bool:
+        """
+        Save new messages, plus a status change and an earlier answer's
+        assessment, in one transaction.
+
+        Returns:
+            False if the interview changed since the session read it
+        """
+        db = self._session_factory()
+        try:
+            append_messages(db, interview, messages)
+            if status is not None:
+                db.query(Interview).filter(Interview.id == interview.id).update(
+                    {"status": status}, synchronize_session=False
+                )
+            if assessment is not None:
+                set_assessment(db, interview.id, *assessment)
+            db.commit()
+            return True
+        except (ConcurrentTurnError, IntegrityError):
+            db.rollback()
+            return False
+        finally:
+            db.close()
+
+    # ── Sessions ─────────────────────────────────────────────────────────
+
+    async def open(
+        self,
+        interview_id: str,
+        user_id: str,
+        preferred_language: str | None = None,
+    ) -> InterviewSession | None:
+        """
+        The user's session for an interview, from the cache or the database.
+
+        Returns:
+            The session, or None if the user has no such interview
+        """
+        session = self._cached(interview_id, user_id)
+        if session is not None:
+            session.preferred_language = preferred_language
+            with self._lock:
+                self._reuses += 1
+            return session
+
+        loaded = await run_in_threadpool(self._load, interview_id, user_id)
+        if loaded is None:
+            return None
+        with self._lock:
+            self._loads += 1
+        session = InterviewSession(*loaded, preferred_language)
+        self._remember(session)
+        return session
+
+    async def _reload(self, session: InterviewSession) -> None:
+        """Replace the session's state with what is in the database."""
+        loaded = await run_in_threadpool(self._load, session.interview.id, session.interview.user_id)
+        if loaded is None:
+            self.forget(session.interview.id)
+            return
+        session.interview, session.messages = loaded
+        with self._lock:
+            self._conflicts += 1
+
+    def _conflict_event(self) -> dict:
+        return {
+            "type": "error",
+            "detail": "This interview was updated by another request; reload it and try again",
+            "reload": True,
+        }
+
+    async def _queue_evaluation(self, session: InterviewSession) -> None:
+        set_committed_value(session.interview, "status", EVALUATING)
+        self.forget(session.interview.id)
+        if await evaluation_jobs.enqueue_async(session.interview.id):
+            self._spawn(evaluation_jobs.run(session.interview.id))
+
+    async def take_turn(self, session: InterviewSession, text: str | None) -> AsyncGenerator[dict, None]:
+        """
+        Save the candidate's answer and stream the interviewer's reply.
+
+        With ``text=None`` the pending answer of an ``awaiting_reply``
+        session is replied to instead. The answer is saved before the
+        model is called and the reply once it is complete; the answer's
+        assessment runs alongside the stream and is saved with the reply.
+        The caller should consume every event even if its client has gone,
+        so the reply is still saved.
+
+        Yields:
+            Events: ``answer`` (saved, with its seq), ``token`` (reply
+            text as generated), ``reply`` (saved, with ``ttft_ms``),
+            ``ended`` (the answer closed the interview and evaluation was
+            queued) or ``error``
+        """
+        async with session.lock:
+            started = time.monotonic()
+            interview = session.interview
+            session.touched = started
+
+            if interview.status != ACTIVE:
+                yield {"type": "error", "detail": "Interview has already ended"}
+                return
+
+            if text is None:
+                if not session.awaiting_reply:
+                    return
+                answer = session.messages[-1]
+            else:
+                if session.awaiting_reply:
+                    yield {"type": "error", "detail": "The previous answer is still waiting for a reply"}
+                    return
+                answer = {"seq": interview.message_count, "role": "user", "content": text}
+                ending = interview.message_count + 1 >= MAX_MESSAGES
+                saved = await run_in_threadpool(
+                    self._append, interview, [answer], EVALUATING if ending else None
+                )
+                if not saved:
+                    await self._reload(session)
+                    yield self._conflict_event()
+                    return
+                session.messages.append(answer)
+                yield {"type": "answer", "seq": answer["seq"]}
+
+                if ending:
+                    await self._queue_evaluation(session)
+                    yield {"type": "ended", "status": EVALUATING}
+                    return
+
+            deadline = Deadline(settings.LLM_REQUEST_DEADLINE_SECONDS)
+            conversation, last_answer = interview_context.followup_context(interview, session.messages)
+            assessment = None
+            if settings.INTERVIEW_TURN_ASSESSMENT_ENABLED and not answer.get("assessment"):
+                assessment = asyncio.create_task(
+                    assess_answer(
+                        interview,
+                        question_before(session.messages, len(session.messages) - 1),
+                        answer["content"],
+                        deadline,
+                    )
+                )
+
+            chunks: list[str] = []
+            ttft_ms = None
+            interrupted = False
+            try:
+                async for chunk in bedrock_service.stream_model_async(
+                    get_interview_system_prompt(session.preferred_language),
+                    get_interview_followup_prompt(
+                        interview.role,
+                        interview.company,
+                        last_answer,
+                        conversation,
+                        interview.message_count // 2,  # answers so far, this one included
+                    ),
+                    temperature=0.8,
+                    call_site="interview_stream",
+                    cacheable_prefix=INTERVIEW_FOLLOWUP_RULES,
+                    user_id=interview.user_id,
+                    deadline=deadline,
+                ):
+                    if ttft_ms is None:
+                        ttft_ms = (time.monotonic() - started) * 1000
+                    chunks.append(chunk)
+                    yield {"type": "token", "text": chunk}
+            except Exception as exc:
+                interrupted = True
+                logger.warning(f"Interview {interview.id} reply stream failed after {len(chunks)} chunk(s): {exc}")
+
+            content = "".join(chunks).strip()
+            if not content:
+                # Same text the REST endpoint falls back to
+                content = bedrock_service.FALLBACK_RESPONSES["interview"]
+                yield {"type": "token", "text": content}
+
+            scored = await assessment if assessment is not None else None
+            if scored is not None:
+                answer["assessment"] = scored
+            reply = {"seq": interview.message_count, "role": "assistant", "content": content}
+            saved = await run_in_threadpool(
+                self._append,
+                interview,
+                [reply],
+                None,
+                (answer["seq"], scored) if scored is not None else None,
+            )
+            if not saved:
+                await self._reload(session)
+                yield self._conflict_event()
+                return
+            session.messages.append(reply)
+
+            turn_ms = (time.monotonic() - started) * 1000
+            with self._lock:
+                self._turns += 1
+                self._interrupted += interrupted
+                self._turn_ms.observe(turn_ms)
+                if ttft_ms is not None:
+                    self._turn_ttft_ms.observe(ttft_ms)
+            logger.info(
+                f"interview_turn interview={interview.id} seq={reply['seq']} "
+                f"ttft_ms={None if ttft_ms is None else round(ttft_ms)} turn_ms={turn_ms:.0f} "
+                f"interrupted={interrupted}"
+            )
+            yield {
+                "type": "reply",
+                "seq": reply["seq"],
+                "content": content,
+                "ttft_ms": None if ttft_ms is None else round(ttft_ms),
+                "interrupted": interrupted,
+            }
+
+            if interview_context.needs_summary(interview):
+                self._spawn(self._summarize(session))
+
+    async def _summarize(self, session: InterviewSession) -> None:
+        """Fold older messages into the summary, then drop them from the session."""
+        interview_id = session.interview.id
+        await interview_context.summarize(interview_id)
+        state = await run_in_threadpool(self._summary_state, interview_id)
+        if state is None:
+            return
+        summary, start = state
+        async with session.lock:
+            if start <= (session.interview.summarized_messages or 0):
+                return
+            set_committed_value(session.interview, "summary", summary)
+            set_committed_value(session.interview, "summarized_messages", start)
+            session.messages = [message for message in session.messages if message["seq"] >= start]
+
+    async def end(self, session: InterviewSession) -> dict:
+        """
+        End the interview and queue its evaluation, as POST /{id}/end does.
+
+        Returns:
+            The ``ended`` event
+        """
+        async with session.lock:
+            interview = session.interview
+            if interview.score is None:
+                await self._queue_evaluation(session)
+            return {"type": "ended", "status": session.interview.status}
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "cached": len(self._sessions),
+                "loads": self._loads,
+                "reuses": self._reuses,
+                "conflicts": self._conflicts,
+                "turns": self._turns,
+                "interrupted": self._interrupted,
+                "turn_ttft_ms": self._turn_ttft_ms.snapshot(),
+                "turn_ms": self._turn_ms.snapshot(),
+            }
+
+
+# Global instance
+interview_sessions = InterviewSessionManager()
@@ -0,0 +1,119 @@
+"""
+Response cache for Bedrock invocations.
+Provides exact-match caching of model output keyed on the full request.
+"""
+
+import hashlib
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+
+
+def _digest(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def make_cache_key(
+    model_id: str,
+    system_prompt: str,
+    user_prompt: str,
+    temperature: float,
+    max_tokens: int,
+) -> str:
+    """
+    Build an exact-match cache key for a single-turn request.
+
+    Prompts are hashed so keys stay small regardless of prompt length.
+    """
+    return ":".join([
+        model_id,
+        _digest(system_prompt or ""),
+        _digest(user_prompt),
+        f"{temperature:.3f}",
+        str(max_tokens),
+    ])
+
+
+class ResponseCache(ABC):
+    """Interface for response cache backends."""
+
+    @abstractmethod
+    def get(self, key: str) -> str | None:
+        """Return the cached value for ``key`` or None on a miss."""
+
+    @abstractmethod
+    def set(self, key: str, value: str, ttl: float) -> None:
+        """Store ``value`` under ``key`` for ``ttl`` seconds."""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Drop every cached entry."""
+
+    @abstractmethod
+    def stats(self) -> dict:
+        """Return backend counters."""
+
+
+class InMemoryLRUCache(ResponseCache):
+    """
+    Bounded, thread-safe LRU cache with per-entry TTL.
+
+    Safe to share between the event loop and threadpool workers; every
+    operation is O(1) under a single lock.
+    """
+
+    def __init__(self, max_entries: int = 1024) -> None:
+        self.max_entries = max(1, max_entries)
+        self._entries: OrderedDict[str, tuple[float, str]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    def get(self, key: str) -> str | None:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+
+            expires_at, value = entry
+            if expires_at <= now:
+                del self._entries[key]
+                self._expirations += 1
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def set(self, key: str, value: str, ttl: float) -> None:
+        expires_at = time.monotonic() + ttl
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "backend": "memory",
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": round(self._hits / lookups, 4) if lookups else 0.0,
+                "evictions": self._evictions,
+                "expirations": self._expirations,
+            }
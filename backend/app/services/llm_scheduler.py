@@ -0,0 +1,89 @@
+"""
+Priority classes and the fair wait queue for Bedrock calls.
+Interactive work is admitted before standard and background work, and
+within a class users are served round-robin so one busy user cannot starve
+the rest.
+"""
+
+from collections import OrderedDict, deque
+from typing import Any
+
+INTERACTIVE = "interactive"  # a student is waiting on the reply (interview turns, explain)
+STANDARD = "standard"        # user-initiated generation (roadmap weeks, evaluation)
+BACKGROUND = "background"    # nobody is waiting (pre-generation, translation backfills)
+
+# Highest priority first
+PRIORITY_CLASSES = (INTERACTIVE, STANDARD, BACKGROUND)
+
+# Waiters without a user share one fairness bucket
+ANONYMOUS = "-"
+
+
+class FairPriorityQueue:
+    """
+    Waiters grouped by priority class, then by user.
+
+    ``pop`` serves the oldest waiter of the user at the head of the class's
+    rotation and moves that user to the back, so each user with waiting
+    calls gets one slot per round.
+    """
+
+    def __init__(self) -> None:
+        self._classes: dict[str, OrderedDict[str, deque]] = {
+            priority: OrderedDict() for priority in PRIORITY_CLASSES
+        }
+        self._depths = dict.fromkeys(PRIORITY_CLASSES, 0)
+
+    def __len__(self) -> int:
+        return sum(self._depths.values())
+
+    def depth(self, priority: str) -> int:
+        return self._depths[priority]
+
+    def waiting_users(self, priority: str) -> int:
+        return len(self._classes[priority])
+
+    def waiting_at_or_above(self, priority: str) -> bool:
+        """True if anything of ``priority`` or a higher class is queued."""
+        for cls in PRIORITY_CLASSES:
+            if self._depths[cls]:
+                return True
+            if cls == priority:
+                return False
+        return False
+
+    def push(self, priority: str, user: str | None, item: Any) -> None:
+        users = self._classes[priority]
+        key = user or ANONYMOUS
+        if key not in users:
+            users[key] = deque()
+        users[key].append(item)
+        self._depths[priority] += 1
+
+    def pop(self, priority: str) -> Any:
+        """Remove and return the next waiter of ``priority`` (round-robin over users)."""
+        users = self._classes[priority]
+        key, items = next(iter(users.items()))
+        item = items.popleft()
+        if items:
+            users.move_to_end(key)
+        else:
+            del users[key]
+        self._depths[priority] -= 1
+        return item
+
+    def remove(self, priority: str, user: str | None, item: Any) -> bool:
+        """Drop a waiter that gave up; returns False if it was already popped."""
+        users = self._classes[priority]
+        key = user or ANONYMOUS
+        items = users.get(key)
+        if items is None:
+            return False
+        try:
+            items.remove(item)
+        except ValueError:
+            return False
+        if not items:
+            del users[key]
+        self._depths[priority] -= 1
+        return True
@@ -78,6 +78,16 @@ For Hindi/Regional language responses: Accept and respond in Hinglish or simple
 
 IMPORTANT: Always respond as the interviewer in plain text (NOT JSON). Be natural and conversational."""
 
+# Names used when asking the interviewer to converse in the candidate's language
+INTERVIEW_LANGUAGE_NAMES = {
+    "en": "English",
+    "hi": "Hindi",
+    "ta": "Tamil",
+    "te": "Telugu",
+    "bn": "Bengali",
+    "mr": "Marathi",
+}
+
 
 JD_SYSTEM_PROMPT = """You are an expert at analyzing job descriptions for Indian tech companies and mapping required skills against a candidate's profile. You help students understand skill gaps for campus placement roles.
 
@@ -481,8 +491,14 @@ def get_roadmap_week_prompt(
     plan: list,
     previous_themes: list[str] | None = None,
     resource_context: str | None = None,
+    completed_days: list[dict] | None = None,
 ) -> str:
-    """Generate a single week's detailed content given the overall plan context."""
+    """
+    Generate a single week's detailed content given the overall plan context.
+
+    ``completed_days`` are days already saved from an interrupted generation;
+    the model is asked to continue after them instead of starting over.
+    """
     college_tier = user_profile.get("college_tier", "tier2")
     is_cs = user_profile.get("is_cs_background", False)
     target_role = user_profile.get("target_role", "Software Engineer")
@@ -521,6 +537,18 @@ def get_roadmap_week_prompt(
     if resource_context:
         resource_section = f"\nRESOURCE CATALOG:\n{resource_context}\nUse ONLY these URLs for this week."
 
+    resume_context = ""
+    if completed_days:
+        next_day = len(completed_days) + 1
+        done = ", ".join(
+            f"Day {d.get('day', i + 1)}: {d.get('title', '?')}"
+            for i, d in enumerate(completed_days) if isinstance(d, dict)
+        )
+        resume_context = (
+            f"Days already generated: {done}. Do NOT repeat them — put ONLY days "
+            f"{next_day} to {days_per_week} in \"days\", numbered from {next_day}."
+        )
+
     return f"""Generate DETAILED content for Week {week_number} of a placement roadmap.
 
 STUDENT: {college_tier.upper()} | Target: {target_role} at {companies_str}
@@ -534,6 +562,7 @@ CURRENT WEEK TO GENERATE: Week {week_number}
 Theme: {theme}
 Focus: {focus}
 {prev_context}
+{resume_context}
 
 OUTPUT: Return JSON for this single week:
 {{
@@ -570,15 +599,15 @@ RULES:
 # INTERVIEW PROMPTS
 # ═══════════════════════════════════════════════════════════════════════════════
 
-def get_interview_start_prompt(role: str, company: str | None, user_level: str = "intermediate") -> str:
-    """Generate the initial prompt for starting a mock interview."""
-    company_str = company if company else "a top tech company"
-    
-    company_specific = ""
-    if company:
-        company_lower = company.lower()
-        if any(x in company_lower for x in ["tcs", "infosys", "wipro", "cognizant", "capgemini"]):
-            company_specific = """
+# Companies whose interview format the prompts describe specifically;
+# matched as substrings of the lower-cased company name.
+SERVICE_COMPANIES = ("tcs", "infosys", "wipro", "cognizant", "capgemini")
+PRODUCT_COMPANIES = ("amazon", "microsoft", "google", "flipkart", "adobe")
+
+INTERVIEW_COMPANY_BUCKETS = ("service", "product", "startup", "generic")
+
+_INTERVIEW_FORMATS = {
+    "service": """
 Company Type: SERVICE COMPANY
 Interview Format:
   Round 1: Online aptitude test (quantitative, logical, verbal) + basic coding (1-2 easy problems)
@@ -591,9 +620,8 @@ Focus your questions on:
 - SQL: Write a query to find second highest salary, GROUP BY, HAVING clause
 - Basic coding: Reverse a string, check palindrome, find max in array, basic sorting
 - CS basics: What is TCP/IP? Difference between process and thread? What is virtual memory?
-- HR-style: Why do you want to join us? Where do you see yourself in 5 years?"""
-        elif any(x in company_lower for x in ["amazon", "microsoft", "google", "flipkart", "adobe"]):
-            company_specific = """
+- HR-style: Why do you want to join us? Where do you see yourself in 5 years?""",
+    "product": """
 Company Type: PRODUCT COMPANY
 Interview Format:
   Round 1: Online coding test (2-3 medium/hard DSA problems, 60-90 min)
@@ -607,9 +635,8 @@ Focus your questions on:
 - Follow-up: "Can you optimize this?", "What if the input is very large?", "What edge cases would you handle?"
 - Amazon specifically: Ask about Leadership Principles — "Tell me about a time you took ownership of a failing project"
 - Microsoft: Focus on clean code and design thinking
-- Google: Focus on optimal solutions and mathematical reasoning"""
-        elif "startup" in company_lower:
-            company_specific = """
+- Google: Focus on optimal solutions and mathematical reasoning""",
+    "startup": """
 Company Type: STARTUP
 Interview Format:
   Round 1: Coding challenge or take-home assignment
@@ -620,8 +647,42 @@ Focus your questions on:
 - Practical skills: "How would you build a REST API for user authentication?"
 - Framework knowledge: "Explain the difference between SQL and NoSQL — when would you use each?"
 - System thinking: "Design a basic URL shortener", "How would you handle 1000 concurrent users?"
-- Project deep-dive: Ask about their personal projects, tech choices, challenges faced"""
+- Project deep-dive: Ask about their personal projects, tech choices, challenges faced""",
+}
+
+# Stands in for the company name in pre-generated opening questions
+OPENING_COMPANY_PLACEHOLDER = "{company}"
+
+
+def interview_company_bucket(company: str | None) -> str:
+    """Interview format bucket for a company: service, product, startup or generic."""
+    company_lower = (company or "").lower()
+    if any(x in company_lower for x in SERVICE_COMPANIES):
+        return "service"
+    if any(x in company_lower for x in PRODUCT_COMPANIES):
+        return "product"
+    if "startup" in company_lower:
+        return "startup"
+    return "generic"
+
+
+def get_interview_system_prompt(preferred_language: str | None) -> str:
+    """Interviewer system prompt, asking for the candidate's language when it is not English."""
+    language_code = (preferred_language or "en").lower()
+    if language_code == "en":
+        return INTERVIEW_SYSTEM_PROMPT
+
+    language_name = INTERVIEW_LANGUAGE_NAMES.get(language_code, preferred_language or "English")
+    return (
+        f"{INTERVIEW_SYSTEM_PROMPT}\n\n"
+        f"Conduct this interview primarily in {language_name}. "
+        f"Keep technical terms (data structures, algorithms, API names) in English "
+        f"but explain and converse in {language_name}."
+    )
+
 
+def _interview_opening_brief(role: str, company_str: str, bucket: str, user_level: str) -> str:
+    company_specific = _INTERVIEW_FORMATS.get(bucket, "")
     return f"""You are starting a mock interview for a {role} position at {company_str} for an Indian campus placement.
 
 Candidate level: {user_level}
@@ -637,14 +698,47 @@ IMPORTANT: Ask ONLY the introduction question in this first message. Do NOT ask
 For Tier-2/3 college students: Be encouraging and help them feel comfortable. The goal is to build confidence while assessing skills genuinely."""
 
 
-def get_interview_evaluate_prompt(role: str, company: str | None, messages: list) -> str:
-    """Generate prompt for evaluating a completed mock interview."""
+def get_interview_start_prompt(role: str, company: str | None, user_level: str = "intermediate") -> str:
+    """Generate the initial prompt for starting a mock interview."""
     company_str = company if company else "a top tech company"
-    conversation = "\n".join(
-        f"{'Interviewer' if m['role'] == 'assistant' else 'Candidate'}: {m['content']}"
-        for m in messages
-    )
-    
+    bucket = interview_company_bucket(company) if company else "generic"
+    return _interview_opening_brief(role, company_str, bucket, user_level)
+
+
+INTERVIEW_OPENING_BANK_SYSTEM_PROMPT = """You write the opening messages that an experienced, friendly technical interviewer sends at the start of mock interviews for Indian campus placements. You always answer with raw JSON only."""
+
+
+def get_interview_opening_bank_prompt(
+    role: str,
+    company_bucket: str,
+    language: str,
+    count: int,
+    user_level: str = "intermediate",
+) -> str:
+    """
+    Generate prompt for a batch of interchangeable opening messages for the
+    interview question bank.
+
+    The model writes OPENING_COMPANY_PLACEHOLDER wherever the company name
+    goes; it is filled in when an opening is served.
+    """
+    brief = _interview_opening_brief(role, OPENING_COMPANY_PLACEHOLDER, company_bucket, user_level)
+    language_code = (language or "en").lower()
+    language_name = INTERVIEW_LANGUAGE_NAMES.get(language_code, language)
+    language_rule = ""
+    if language_code != "en":
+        language_rule = f"\n- Write every version in {language_name}, keeping technical terms in English"
+    return f"""{brief}
+
+Write {count} different versions of this opening message. Each version must work on its own as the interviewer's first message.
+- Vary the interviewer's name, title, greeting and wording; do not reuse the same sentence across versions
+- Wherever the company name belongs, write exactly {OPENING_COMPANY_PLACEHOLDER} (including the braces) and never a real company name{language_rule}
+
+CRITICAL: Respond ONLY with a JSON array of {count} strings, one opening message per string. No markdown, no extra text."""
+
+
+def _interview_evaluation_criteria(company: str | None) -> str:
+    """Company-type scoring criteria for the evaluation prompts ("" if none apply)."""
     company_criteria = ""
     if company:
         company_lower = company.lower()
@@ -664,13 +758,25 @@ Product Company Scoring Criteria:
 - Communication of thought process (20%): Can they explain their approach clearly?
 - Edge case handling (15%): Do they consider boundary conditions, empty inputs, large inputs?
 - Follow-up handling (10%): Can they optimize when asked? Handle variations?"""
+    return company_criteria
+
+
+def get_interview_evaluate_prompt(role: str, company: str | None, transcript: str) -> str:
+    """
+    Generate prompt for evaluating a completed mock interview.
+
+    ``transcript`` comes from InterviewContextManager.evaluation_transcript:
+    a summary of earlier exchanges plus the later ones verbatim.
+    """
+    company_str = company if company else "a top tech company"
+    company_criteria = _interview_evaluation_criteria(company)
 
     return f"""Evaluate this mock interview for a {role} position at {company_str}.
 
 CRITICAL: Respond ONLY with a single valid JSON object. No markdown, no extra text.
 
 **Interview Transcript:**
-{conversation}
+{transcript}
 
 **Provide your evaluation as this exact JSON structure:**
 {{
@@ -702,13 +808,154 @@ Score honestly: 1-3 = not ready, 4-5 = needs work, 6-7 = getting there, 8-10 = r
 Include real resource URLs in recommended_resources (LeetCode, GFG, YouTube channels, etc.)."""
 
 
-def get_interview_followup_prompt(role: str, company: str | None, last_answer: str, context: list) -> str:
-    """Generate prompt for continuing an interview based on the last answer."""
+INTERVIEW_SUMMARY_SYSTEM_PROMPT = """You keep running notes on a mock technical interview so the interviewer can continue it and score it later without rereading the transcript. Write plain, factual notes. Never invent anything the candidate did not say."""
+
+
+def get_interview_summary_prompt(
+    role: str,
+    company: str | None,
+    previous_summary: str | None,
+    transcript: str,
+    max_words: int,
+) -> str:
+    """Generate the prompt that folds new exchanges into an interview's running summary."""
+    company_str = company if company else "a top tech company"
+    previous = previous_summary or "(none yet - these are the first exchanges)"
+    return f"""Mock interview for {role} at {company_str}.
+
+**Notes so far:**
+{previous}
+
+**New exchanges to add:**
+{transcript}
+
+Rewrite the notes to cover everything above in at most {max_words} words. For each question asked, record:
+- the topic/question in a few words
+- what the candidate answered: approach, correctness, complexity stated, code quality if they wrote code
+- hints given and how they responded
+Keep concrete evidence (e.g. "missed the empty-array case", "gave O(n log n), optimal is O(n)") because the final score is based on these notes.
+Output only the notes as short bullet points."""
+
+
+INTERVIEW_ASSESSMENT_SYSTEM_PROMPT = """You score single answers from mock technical interviews for Indian campus placements. Judge only what the candidate actually said, and be fair to Tier-2/3 students who may explain less polishedly. Always answer with raw JSON only."""
+
+
+def get_interview_answer_assessment_prompt(
+    role: str,
+    company: str | None,
+    question: str,
+    answer: str,
+) -> str:
+    """Generate the prompt that scores one candidate answer as soon as it arrives."""
+    company_str = company if company else "a top tech company"
+    return f"""Mock interview for {role} at {company_str}.
+
+**Interviewer asked:**
+{question}
+
+**Candidate answered:**
+{answer}
+
+Score this one answer from 1 to 10 on each dimension, or null when the answer gives no evidence for it (a self-introduction, for example, says nothing about problem solving):
+- technical_score: correctness and depth of the technical content
+- communication_score: clarity and structure of the explanation
+- problem_solving_score: approach, reasoning, complexity and edge cases
+
+Score honestly: 1-3 = not ready, 4-5 = needs work, 6-7 = getting there, 8-10 = ready.
+
+Respond ONLY with this JSON object:
+{{"technical_score": <1-10 or null>, "communication_score": <1-10 or null>, "problem_solving_score": <1-10 or null>, "topic": "<question topic in 2-5 words>", "note": "<one sentence of concrete evidence from the answer>"}}"""
+
+
+def get_interview_feedback_prompt(
+    role: str,
+    company: str | None,
+    scores: dict,
+    turn_notes: str,
+    transcript: str,
+) -> str:
+    """
+    Generate prompt for the written feedback of a completed mock interview
+    whose scores were already aggregated from per-answer assessments.
+
+    ``turn_notes`` has one line per assessed answer; ``transcript`` is a
+    short excerpt for quoting, not the basis for scoring.
+    """
+    company_str = company if company else "a top tech company"
+    company_criteria = _interview_evaluation_criteria(company)
+
+    return f"""Write the feedback for this mock interview for a {role} position at {company_str}.
+
+CRITICAL: Respond ONLY with a single valid JSON object. No markdown, no extra text.
+
+**Final scores (1-10, already decided from per-answer assessments; do not change them):**
+- Technical: {scores["technical_score"]}
+- Problem solving: {scores["problem_solving_score"]}
+- Communication: {scores["communication_score"]}
+
+**Per-answer assessments:**
+{turn_notes}
+
+**Transcript excerpt:**
+{transcript}
+
+**Provide your feedback as this exact JSON structure:**
+{{
+    "feedback": "2-3 sentence overall assessment consistent with the scores. Be honest but encouraging. Mention what they did well and what needs work.",
+    "strengths": ["specific strength 1 with example from the interview", "specific strength 2"],
+    "improvements": ["specific area to improve with actionable advice", "another specific area"],
+    "readiness_level": "not_ready|getting_ready|ready|very_ready",
+    "next_steps": [
+        "Specific action item 1 (e.g., 'Solve 20 LeetCode Easy array problems this week')",
+        "Specific action item 2 (e.g., 'Review DBMS normalization from GFG')",
+        "Specific action item 3"
+    ],
+    "recommended_resources": [
+        {{"title": "Resource name", "url": "https://real-url.com", "reason": "Why this helps"}},
+        {{"title": "Resource name", "url": "https://real-url.com", "reason": "Why this helps"}}
+    ],
+    "company_fit": "1-2 sentence assessment of how well the candidate fits {company_str} specifically"
+}}
+
+{company_criteria}
+
+Base everything ONLY on what the candidate actually said.
+Include real resource URLs in recommended_resources (LeetCode, GFG, YouTube channels, etc.)."""
+
+
+# Static part of every follow-up turn. Sent ahead of the per-turn text as a
+# cacheable prefix, so it must not contain anything interview-specific.
+INTERVIEW_FOLLOWUP_RULES = """You are continuing a mock interview. For every reply:
+
+**RULES (follow strictly):**
+1. First give BRIEF feedback on their answer (1-2 sentences max). Be specific: "Good, you correctly identified X" or "You missed Y, but your approach was right"
+2. Then ask the NEXT question. ONE question only. Be clear and specific.
+3. If they struggled: Hint or simplify. Don't repeat the same question.
+4. If they did well: Increase difficulty or ask a follow-up on the same topic.
+5. If they gave a coding answer: Ask about time complexity, edge cases, or an optimization.
+6. Keep it conversational — like a real interviewer, not a quiz bot.
+7. NEVER break character. You are the interviewer.
+8. For non-native English speakers: Judge technical accuracy, not grammar.
+9. Do NOT list multiple questions. Ask exactly ONE.
+10. Do NOT say "Let's move on to the next question" — just ask it naturally."""
+
+
+def get_interview_followup_prompt(
+    role: str,
+    company: str | None,
+    last_answer: str,
+    conversation: str,
+    exchange_count: int,
+) -> str:
+    """
+    Generate the per-turn part of the prompt for continuing an interview.
+
+    ``conversation`` is everything before ``last_answer`` (see
+    InterviewContextManager.followup_context); ``exchange_count`` counts
+    candidate answers including the latest. Send it with
+    INTERVIEW_FOLLOWUP_RULES as the cacheable prefix.
+    """
     company_str = company if company else "a top tech company"
-    
-    # Count how many Q&A exchanges have happened
-    candidate_msgs = [m for m in context if m.get('role') == 'user']
-    exchange_count = len(candidate_msgs)
     
     # Determine interview phase based on exchange count (8 total exchanges)
     if exchange_count <= 2:
@@ -744,8 +991,8 @@ def get_interview_followup_prompt(role: str, company: str | None, last_answer: s
 
     return f"""Continue the mock interview for {role} at {company_str}.
 
-**Conversation so far (last 6 messages):**
-{"\n".join(f"{'Interviewer' if m['role'] == 'assistant' else 'Candidate'}: {m['content']}" for m in context[-6:])}
+**Conversation so far:**
+{conversation}
 
 **Candidate's latest answer:**
 {last_answer}
@@ -754,19 +1001,7 @@ def get_interview_followup_prompt(role: str, company: str | None, last_answer: s
 
 {phase_instruction}
 
-**RULES (follow strictly):**
-1. First give BRIEF feedback on their answer (1-2 sentences max). Be specific: "Good, you correctly identified X" or "You missed Y, but your approach was right"
-2. Then ask the NEXT question. ONE question only. Be clear and specific.
-3. If they struggled: Hint or simplify. Don't repeat the same question.
-4. If they did well: Increase difficulty or ask a follow-up on the same topic.
-5. If they gave a coding answer: Ask about time complexity, edge cases, or an optimization.
-6. Keep it conversational — like a real interviewer, not a quiz bot.
-7. NEVER break character. You are the interviewer.
-8. For non-native English speakers: Judge technical accuracy, not grammar.
-9. Do NOT list multiple questions. Ask exactly ONE.
-10. Do NOT say "Let's move on to the next question" — just ask it naturally.
-
-Respond as the interviewer in natural conversational tone. No JSON. No labels. Just speak as the interviewer would."""
+Follow the RULES above. Respond as the interviewer in natural conversational tone. No JSON. No labels. Just speak as the interviewer would."""
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
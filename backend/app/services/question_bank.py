@@ -0,0 +1,203 @@
+"""
+Bank of pre-generated interview opening questions.
+Openings are generated offline per (role, company bucket, language) by
+scripts.fill_interview_question_bank and sampled when an interview starts,
+so Bedrock is only needed for combinations the bank does not cover.
+"""
+
+import json
+import logging
+import random
+import re
+import threading
+from typing import Callable
+
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.database import SessionLocal
+from app.models import Interview, InterviewMessage, InterviewOpening
+from app.services.llm_cache import InMemoryLRUCache
+from app.services.prompts import OPENING_COMPANY_PLACEHOLDER, interview_company_bucket
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_role(role: str) -> str:
+    """Bank key for a role: "SDE" -> "sde", "Cloud Engineer" -> "cloud_engineer"."""
+    return re.sub(r"[^a-z0-9]+", "_", (role or "").lower()).strip("_")
+
+
+class InterviewQuestionBank:
+    """
+    Opening questions keyed on (role key, company bucket, language).
+
+    The company bucket is the interview format the start prompt would pick
+    (service, product, startup, generic), so a banked opening matches what
+    Bedrock would have been asked for; the company name itself is stored
+    as OPENING_COMPANY_PLACEHOLDER and filled in when served. Each key's
+    pool is cached per process for ``POOL_TTL`` seconds, empty pools
+    included, so a freshly filled bank is picked up within that window.
+    """
+
+    POOL_TTL = 600  # seconds
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session] = SessionLocal,
+        memory_entries: int = 512,
+    ) -> None:
+        self._session_factory = session_factory
+        self._memory = InMemoryLRUCache(max_entries=memory_entries)
+        self._lock = threading.Lock()
+        self._served = 0
+        self._misses = 0
+
+    @staticmethod
+    def key(role: str, company: str | None, language: str | None) -> tuple[str, str, str]:
+        """(role key, company bucket, language) an interview start is served from."""
+        return normalize_role(role), interview_company_bucket(company), (language or "en").lower()
+
+    @staticmethod
+    def render(question: str, company: str | None) -> str:
+        return question.replace(OPENING_COMPANY_PLACEHOLDER, company or "a top tech company")
+
+    def _pool(self, db: Session, key: tuple[str, str, str]) -> list[str]:
+        memory_key = ":".join(key)
+        cached = self._memory.get(memory_key)
+        if cached is not None:
+            return json.loads(cached)
+
+        role_key, company_bucket, language = key
+        rows = (
+            db.query(InterviewOpening.question)
+            .filter(
+                InterviewOpening.role_key == role_key,
+                InterviewOpening.company_bucket == company_bucket,
+                InterviewOpening.language == language,
+            )
+            .all()
+        )
+        pool = [question for (question,) in rows]
+        self._memory.set(memory_key, json.dumps(pool), self.POOL_TTL)
+        return pool
+
+    @staticmethod
+    def _recent_openings(db: Session, user_id: str, limit: int) -> set[str]:
+        """First messages of the user's latest interviews."""
+        rows = (
+            db.query(InterviewMessage.content)
+            .join(Interview, Interview.id == InterviewMessage.interview_id)
+            .filter(Interview.user_id == user_id, InterviewMessage.seq == 0)
+            .order_by(Interview.created_at.desc())
+            .limit(limit)
+            .all()
+        )
+        return {content for (content,) in rows}
+
+    def sample(
+        self,
+        role: str,
+        company: str | None,
+        language: str | None,
+        user_id: str | None = None,
+    ) -> str | None:
+        """
+        Return a random banked opening for this interview, company filled in.
+
+        Openings the user saw in their last ``INTERVIEW_BANK_AVOID_RECENT``
+        interviews are skipped while the pool has others. Blocking; async
+        callers should use ``sample_async``.
+
+        Returns:
+            The opening message, or None if the bank has nothing for the key
+        """
+        key = self.key(role, company, language)
+        db = self._session_factory()
+        try:
+            pool = self._pool(db, key)
+            if not pool:
+                with self._lock:
+                    self._misses += 1
+                return None
+
+            candidates = [self.render(question, company) for question in pool]
+            if user_id and settings.INTERVIEW_BANK_AVOID_RECENT > 0:
+                recent = self._recent_openings(db, user_id, settings.INTERVIEW_BANK_AVOID_RECENT)
+                candidates = [question for question in candidates if question not in recent] or candidates
+        finally:
+            db.close()
+
+        with self._lock:
+            self._served += 1
+        return random.choice(candidates)
+
+    async def sample_async(
+        self,
+        role: str,
+        company: str | None,
+        language: str | None,
+        user_id: str | None = None,
+    ) -> str | None:
+        return await run_in_threadpool(self.sample, role, company, language, user_id)
+
+    def count(self, role_key: str, company_bucket: str, language: str) -> int:
+        """Number of banked openings for a key (read from the database)."""
+        db = self._session_factory()
+        try:
+            return (
+                db.query(InterviewOpening)
+                .filter(
+                    InterviewOpening.role_key == role_key,
+                    InterviewOpening.company_bucket == company_bucket,
+                    InterviewOpening.language == language,
+                )
+                .count()
+            )
+        finally:
+            db.close()
+
+    def add(self, role_key: str, company_bucket: str, language: str, questions: list[str]) -> int:
+        """
+        Store generated openings for a key, skipping ones already banked.
+
+        Returns:
+            Number of openings inserted
+        """
+        db = self._session_factory()
+        try:
+            existing = set(self._pool(db, (role_key, company_bucket, language)))
+            inserted = 0
+            for question in questions:
+                question = question.strip()
+                if not question or question in existing:
+                    continue
+                db.add(
+                    InterviewOpening(
+                        role_key=role_key,
+                        company_bucket=company_bucket,
+                        language=language,
+                        question=question,
+                    )
+                )
+                existing.add(question)
+                inserted += 1
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+        self._memory.set(":".join((role_key, company_bucket, language)), json.dumps(sorted(existing)), self.POOL_TTL)
+        logger.info(f"Banked {inserted} interview opening(s) for {role_key}/{company_bucket}/{language}")
+        return inserted
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"served": self._served, "misses": self._misses, "pools": self._memory.stats()}
+
+
+# Global instance
+question_bank = InterviewQuestionBank()
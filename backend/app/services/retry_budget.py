@@ -0,0 +1,57 @@
+"""
+Process-wide retry budget for upstream AI service calls.
+Every first attempt earns a fraction of a retry token and every retry
+spends one, so during an outage retries stay a fixed share of traffic
+instead of multiplying it.
+"""
+
+import threading
+
+
+class RetryBudget:
+    """
+    Thread-safe token bucket shared by all retry loops of a service.
+
+    Each call's first attempt deposits ``ratio`` tokens and each retry
+    withdraws one, so over time retries are at most ``ratio`` of first
+    attempts. The bucket holds at most ``max_tokens`` (and starts full),
+    which allows a short burst of retries after a quiet period.
+    """
+
+    def __init__(self, name: str, ratio: float = 0.1, max_tokens: float = 10.0) -> None:
+        self.name = name
+        self.ratio = max(0.0, ratio)
+        self.max_tokens = max(1.0, max_tokens)
+        self._lock = threading.Lock()
+        self._tokens = self.max_tokens
+        self._requests = 0
+        self._retries = 0
+        self._denied = 0
+
+    def record_request(self) -> None:
+        """Count a call's first attempt."""
+        with self._lock:
+            self._requests += 1
+            self._tokens = min(self.max_tokens, self._tokens + self.ratio)
+
+    def try_spend(self) -> bool:
+        """Take one token for a retry; False means the retry must not be sent."""
+        with self._lock:
+            if self._tokens >= 1.0:
+                self._tokens -= 1.0
+                self._retries += 1
+                return True
+            self._denied += 1
+            return False
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "name": self.name,
+                "ratio": self.ratio,
+                "max_tokens": self.max_tokens,
+                "tokens": round(self._tokens, 2),
+                "requests": self._requests,
+                "retries": self._retries,
+                "retries_denied": self._denied,
+            }
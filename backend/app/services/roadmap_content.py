@@ -0,0 +1,89 @@
+"""
+Compare-and-swap writes to Roadmap.content.
+Every edit bumps Roadmap.version; an edit that lost the race is re-applied
+to the latest content, so concurrent changes to different weeks or tasks
+merge instead of overwriting each other.
+"""
+
+import copy
+import logging
+from typing import Any, Callable
+
+from sqlalchemy import select, update
+from sqlalchemy.orm import Session
+from sqlalchemy.orm.attributes import set_committed_value
+
+from app.models import Roadmap
+
+logger = logging.getLogger(__name__)
+
+MAX_ATTEMPTS = 5
+
+
+class RoadmapConflictError(Exception):
+    """A content edit could not be applied on top of concurrent changes."""
+
+
+def update_roadmap_content(
+    db: Session,
+    roadmap: Roadmap,
+    mutate: Callable[[dict], bool | None],
+    max_attempts: int = MAX_ATTEMPTS,
+    **values: Any,
+) -> bool:
+    """
+    Apply ``mutate`` to a copy of the roadmap content and write it back if
+    nobody changed the roadmap in between.
+
+    ``mutate`` edits the dict in place and returns False when there is
+    nothing to write. It may run several times, each time on the latest
+    content, so it must only express its own edit (e.g. "set this task's
+    flag"), never restore a whole stale document. ``values`` are other
+    columns written in the same UPDATE. The UPDATE joins the caller's
+    transaction; the caller commits.
+
+    Args:
+        db: Session whose transaction the write joins
+        roadmap: Roadmap to edit; its content/version are kept current
+        mutate: In-place edit of the content dict
+        max_attempts: Version mismatches tolerated before giving up
+        **values: Extra Roadmap columns to set
+
+    Returns:
+        True if the content was written, False if ``mutate`` declined
+
+    Raises:
+        RoadmapConflictError: The roadmap kept changing or was deleted
+    """
+    for _ in range(max_attempts):
+        expected = roadmap.version or 1
+        content = copy.deepcopy(roadmap.content or {})
+        if mutate(content) is False:
+            return False
+
+        result = db.execute(
+            update(Roadmap)
+            .where(Roadmap.id == roadmap.id, Roadmap.version == expected)
+            .values(content=content, version=expected + 1, **values)
+            .execution_options(synchronize_session=False)
+        )
+        if result.rowcount == 1:
+            set_committed_value(roadmap, "content", content)
+            set_committed_value(roadmap, "version", expected + 1)
+            for key, value in values.items():
+                set_committed_value(roadmap, key, value)
+            return True
+
+        latest = db.execute(
+            select(Roadmap.content, Roadmap.version).where(Roadmap.id == roadmap.id)
+        ).first()
+        if latest is None:
+            raise RoadmapConflictError(f"Roadmap {roadmap.id} was deleted")
+        logger.info(
+            f"Roadmap {roadmap.id} changed concurrently (version {expected} -> {latest.version}); "
+            "re-applying edit"
+        )
+        set_committed_value(roadmap, "content", latest.content)
+        set_committed_value(roadmap, "version", latest.version)
+
+    raise RoadmapConflictError(f"Roadmap {roadmap.id} changed {max_attempts} times during one edit")
@@ -0,0 +1,133 @@
+"""
+Request coalescing ("singleflight") for upstream AWS calls.
+Concurrent callers with the same key share one upstream call and its result.
+"""
+
+import asyncio
+import threading
+from typing import Awaitable, Callable, TypeVar
+
+T = TypeVar("T")
+
+
+class _Counters:
+    """Counters shared by the thread and asyncio implementations."""
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.calls = 0
+        self.upstream_calls = 0
+        self.coalesced = 0
+
+    def snapshot(self, in_flight: int) -> dict:
+        return {
+            "name": self.name,
+            "calls": self.calls,
+            "upstream_calls": self.upstream_calls,
+            "coalesced": self.coalesced,
+            "coalesced_rate": round(self.coalesced / self.calls, 4) if self.calls else 0.0,
+            "in_flight": in_flight,
+        }
+
+
+class _ThreadCall:
+    __slots__ = ("event", "result", "error")
+
+    def __init__(self) -> None:
+        self.event = threading.Event()
+        self.result = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight:
+    """Coalesces identical blocking calls made from different threads."""
+
+    def __init__(self, name: str) -> None:
+        self._calls: dict[str, _ThreadCall] = {}
+        self._lock = threading.Lock()
+        self._counters = _Counters(name)
+
+    def do(self, key: str, fn: Callable[[], T]) -> T:
+        """
+        Run ``fn`` unless an identical call is already in flight, in which
+        case wait for it and return (or raise) its outcome.
+        """
+        with self._lock:
+            self._counters.calls += 1
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = _ThreadCall()
+                self._calls[key] = call
+                self._counters.upstream_calls += 1
+            else:
+                self._counters.coalesced += 1
+
+        if not leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as exc:
+            call.error = exc
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.event.set()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return self._counters.snapshot(len(self._calls))
+
+
+class AsyncSingleFlight:
+    """
+    Coalesces identical awaitable calls on one event loop.
+
+    The upstream call runs in its own task so that one caller being
+    cancelled does not fail the others; it is only cancelled once every
+    waiting caller has gone away.
+    """
+
+    def __init__(self, name: str) -> None:
+        self._calls: dict[str, tuple[asyncio.Task, list[int]]] = {}
+        self._counters = _Counters(name)
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[T]]) -> T:
+        """Await ``fn()`` or join an identical call that is already in flight."""
+        self._counters.calls += 1
+        entry = self._calls.get(key)
+        if entry is None:
+            task = asyncio.ensure_future(fn())
+            entry = (task, [0])
+            self._calls[key] = entry
+            self._counters.upstream_calls += 1
+            task.add_done_callback(lambda _: self._forget(key, task))
+        else:
+            self._counters.coalesced += 1
+
+        task, waiters = entry
+        waiters[0] += 1
+        try:
+            return await asyncio.shield(task)
+        except asyncio.CancelledError:
+            if not task.done() and waiters[0] == 1:
+                task.cancel()
+            raise
+        finally:
+            waiters[0] -= 1
+
+    def _forget(self, key: str, task: asyncio.Task) -> None:
+        entry = self._calls.get(key)
+        if entry is not None and entry[0] is task:
+            del self._calls[key]
+        if not task.cancelled():
+            task.exception()  # mark retrieved even if every waiter was cancelled
+
+    def stats(self) -> dict:
+        return self._counters.snapshot(len(self._calls))
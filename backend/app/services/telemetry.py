@@ -0,0 +1,277 @@
+"""
+In-process telemetry for Bedrock calls.
+Aggregates token usage (including prompt-cache reads and writes), latency,
+retries and fallbacks per call site into fixed-bucket histograms that the
+internal stats endpoint reports.
+"""
+
+import logging
+import threading
+import time
+from datetime import datetime, timezone
+
+logger = logging.getLogger(__name__)
+
+LATENCY_BUCKETS_MS = (100, 250, 500, 1000, 2000, 3000, 5000, 8000, 13000, 20000, 30000, 60000)
+TOKEN_BUCKETS = (32, 64, 128, 256, 512, 1024, 2048, 4096, 8192, 16384, 32768)
+
+
+class Histogram:
+    """Fixed-bucket histogram; percentiles are reported as bucket upper bounds."""
+
+    def __init__(self, bounds: tuple[float, ...]) -> None:
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)  # last bucket is +Inf
+        self.count = 0
+        self.total = 0.0
+        self.min: float | None = None
+        self.max: float | None = None
+
+    def observe(self, value: float) -> None:
+        index = len(self.bounds)
+        for i, bound in enumerate(self.bounds):
+            if value <= bound:
+                index = i
+                break
+        self.counts[index] += 1
+        self.count += 1
+        self.total += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    def percentile(self, q: float) -> float | None:
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for i, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if seen >= rank and bucket_count:
+                return self.bounds[i] if i < len(self.bounds) else self.max
+        return self.max
+
+    def snapshot(self) -> dict:
+        return {
+            "count": self.count,
+            "sum": round(self.total, 2),
+            "mean": round(self.total / self.count, 2) if self.count else None,
+            "min": self.min,
+            "max": self.max,
+            "p50": self.percentile(0.50),
+            "p95": self.percentile(0.95),
+            "p99": self.percentile(0.99),
+            "buckets": {
+                **{f"le_{bound}": self.counts[i] for i, bound in enumerate(self.bounds)},
+                "le_inf": self.counts[-1],
+            },
+        }
+
+
+class _CallSiteStats:
+    def __init__(self) -> None:
+        self.calls = 0
+        self.succeeded = 0
+        self.fallbacks = 0
+        self.failed = 0
+        self.cache_hits = 0
+        self.streamed = 0
+        self.retries = 0
+        self.secondary_model_calls = 0
+        self.hedged = 0
+        self.models: dict[str, int] = {}
+        self.errors: dict[str, int] = {}
+        self.input_tokens = 0
+        self.output_tokens = 0
+        self.cache_read_tokens = 0
+        self.cache_write_tokens = 0
+        self.latency_ms = Histogram(LATENCY_BUCKETS_MS)
+        self.model_latency_ms = Histogram(LATENCY_BUCKETS_MS)
+        self.ttft_ms = Histogram(LATENCY_BUCKETS_MS)
+        self.input_token_hist = Histogram(TOKEN_BUCKETS)
+        self.output_token_hist = Histogram(TOKEN_BUCKETS)
+
+    def snapshot(self) -> dict:
+        prompt_tokens = self.input_tokens + self.cache_read_tokens + self.cache_write_tokens
+        return {
+            "calls": self.calls,
+            "succeeded": self.succeeded,
+            "fallbacks": self.fallbacks,
+            "failed": self.failed,
+            "cache_hits": self.cache_hits,
+            "streamed": self.streamed,
+            "retries": self.retries,
+            "models": dict(self.models),
+            "secondary_model_calls": self.secondary_model_calls,
+            "hedged": self.hedged,
+            "errors": dict(self.errors),
+            "tokens": {
+                "input": self.input_tokens,
+                "output": self.output_tokens,
+                "cache_read": self.cache_read_tokens,
+                "cache_write": self.cache_write_tokens,
+                "cache_read_ratio": (
+                    round(self.cache_read_tokens / prompt_tokens, 4) if prompt_tokens else 0.0
+                ),
+                "input_per_call": self.input_token_hist.snapshot(),
+                "output_per_call": self.output_token_hist.snapshot(),
+            },
+            "latency_ms": self.latency_ms.snapshot(),
+            "model_latency_ms": self.model_latency_ms.snapshot(),
+            "ttft_ms": self.ttft_ms.snapshot(),
+        }
+
+
+class CallTrace:
+    """
+    Per-call record filled in by the Bedrock retry loops.
+
+    ``latency_ms`` is wall time for the whole call including retries and
+    backoff; ``model_latency_ms`` is what Bedrock reported in ``metrics``.
+    ``input_tokens`` counts uncached prompt tokens only; tokens served from
+    or written to the prompt cache are kept separately. ``ttft_ms`` is set
+    for streamed calls when the first text chunk arrives. ``model_id`` is
+    the model that served the last attempt; ``secondary`` is set once the
+    call moved to the secondary model after throttling; ``hedged`` once a
+    backup request was raced against a slow attempt.
+    """
+
+    __slots__ = (
+        "call_site", "started", "attempts", "input_tokens", "output_tokens",
+        "cache_read_tokens", "cache_write_tokens", "model_latency_ms", "ttft_ms",
+        "error_type", "fallback", "streamed", "model_id", "secondary",
+        "priority", "user_id", "hedged",
+    )
+
+    def __init__(
+        self,
+        call_site: str,
+        streamed: bool = False,
+        priority: str | None = None,
+        user_id: str | None = None,
+    ) -> None:
+        self.call_site = call_site
+        self.started = time.monotonic()
+        self.attempts = 0
+        self.input_tokens = 0
+        self.output_tokens = 0
+        self.cache_read_tokens = 0
+        self.cache_write_tokens = 0
+        self.model_latency_ms: float | None = None
+        self.ttft_ms: float | None = None
+        self.error_type: str | None = None
+        self.fallback = False
+        self.streamed = streamed
+        self.model_id: str | None = None
+        self.secondary = False
+        self.priority = priority
+        self.user_id = user_id
+        self.hedged = False
+
+    def add_usage(self, usage: dict | None, metrics: dict | None) -> None:
+        """Take token counts and latency from a Converse response or stream metadata event."""
+        usage = usage or {}
+        self.input_tokens += int(usage.get("inputTokens") or 0)
+        self.output_tokens += int(usage.get("outputTokens") or 0)
+        self.cache_read_tokens += int(usage.get("cacheReadInputTokens") or 0)
+        self.cache_write_tokens += int(usage.get("cacheWriteInputTokens") or 0)
+        latency = (metrics or {}).get("latencyMs")
+        if latency is not None:
+            self.model_latency_ms = float(latency)
+
+    def mark_first_token(self) -> None:
+        """Record time to first token; later calls are ignored."""
+        if self.ttft_ms is None:
+            self.ttft_ms = (time.monotonic() - self.started) * 1000
+
+
+class LLMTelemetry:
+    """Thread-safe per-call-site aggregation of Bedrock call traces."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._sites: dict[str, _CallSiteStats] = {}
+        self._since = datetime.now(timezone.utc)
+
+    def _site(self, call_site: str) -> _CallSiteStats:
+        stats = self._sites.get(call_site)
+        if stats is None:
+            stats = self._sites[call_site] = _CallSiteStats()
+        return stats
+
+    def record(self, trace: CallTrace) -> None:
+        """Aggregate a finished call and emit one structured log line for it."""
+        latency_ms = (time.monotonic() - trace.started) * 1000
+        succeeded = trace.error_type is None
+
+        with self._lock:
+            stats = self._site(trace.call_site)
+            stats.calls += 1
+            stats.retries += max(0, trace.attempts - 1)
+            if trace.model_id:
+                stats.models[trace.model_id] = stats.models.get(trace.model_id, 0) + 1
+            if trace.secondary:
+                stats.secondary_model_calls += 1
+            if trace.hedged:
+                stats.hedged += 1
+            if trace.streamed:
+                stats.streamed += 1
+            if succeeded:
+                stats.succeeded += 1
+            elif trace.fallback:
+                stats.fallbacks += 1
+            else:
+                stats.failed += 1
+            if trace.error_type:
+                stats.errors[trace.error_type] = stats.errors.get(trace.error_type, 0) + 1
+            stats.input_tokens += trace.input_tokens
+            stats.output_tokens += trace.output_tokens
+            stats.cache_read_tokens += trace.cache_read_tokens
+            stats.cache_write_tokens += trace.cache_write_tokens
+            stats.latency_ms.observe(latency_ms)
+            if trace.model_latency_ms is not None:
+                stats.model_latency_ms.observe(trace.model_latency_ms)
+            if trace.ttft_ms is not None:
+                stats.ttft_ms.observe(trace.ttft_ms)
+            if succeeded:
+                stats.input_token_hist.observe(trace.input_tokens)
+                stats.output_token_hist.observe(trace.output_tokens)
+
+        logger.info(
+            f"bedrock_call site={trace.call_site} priority={trace.priority} "
+            f"model={trace.model_id} secondary={trace.secondary} hedged={trace.hedged} "
+            f"latency_ms={latency_ms:.0f} "
+            f"model_latency_ms={trace.model_latency_ms} attempts={trace.attempts} "
+            f"input_tokens={trace.input_tokens} output_tokens={trace.output_tokens} "
+            f"cache_read_tokens={trace.cache_read_tokens} cache_write_tokens={trace.cache_write_tokens} "
+            f"ttft_ms={None if trace.ttft_ms is None else round(trace.ttft_ms)} "
+            f"error={trace.error_type} fallback={trace.fallback} streamed={trace.streamed}"
+        )
+
+    def record_cache_hit(self, call_site: str) -> None:
+        with self._lock:
+            self._site(call_site).cache_hits += 1
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            sites = {name: stats.snapshot() for name, stats in sorted(self._sites.items())}
+        return {
+            "since": self._since.isoformat(),
+            "call_sites": sites,
+            "totals": {
+                "calls": sum(site["calls"] for site in sites.values()),
+                "fallbacks": sum(site["fallbacks"] for site in sites.values()),
+                "input_tokens": sum(site["tokens"]["input"] for site in sites.values()),
+                "output_tokens": sum(site["tokens"]["output"] for site in sites.values()),
+                "cache_read_tokens": sum(site["tokens"]["cache_read"] for site in sites.values()),
+                "cache_write_tokens": sum(site["tokens"]["cache_write"] for site in sites.values()),
+            },
+        }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._sites.clear()
+            self._since = datetime.now(timezone.utc)
+
+
+# Global instance
+llm_telemetry = LLMTelemetry()
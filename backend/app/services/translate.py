@@ -3,14 +3,16 @@ Translation Service using Amazon Translate.
 Provides text translation with support for Hindi, Tamil, and Telugu.
 """
 
+import hashlib
 import logging
 from typing import List
 
-import boto3
 from botocore.exceptions import BotoCoreError, ClientError
 from fastapi import HTTPException
 
 from app.config import settings
+from app.services.aws_clients import aws_clients
+from app.services.singleflight import SingleFlight
 
 logger = logging.getLogger(__name__)
 
@@ -37,12 +39,17 @@ class TranslateService:
     MAX_TEXT_LENGTH = 5000
     
     def __init__(self) -> None:
-        self._client = boto3.client(
-            "translate",
-            region_name=settings.AWS_REGION,
-            aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
-            aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
-        )
+        # Identical concurrent translations (e.g. a whole batch opening the
+        # same roadmap) share one upstream call
+        self._inflight = SingleFlight("translate")
+    
+    @property
+    def _client(self):
+        return aws_clients.get("translate")
+    
+    def coalescing_stats(self) -> dict:
+        """Return counters for identical in-flight translations that were collapsed."""
+        return self._inflight.stats()
     
     def is_language_supported(self, language_code: str) -> bool:
         """
@@ -107,11 +114,20 @@ class TranslateService:
             logger.warning(f"Text too long ({original_length} chars), truncating to {self.MAX_TEXT_LENGTH}")
             text = text[:self.MAX_TEXT_LENGTH]
         
+        request_key = ":".join([
+            source_language,
+            target_language,
+            hashlib.sha256(text.encode("utf-8")).hexdigest(),
+        ])
+        
         try:
-            response = self._client.translate_text(
-                Text=text,
-                SourceLanguageCode=source_language,
-                TargetLanguageCode=target_language,
+            response = self._inflight.do(
+                request_key,
+                lambda: self._client.translate_text(
+                    Text=text,
+                    SourceLanguageCode=source_language,
+                    TargetLanguageCode=target_language,
+                ),
             )
             
             return {
@@ -0,0 +1,248 @@
+"""
+Status tracking for roadmap week generation.
+One row per (roadmap, week) records who is generating it and how that went,
+so background pre-generation and the generate-week endpoints never produce
+the same week twice, across requests and worker processes.
+"""
+
+import asyncio
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Callable
+
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import or_
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.database import SessionLocal
+from app.models import RoadmapWeekJob
+
+logger = logging.getLogger(__name__)
+
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+
+PREGENERATE = "pregenerate"
+MANUAL = "manual"
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def _job_to_dict(job: RoadmapWeekJob) -> dict:
+    return {
+        "week_number": job.week_number,
+        "status": job.status,
+        "source": job.source,
+        "attempts": job.attempts,
+        "error": job.error,
+        "updated_at": job.updated_at,
+    }
+
+
+class RoadmapWeekJobs:
+    """
+    Claim / finish bookkeeping for week generation jobs.
+
+    A job is owned by whoever moved it to ``running``; ownership is a lease
+    of ``ROADMAP_WEEK_JOB_LEASE_SECONDS`` so a job whose process died can be
+    claimed again. All methods block; async callers use the ``*_async``
+    variants.
+    """
+
+    def __init__(self, session_factory: Callable[[], Session] = SessionLocal) -> None:
+        self._session_factory = session_factory
+
+    @staticmethod
+    def _lease_expiry() -> datetime:
+        return _utcnow() + timedelta(seconds=settings.ROADMAP_WEEK_JOB_LEASE_SECONDS)
+
+    def _query(self, db: Session, roadmap_id: str, week_number: int):
+        return db.query(RoadmapWeekJob).filter(
+            RoadmapWeekJob.roadmap_id == roadmap_id,
+            RoadmapWeekJob.week_number == week_number,
+        )
+
+    def enqueue(self, roadmap_id: str, week_number: int) -> bool:
+        """
+        Mark a week as queued for pre-generation.
+
+        Returns:
+            True if the caller should start the job; False if the week is
+            already queued, running or done
+        """
+        db = self._session_factory()
+        try:
+            db.add(
+                RoadmapWeekJob(
+                    roadmap_id=roadmap_id,
+                    week_number=week_number,
+                    status=QUEUED,
+                    source=PREGENERATE,
+                    attempts=0,
+                    lease_expires_at=self._lease_expiry(),
+                )
+            )
+            db.commit()
+            return True
+        except IntegrityError:
+            db.rollback()
+        finally:
+            db.close()
+
+        # A failed job, or a queued/running one whose owner went away
+        db = self._session_factory()
+        try:
+            updated = (
+                self._query(db, roadmap_id, week_number)
+                .filter(
+                    or_(
+                        RoadmapWeekJob.status == FAILED,
+                        (RoadmapWeekJob.status.in_((QUEUED, RUNNING)))
+                        & (RoadmapWeekJob.lease_expires_at < _utcnow()),
+                    )
+                )
+                .update(
+                    {
+                        "status": QUEUED,
+                        "source": PREGENERATE,
+                        "error": None,
+                        "lease_expires_at": self._lease_expiry(),
+                    },
+                    synchronize_session=False,
+                )
+            )
+            db.commit()
+            return updated == 1
+        finally:
+            db.close()
+
+    def claim(self, roadmap_id: str, week_number: int, source: str) -> bool:
+        """
+        Take ownership of a week's generation.
+
+        Manual requests may claim any job that is not running under a live
+        lease; pre-generation only claims jobs that are still queued, so it
+        never redoes a week someone else finished.
+
+        Returns:
+            True if the caller now owns the job and must ``finish`` it
+        """
+        db = self._session_factory()
+        try:
+            db.add(
+                RoadmapWeekJob(
+                    roadmap_id=roadmap_id,
+                    week_number=week_number,
+                    status=RUNNING,
+                    source=source,
+                    attempts=1,
+                    lease_expires_at=self._lease_expiry(),
+                )
+            )
+            db.commit()
+            return True
+        except IntegrityError:
+            db.rollback()
+        finally:
+            db.close()
+
+        now = _utcnow()
+        claimable = RoadmapWeekJob.status == QUEUED
+        if source == MANUAL:
+            claimable = RoadmapWeekJob.status.in_((QUEUED, DONE, FAILED))
+        db = self._session_factory()
+        try:
+            updated = (
+                self._query(db, roadmap_id, week_number)
+                .filter(
+                    or_(
+                        claimable,
+                        (RoadmapWeekJob.status == RUNNING) & (RoadmapWeekJob.lease_expires_at < now),
+                    )
+                )
+                .update(
+                    {
+                        "status": RUNNING,
+                        "source": source,
+                        "attempts": RoadmapWeekJob.attempts + 1,
+                        "error": None,
+                        "lease_expires_at": self._lease_expiry(),
+                    },
+                    synchronize_session=False,
+                )
+            )
+            db.commit()
+            return updated == 1
+        finally:
+            db.close()
+
+    def finish(self, roadmap_id: str, week_number: int, error: str | None = None) -> None:
+        """Record the outcome of a claimed job."""
+        db = self._session_factory()
+        try:
+            self._query(db, roadmap_id, week_number).filter(
+                RoadmapWeekJob.status == RUNNING
+            ).update(
+                {
+                    "status": FAILED if error else DONE,
+                    "error": error[:500] if error else None,
+                    "lease_expires_at": None,
+                },
+                synchronize_session=False,
+            )
+            db.commit()
+        except Exception as exc:
+            db.rollback()
+            logger.warning(f"Failed to record week job result for roadmap {roadmap_id} week {week_number}: {exc}")
+        finally:
+            db.close()
+
+    def get(self, roadmap_id: str, week_number: int) -> dict | None:
+        db = self._session_factory()
+        try:
+            job = self._query(db, roadmap_id, week_number).first()
+            return _job_to_dict(job) if job is not None else None
+        finally:
+            db.close()
+
+    def list(self, roadmap_id: str) -> list[dict]:
+        db = self._session_factory()
+        try:
+            jobs = (
+                db.query(RoadmapWeekJob)
+                .filter(RoadmapWeekJob.roadmap_id == roadmap_id)
+                .order_by(RoadmapWeekJob.week_number.asc())
+                .all()
+            )
+            return [_job_to_dict(job) for job in jobs]
+        finally:
+            db.close()
+
+    async def claim_async(self, roadmap_id: str, week_number: int, source: str) -> bool:
+        return await run_in_threadpool(self.claim, roadmap_id, week_number, source)
+
+    async def finish_async(self, roadmap_id: str, week_number: int, error: str | None = None) -> None:
+        await run_in_threadpool(self.finish, roadmap_id, week_number, error)
+
+    async def get_async(self, roadmap_id: str, week_number: int) -> dict | None:
+        return await run_in_threadpool(self.get, roadmap_id, week_number)
+
+    async def wait_async(self, roadmap_id: str, week_number: int, timeout: float) -> dict | None:
+        """Poll until the week's job is no longer queued or running, or ``timeout`` passes."""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        while True:
+            job = await self.get_async(roadmap_id, week_number)
+            if job is None or job["status"] not in (QUEUED, RUNNING) or loop.time() >= deadline:
+                return job
+            await asyncio.sleep(1.0)
+
+
+# Global instance
+week_jobs = RoadmapWeekJobs()
@@ -0,0 +1,47 @@
+"""
+End-to-end deadlines for request handling.
+A Deadline is created when a request arrives and handed down to the
+Bedrock service, which only waits, retries or backs off within what is left.
+"""
+
+import time
+
+from app.config import settings
+
+
+class Deadline:
+    """A point in ``time.monotonic()`` time by which work must be finished."""
+
+    __slots__ = ("expires_at",)
+
+    def __init__(self, seconds: float) -> None:
+        self.expires_at = time.monotonic() + seconds
+
+    def remaining(self) -> float:
+        """Seconds left; never negative."""
+        return max(0.0, self.expires_at - time.monotonic())
+
+    def expired(self) -> bool:
+        return time.monotonic() >= self.expires_at
+
+    def fits(self, seconds: float) -> bool:
+        """True if ``seconds`` of work can still finish before the deadline."""
+        return time.monotonic() + seconds <= self.expires_at
+
+    def cap(self, seconds: float | None) -> float:
+        """``seconds`` limited to the time left (the time left if None)."""
+        remaining = self.remaining()
+        return remaining if seconds is None else min(seconds, remaining)
+
+    def __repr__(self) -> str:
+        return f"Deadline(remaining={self.remaining():.2f}s)"
+
+
+def request_deadline() -> Deadline:
+    """
+    FastAPI dependency: the deadline for LLM work in this request.
+
+    Resolved when the endpoint's dependencies are, i.e. right after the
+    request arrives.
+    """
+    return Deadline(settings.LLM_REQUEST_DEADLINE_SECONDS)
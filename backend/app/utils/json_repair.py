@@ -0,0 +1,366 @@
+"""
+Single-pass JSON extraction and truncation repair for model output.
+Locates the first JSON document in a response and, when generation was cut
+off, closes it after the last complete object/array in the same pass.
+"""
+
+import json
+import re
+from typing import Any, NamedTuple
+
+# One token per match: a string literal (group 1 is its closing quote, empty
+# when the string is unterminated), a structural character, or a bare scalar.
+# Whitespace between tokens is skipped by finditer.
+_TOKEN = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*("?)|[{}\[\],:]|[^\s{}\[\],:"]+', re.DOTALL)
+_SCALAR = re.compile(r"-?(?:0|[1-9]\d*)(?:\.\d+)?(?:[eE][+-]?\d+)?|true|false|null")
+_OPENER = re.compile(r"[{\[]")
+
+_CLOSERS = {"{": "}", "[": "]"}
+
+# Parser expectations
+_VALUE = 0           # after ':' or after ',' in an array
+_VALUE_OR_END = 1    # just after '['
+_KEY = 2             # after ',' in an object
+_KEY_OR_END = 3      # just after '{'
+_COLON = 4           # after an object key
+_AFTER_VALUE = 5     # ',' or the container's closer
+
+
+class JsonSpan(NamedTuple):
+    """Where a JSON document sits in a response and whether it is complete."""
+
+    start: int
+    end: int
+    complete: bool
+    repaired: str | None = None
+
+
+class _ScanResult(NamedTuple):
+    end: int
+    complete: bool
+    malformed: bool
+    safe_end: int | None
+    safe_stack: tuple | None
+    structured: bool = True  # got past a key or closed a container
+
+
+def _scan(text: str, start: int) -> _ScanResult:
+    """
+    Walk one JSON document starting at ``text[start]`` (an opening bracket).
+
+    The bracket stack is a linked list of ``(opener, parent)`` tuples so the
+    stack at the last safe cut point can be kept without copying it.
+    """
+    stack: tuple | None = None
+    expect = _VALUE
+    safe_end: int | None = None
+    safe_stack: tuple | None = None
+    structured = False
+    length = len(text)
+
+    for match in _TOKEN.finditer(text, start):
+        token = match.group()
+        first = token[0]
+
+        if first == '"':
+            if not match.group(1):  # unterminated string
+                break
+            if expect == _KEY or expect == _KEY_OR_END:
+                expect = _COLON
+            elif expect == _VALUE or expect == _VALUE_OR_END:
+                expect = _AFTER_VALUE
+            else:
+                return _ScanResult(match.start(), False, True, safe_end, safe_stack, structured)
+
+        elif first == "{" or first == "[":
+            if expect != _VALUE and expect != _VALUE_OR_END:
+                return _ScanResult(match.start(), False, True, safe_end, safe_stack, structured)
+            stack = (first, stack)
+            expect = _KEY_OR_END if first == "{" else _VALUE_OR_END
+
+        elif first == "}" or first == "]":
+            if stack is None or _CLOSERS[stack[0]] != first:
+                return _ScanResult(match.start(), False, True, safe_end, safe_stack, structured)
+            closes_empty = expect == (_KEY_OR_END if first == "}" else _VALUE_OR_END)
+            if expect != _AFTER_VALUE and not closes_empty:
+                return _ScanResult(match.start(), False, True, safe_end, safe_stack, structured)
+            stack = stack[1]
+            if stack is None:
+                return _ScanResult(match.end(), True, False, match.end(), None)
+            expect = _AFTER_VALUE
+            structured = True
+            # A container just closed: cutting here and closing the
+            # remaining brackets yields a valid document.
+            safe_end, safe_stack = match.end(), stack
+
+        elif first == ",":
+            if expect != _AFTER_VALUE:
+                return _ScanResult(match.start(), False, True, safe_end, safe_stack, structured)
+            expect = _KEY if stack[0] == "{" else _VALUE
+
+        elif first == ":":
+            if expect != _COLON:
+                return _ScanResult(match.start(), False, True, safe_end, safe_stack, structured)
+            expect = _VALUE
+            structured = True
+
+        else:
+            if expect != _VALUE and expect != _VALUE_OR_END:
+                return _ScanResult(match.start(), False, True, safe_end, safe_stack, structured)
+            if match.end() == length:  # may be a truncated number or literal
+                break
+            if not _SCALAR.fullmatch(token):
+                return _ScanResult(match.start(), False, True, safe_end, safe_stack, structured)
+            expect = _AFTER_VALUE
+
+    return _ScanResult(length, False, False, safe_end, safe_stack)
+
+
+def _close(text: str, start: int, result: _ScanResult) -> str | None:
+    """Cut at the last safe point and append the missing closing brackets."""
+    if result.safe_end is None:
+        return None
+    closers = []
+    node = result.safe_stack
+    while node is not None:
+        closers.append(_CLOSERS[node[0]])
+        node = node[1]
+    return text[start:result.safe_end] + "".join(closers)
+
+
+def _search(text: str, pos: int) -> JsonSpan | None:
+    """
+    Return the first complete document at or after ``pos``, else the first
+    truncated or malformed one that could be repaired.
+
+    After a malformed candidate the search resumes where scanning stopped,
+    so every character is scanned at most once.
+    """
+    partial: JsonSpan | None = None
+    while True:
+        opener = _OPENER.search(text, pos)
+        if opener is None:
+            return partial
+        start = opener.start()
+        result = _scan(text, start)
+
+        if result.complete:
+            return JsonSpan(start, result.end, True)
+
+        if partial is None or partial.repaired is None:
+            candidate = JsonSpan(start, result.end, False, _close(text, start, result))
+            if partial is None or candidate.repaired is not None:
+                partial = candidate
+
+        # Ran off the end, or broke after real structure had been emitted
+        # (e.g. an unescaped quote): treat this as the document. Only
+        # bracketed prose such as "[see below]" is skipped.
+        if not result.malformed or result.structured:
+            return partial
+        pos = max(result.end, start + 1)
+
+
+def find_json(text: str) -> JsonSpan | None:
+    """
+    Locate the JSON document in a model response.
+
+    A fenced ```json block wins over brackets in any prose before it, the
+    same preference the old regex-based parser had.
+    """
+    if not text:
+        return None
+
+    fence = text.find("```")
+    if fence != -1:
+        line_end = text.find("\n", fence)
+        span = _search(text, line_end + 1 if line_end != -1 else fence + 3)
+        if span is not None and span.complete:
+            return span
+        fenced = span
+        span = _search(text, 0)
+        if span is not None and span.complete:
+            return span
+        return fenced or span
+
+    return _search(text, 0)
+
+
+def extract_json(text: str) -> Any:
+    """
+    Parse the first complete JSON document in ``text``.
+
+    Raises:
+        json.JSONDecodeError: If there is no complete, valid document
+    """
+    if not text or not isinstance(text, str):
+        raise json.JSONDecodeError("Empty or invalid response", "", 0)
+
+    span = find_json(text)
+    if span is not None and span.complete:
+        return json.loads(text[span.start:span.end])
+    if span is not None:
+        raise json.JSONDecodeError("Incomplete or malformed JSON document", text, span.end)
+    # No bracketed document; the response may still be a bare JSON value
+    return json.loads(text)
+
+
+def repair_truncated_json(text: str) -> str | None:
+    """
+    Close a JSON document that was cut off mid-generation.
+
+    Everything after the last fully closed object or array is dropped and
+    the still-open brackets are closed. Returns None if nothing complete
+    was generated before the cut.
+    """
+    if not text or not text.strip():
+        return None
+    span = find_json(text)
+    if span is None:
+        return None
+    if span.complete:
+        return text[span.start:span.end]
+    return span.repaired
+
+
+def parse_json_or_repair(text: str) -> tuple[Any, bool]:
+    """
+    Parse the JSON document in ``text``, repairing it if it was truncated.
+
+    Extraction and repair share one scan of the response.
+
+    Returns:
+        Tuple of (parsed value, whether the document had to be repaired)
+
+    Raises:
+        json.JSONDecodeError: If nothing could be parsed or salvaged
+    """
+    if not text or not isinstance(text, str):
+        raise json.JSONDecodeError("Empty or invalid response", "", 0)
+
+    span = find_json(text)
+    if span is None:
+        return json.loads(text), False
+    if span.complete:
+        return json.loads(text[span.start:span.end]), False
+    if span.repaired is None:
+        raise json.JSONDecodeError("Incomplete or malformed JSON document", text, span.end)
+    return json.loads(span.repaired), True
+
+
+class IncrementalJsonParser:
+    """
+    Emit values at selected paths as soon as they are complete while a JSON
+    document is still streaming in.
+
+    Paths are tuples of object keys with "*" standing for any array index,
+    e.g. ``("week_1", "days", "*")`` yields each day of the first week the
+    moment its closing brace arrives. Each token is scanned once; a token
+    cut by the chunk boundary is re-read when the next chunk arrives.
+    Malformed input just stops further events; the caller still parses the
+    full text at the end.
+    """
+
+    def __init__(self, *paths: tuple[str, ...]) -> None:
+        self._paths = set(paths)
+        self._buffer = ""
+        self._pos = 0
+        self._started = False
+        self._done = False
+        self._expect = _VALUE
+        # One frame per open container: [opener, path component, start offset]
+        self._frames: list[list] = []
+        self._path: list[str] = []
+        self._key: str | None = None
+
+    @property
+    def text(self) -> str:
+        """Everything fed so far."""
+        return self._buffer
+
+    def _value_path(self) -> tuple[str, ...]:
+        if not self._frames:
+            return ()
+        component = self._key if self._frames[-1][0] == "{" else "*"
+        return (*self._path, component)
+
+    def feed(self, chunk: str) -> list[tuple[tuple[str, ...], Any]]:
+        """Add streamed text; return (path, value) for every watched value it completed."""
+        self._buffer += chunk
+        events: list[tuple[tuple[str, ...], Any]] = []
+        if self._done:
+            return events
+
+        text = self._buffer
+        if not self._started:
+            opener = _OPENER.search(text, self._pos)
+            if opener is None:
+                self._pos = len(text)
+                return events
+            self._pos = opener.start()
+            self._started = True
+
+        length = len(text)
+        for match in _TOKEN.finditer(text, self._pos):
+            token = match.group()
+            first = token[0]
+            end = match.end()
+
+            if first == '"':
+                if not match.group(1):  # string continues in the next chunk
+                    break
+                if self._expect in (_KEY, _KEY_OR_END):
+                    self._key = json.loads(token)
+                    self._expect = _COLON
+                elif self._expect in (_VALUE, _VALUE_OR_END):
+                    path = self._value_path()
+                    if path in self._paths:
+                        events.append((path, json.loads(token)))
+                    self._expect = _AFTER_VALUE
+                else:
+                    self._done = True
+                    break
+
+            elif first == "{" or first == "[":
+                if self._expect not in (_VALUE, _VALUE_OR_END):
+                    self._done = True
+                    break
+                path = self._value_path()
+                self._frames.append([first, path[-1] if path else None, match.start()])
+                if path:
+                    self._path.append(path[-1])
+                self._expect = _KEY_OR_END if first == "{" else _VALUE_OR_END
+
+            elif first == "}" or first == "]":
+                if not self._frames or _CLOSERS[self._frames[-1][0]] != first:
+                    self._done = True
+                    break
+                opener, component, start = self._frames.pop()
+                path = tuple(self._path)
+                if component is not None:
+                    self._path.pop()
+                if path in self._paths:
+                    events.append((path, json.loads(text[start:end])))
+                self._expect = _AFTER_VALUE
+                if not self._frames:
+                    self._pos = end
+                    self._done = True
+                    break
+
+            elif first == ",":
+                self._expect = _KEY if self._frames[-1][0] == "{" else _VALUE
+
+            elif first == ":":
+                self._expect = _VALUE
+
+            else:
+                if end == length:  # number or literal may continue
+                    break
+                if _SCALAR.fullmatch(token):
+                    path = self._value_path()
+                    if path in self._paths:
+                        events.append((path, json.loads(token)))
+                self._expect = _AFTER_VALUE
+
+            self._pos = end
+
+        return events
@@ -147,8 +147,3 @@ def get_ai_logger() -> AppLogger:
 def get_auth_logger() -> AppLogger:
     """Get logger for authentication operations."""
     return AppLogger("campus_to_hire.auth")
-
-
-# Initialize logging on module import
-# This ensures logging is configured when the module is first imported
-setup_logging()
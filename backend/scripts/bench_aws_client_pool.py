@@ -0,0 +1,144 @@
+"""
+Benchmark Bedrock Converse throughput through boto3 at high concurrency.
+
+Starts a local HTTP stub (in its own process, so it does not compete for
+the GIL) that answers Converse requests after a fixed delay, then drives
+it from 50-200 threads with (a) a client built with botocore's default
+config (10 pooled connections) and (b) a client from the shared factory in
+app.services.aws_clients. Reports calls/s, latency percentiles and how
+many new TCP connections each round opened. Against real Bedrock every
+new connection is also a TLS handshake, which the plain-HTTP stub does
+not charge for.
+
+Usage (from backend/):
+    python -m scripts.bench_aws_client_pool [--concurrency 50 100 200]
+        [--calls-per-thread 5] [--rounds 2] [--delay-ms 50]
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+os.environ.setdefault("AWS_ACCESS_KEY_ID", "bench")
+os.environ.setdefault("AWS_SECRET_ACCESS_KEY", "bench")
+
+import boto3  # noqa: E402
+
+from app.config import settings  # noqa: E402
+from app.services.aws_clients import AWSClientFactory  # noqa: E402
+
+CONVERSE_RESPONSE = json.dumps({
+    "output": {"message": {"role": "assistant", "content": [{"text": "ok"}]}},
+    "stopReason": "end_turn",
+    "usage": {"inputTokens": 10, "outputTokens": 1, "totalTokens": 11},
+    "metrics": {"latencyMs": 50},
+}).encode()
+
+
+class StubServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 1024
+
+    def __init__(self, delay: float, connections) -> None:
+        super().__init__(("127.0.0.1", 0), StubHandler)
+        self.delay = delay
+        self.connections = connections
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep connections open between requests
+
+    def setup(self) -> None:
+        super().setup()
+        with self.server.connections.get_lock():
+            self.server.connections.value += 1
+
+    def do_POST(self) -> None:
+        self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        time.sleep(self.server.delay)
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(CONVERSE_RESPONSE)))
+        self.end_headers()
+        self.wfile.write(CONVERSE_RESPONSE)
+
+    def log_message(self, format: str, *args) -> None:
+        pass
+
+
+def serve(delay: float, connections, port) -> None:
+    server = StubServer(delay, connections)
+    port.value = server.server_address[1]
+    server.serve_forever()
+
+
+def converse(client) -> float:
+    started = time.perf_counter()
+    client.converse(
+        modelId="amazon.nova-lite-v1:0",
+        messages=[{"role": "user", "content": [{"text": "ping"}]}],
+    )
+    return time.perf_counter() - started
+
+
+def run(client, connections, concurrency: int, calls: int) -> dict:
+    converse(client)  # connect once outside the timing
+    connections_before = connections.value
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        latencies = sorted(pool.map(lambda _: converse(client), range(concurrency * calls)))
+    elapsed = time.perf_counter() - started
+    return {
+        "calls_per_s": len(latencies) / elapsed,
+        "p50_ms": latencies[len(latencies) // 2] * 1000,
+        "p99_ms": latencies[int(len(latencies) * 0.99) - 1] * 1000,
+        "connections": connections.value - connections_before,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[50, 100, 200])
+    parser.add_argument("--calls-per-thread", type=int, default=5)
+    parser.add_argument("--rounds", type=int, default=2, help="rounds per client; later ones reuse its pool")
+    parser.add_argument("--delay-ms", type=float, default=50.0)
+    args = parser.parse_args()
+
+    connections = multiprocessing.Value("i", 0)
+    port = multiprocessing.Value("i", 0)
+    stub = multiprocessing.Process(target=serve, args=(args.delay_ms / 1000, connections, port), daemon=True)
+    stub.start()
+    while not port.value:
+        time.sleep(0.05)
+    endpoint = f"http://127.0.0.1:{port.value}"
+    print(f"stub endpoint {endpoint}, {args.delay_ms:.0f}ms per call")
+
+    for concurrency in args.concurrency:
+        default_client = boto3.client(
+            "bedrock-runtime",
+            region_name=settings.AWS_REGION,
+            endpoint_url=endpoint,
+            aws_access_key_id="bench",
+            aws_secret_access_key="bench",
+        )
+        tuned_client = AWSClientFactory(
+            endpoint_url=endpoint, max_pool_connections=max(concurrency, settings.AWS_MAX_POOL_CONNECTIONS)
+        ).get("bedrock-runtime")
+        for name, client in (("default", default_client), ("shared", tuned_client)):
+            for round_number in range(1, args.rounds + 1):
+                result = run(client, connections, concurrency, args.calls_per_thread)
+                print(
+                    f"{concurrency:>4} threads  {name:<7} pool={client.meta.config.max_pool_connections:<4} "
+                    f"round {round_number}  {result['calls_per_s']:7.1f} calls/s  "
+                    f"p50 {result['p50_ms']:6.1f}ms  p99 {result['p99_ms']:7.1f}ms  "
+                    f"new connections {result['connections']}"
+                )
+    stub.terminate()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,176 @@
+"""
+Benchmark JSON extraction/repair on truncated roadmap outputs.
+
+Compares the single-pass scanner in app.utils.json_repair against the
+previous regex + cut-point implementation on `roadmap` (plan + week 1) and
+`roadmap_week` responses cut off at several points, with and without an
+unescaped quote early in the text (the case that made the old repair try
+every cut point).
+
+Usage (from backend/):
+    python -m scripts.bench_json_repair [--repeat 20]
+"""
+
+import argparse
+import json
+import re
+import time
+
+from app.utils.json_repair import parse_json_or_repair
+
+RESOURCE = {"title": "Striver A2Z Sheet", "url": "https://takeuforward.org/strivers-a2z-dsa-course/strivers-a2z-dsa-course-sheet-2", "type": "practice"}
+
+
+# ── Previous implementation, kept here only for comparison ──────────────────
+
+def legacy_parse(response: str) -> dict:
+    match = re.search(r"```(?:json)?\s*(\{.*?\}|\[.*?\])\s*```", response, re.DOTALL)
+    if match:
+        try:
+            return json.loads(match.group(1))
+        except json.JSONDecodeError:
+            pass
+    match = re.search(r"(\{.*\}|\[.*\])", response, re.DOTALL)
+    if match:
+        try:
+            return json.loads(match.group(1))
+        except json.JSONDecodeError:
+            pass
+    return json.loads(response)
+
+
+def legacy_repair(text: str) -> str | None:
+    text = text.strip()
+    start = next((i for i, c in enumerate(text) if c in ("{", "[")), None)
+    if start is None:
+        return None
+    text = text[start:]
+    in_string = False
+    escape_next = False
+    stack: list[str] = []
+    cut_points: list[tuple[int, list[str]]] = []
+    for i, ch in enumerate(text):
+        if escape_next:
+            escape_next = False
+            continue
+        if ch == "\\" and in_string:
+            escape_next = True
+            continue
+        if ch == '"':
+            in_string = not in_string
+            continue
+        if in_string:
+            continue
+        if ch in ("{", "["):
+            stack.append(ch)
+        elif ch in ("}", "]"):
+            if stack:
+                stack.pop()
+            cut_points.append((i + 1, list(stack)))
+    for end_idx, remaining_stack in reversed(cut_points):
+        closing = "".join("}" if c == "{" else "]" for c in reversed(remaining_stack))
+        candidate = text[:end_idx] + closing
+        try:
+            json.loads(candidate)
+            return candidate
+        except json.JSONDecodeError:
+            continue
+    return None
+
+
+def legacy_parse_safe(response: str) -> dict | None:
+    try:
+        return legacy_parse(response)
+    except json.JSONDecodeError:
+        repaired = legacy_repair(response)
+        return json.loads(repaired) if repaired else None
+
+
+def scanner_parse_safe(response: str) -> dict | None:
+    try:
+        return parse_json_or_repair(response)[0]
+    except json.JSONDecodeError:
+        return None
+
+
+# ── Sample outputs shaped like the roadmap prompts' JSON contract ───────────
+
+def build_week(week: int, days: int = 6, tasks_per_day: int = 3) -> dict:
+    return {
+        "week": week,
+        "theme": f"Week {week} DSA and CS Fundamentals",
+        "days": [
+            {
+                "day": day,
+                "title": f"Arrays and Hashing {day}",
+                "tasks": [
+                    {
+                        "id": f"w{week}d{day}t{task}",
+                        "title": "Two Sum and Group Anagrams",
+                        "type": "practice",
+                        "duration_minutes": 45,
+                        "description": "Solve the problems using a hash map and explain the \"complement\" idea.",
+                        "resources": [RESOURCE],
+                    }
+                    for task in range(1, tasks_per_day + 1)
+                ],
+            }
+            for day in range(1, days + 1)
+        ],
+    }
+
+
+def build_roadmap(total_weeks: int = 8) -> dict:
+    return {
+        "title": "Roadmap: Software Engineer at Amazon, Microsoft",
+        "total_weeks": total_weeks,
+        "plan": [
+            {"week": week, "theme": "DSA Foundations", "focus": "Arrays, strings, basic sorting"}
+            for week in range(1, total_weeks + 1)
+        ],
+        "week_1": build_week(1),
+    }
+
+
+def truncations(document: dict, fractions=(0.35, 0.6, 0.85, 0.97), stray_quote: bool = False) -> list[str]:
+    text = json.dumps(document, indent=4)
+    if stray_quote:
+        # A common model slip: an unescaped quote inside the first description
+        text = text.replace('the \\"complement\\" idea', 'the "complement" idea', 1)
+    return [text[: int(len(text) * fraction)] for fraction in fractions]
+
+
+def bench(label: str, samples: list[str], repeat: int) -> None:
+    for name, fn in (("legacy", legacy_parse_safe), ("scanner", scanner_parse_safe)):
+        started = time.perf_counter()
+        for _ in range(repeat):
+            for sample in samples:
+                fn(sample)
+        elapsed = (time.perf_counter() - started) / (repeat * len(samples))
+        print(f"  {label:<13} {name:<8} {elapsed * 1e3:8.3f} ms/response")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    suites = {
+        "roadmap": truncations(build_roadmap()),
+        "roadmap_week": truncations(build_week(3, days=7)),
+        "roadmap+quote": truncations(build_roadmap(), stray_quote=True),
+        "week+quote": truncations(build_week(3, days=7), stray_quote=True),
+    }
+
+    for label, samples in suites.items():
+        for sample in samples:
+            old, new = legacy_parse_safe(sample), scanner_parse_safe(sample)
+            if old != new:
+                print(f"  note: {label} cut at {len(sample)} chars repaired differently")
+        sizes = ", ".join(str(len(sample)) for sample in samples)
+        print(f"{label}: {len(samples)} truncated responses ({sizes} chars)")
+        bench(label, samples, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Fail if importing app.main gets slower than a budget.
+
+Runs ``python -X importtime -c "import app.main"`` in fresh interpreters,
+takes the fastest run's cumulative time for app.main and compares it to
+the budget. Independently of timing, it fails if any module that must be
+loaded lazily (boto3, httpx) is imported at start-up, which catches the
+usual regression deterministically. The slowest top-level imports are
+listed either way.
+
+Usage (from backend/, with the app's environment variables set):
+    python -m scripts.check_import_time [--budget-ms 1500] [--runs 5]
+"""
+
+import argparse
+import subprocess
+import sys
+
+# Loaded on first use only (AWS clients, Google OAuth)
+LAZY_MODULES = ("boto3", "httpx")
+
+PROBE = (
+    "import sys, app.main; "
+    f"print(','.join(m for m in {LAZY_MODULES!r} if m in sys.modules))"
+)
+
+
+def import_once() -> tuple[float, dict[str, float], list[str]]:
+    """One cold import: (app.main ms, top-level import ms by module, lazy modules loaded)."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", PROBE],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    total_ms = 0.0
+    top_level: dict[str, float] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        depth = (len(name) - len(name.lstrip())) // 2
+        name = name.strip()
+        if name == "app.main":
+            total_ms = int(cumulative) / 1000
+        elif depth == 1:
+            top_level[name] = int(cumulative) / 1000
+    loaded = [name for name in result.stdout.strip().split(",") if name]
+    return total_ms, top_level, loaded
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--budget-ms", type=float, default=1500.0)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=10)
+    args = parser.parse_args()
+
+    runs = [import_once() for _ in range(max(1, args.runs))]
+    total_ms, top_level, loaded = min(runs, key=lambda run: run[0])
+    print(f"import app.main: {total_ms:.0f}ms (fastest of {len(runs)}), budget {args.budget_ms:.0f}ms")
+    for name, ms in sorted(top_level.items(), key=lambda item: -item[1])[:args.top]:
+        print(f"  {ms:8.1f}ms  {name}")
+
+    failed = False
+    if total_ms > args.budget_ms:
+        print(f"FAIL: over budget by {total_ms - args.budget_ms:.0f}ms")
+        failed = True
+    if loaded:
+        print(f"FAIL: imported at start-up but meant to load lazily: {', '.join(loaded)}")
+        failed = True
+    if not failed:
+        print("OK")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
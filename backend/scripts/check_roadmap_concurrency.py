@@ -0,0 +1,196 @@
+"""
+Hammer one roadmap from many threads and check that no content edit is lost.
+
+Half the workers toggle task completion flags (one distinct task each, the
+daily-plan path); the others save generated weeks (one distinct week each,
+the generate-week path). With compare-and-swap on Roadmap.version every
+edit must survive; ``--legacy`` runs the old read-modify-write for
+comparison.
+
+Usage (from backend/):
+    python -m scripts.check_roadmap_concurrency [--threads 32] [--rounds 3]
+        [--database-url sqlite:///./roadmap_concurrency.db] [--legacy]
+
+Point --database-url at a scratch PostgreSQL database to check row locking
+as deployed; the default is a throwaway SQLite file.
+"""
+
+import argparse
+import copy
+import os
+import sys
+import threading
+import time
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm.attributes import flag_modified
+
+from app.database import Base
+from app.models import Roadmap, User
+from app.routers.daily_plan import _sync_tasks_to_roadmap
+from app.routers.roadmap import _save_generated_week
+
+TASKS_PER_DAY = 4
+
+
+def build_content(weeks: int, days: int) -> dict:
+    """Week 1 filled in with task ids; the other weeks pending."""
+    content_weeks = [{
+        "week": 1,
+        "title": "Week 1",
+        "days": [
+            {
+                "day": day,
+                "title": f"Day {day}",
+                "tasks": [
+                    {"id": f"t-{day}-{n}", "title": f"Task {day}.{n}", "completed": False}
+                    for n in range(1, TASKS_PER_DAY + 1)
+                ],
+            }
+            for day in range(1, days + 1)
+        ],
+    }]
+    for week in range(2, weeks + 1):
+        content_weeks.append({"week": week, "title": f"Week {week}", "days": [], "pending": True})
+    return {"title": "Concurrency check", "total_weeks": weeks, "weeks": content_weeks, "plan": []}
+
+
+def generated_week(week: int) -> dict:
+    return {
+        "week": week,
+        "title": f"Generated week {week}",
+        "days": [{"day": 1, "title": "Day 1", "tasks": [{"id": f"w{week}", "title": "x"}]}],
+    }
+
+
+def legacy_complete(db, roadmap, day: int, task_id: str) -> None:
+    """The pre-version read-modify-write, for --legacy."""
+    content = copy.deepcopy(roadmap.content)
+    for task in content["weeks"][0]["days"][day - 1]["tasks"]:
+        if task["id"] == task_id:
+            task["completed"] = True
+    roadmap.content = content
+    flag_modified(roadmap, "content")
+    db.commit()
+
+
+def legacy_save_week(db, roadmap, week: int) -> None:
+    content = copy.deepcopy(roadmap.content)
+    content["weeks"][week - 1] = generated_week(week)
+    roadmap.content = content
+    flag_modified(roadmap, "content")
+    db.commit()
+
+
+def run_round(session_factory, user_id: str, threads: int, legacy: bool) -> tuple[int, int, int]:
+    days = max(1, (threads // 2 + TASKS_PER_DAY - 1) // TASKS_PER_DAY)
+    task_ids = [(day, f"t-{day}-{n}") for day in range(1, days + 1) for n in range(1, TASKS_PER_DAY + 1)]
+    weeks = 1 + threads - threads // 2
+    db = session_factory()
+    roadmap = Roadmap(user_id=user_id, content=build_content(weeks, days), total_weeks=weeks, is_active=False)
+    db.add(roadmap)
+    db.commit()
+    roadmap_id = roadmap.id
+    db.close()
+
+    jobs = [("task", task_ids[i]) for i in range(threads // 2)]
+    jobs += [("week", week) for week in range(2, weeks + 1)]
+    barrier = threading.Barrier(len(jobs))
+    errors: list[str] = []
+
+    def worker(kind: str, target) -> None:
+        session = session_factory()
+        try:
+            target_roadmap = session.get(Roadmap, roadmap_id)
+            _ = target_roadmap.content  # load before everyone starts writing
+            barrier.wait()
+            if kind == "task":
+                day, task_id = target
+                if legacy:
+                    legacy_complete(session, target_roadmap, day, task_id)
+                else:
+                    _sync_tasks_to_roadmap(target_roadmap, 1, day, [{"id": task_id, "completed": True}], session)
+                    session.commit()
+            elif legacy:
+                legacy_save_week(session, target_roadmap, target)
+            else:
+                _save_generated_week(session, target_roadmap, target - 1, generated_week(target))
+        except Exception as exc:
+            errors.append(f"{kind} {target}: {exc}")
+        finally:
+            session.close()
+
+    pool = [threading.Thread(target=worker, args=job) for job in jobs]
+    for thread in pool:
+        thread.start()
+    for thread in pool:
+        thread.join()
+    for error in errors:
+        print(f"  error: {error}")
+
+    db = session_factory()
+    final = db.get(Roadmap, roadmap_id)
+    done_tasks = {
+        task["id"]
+        for day in final.content["weeks"][0]["days"]
+        for task in day["tasks"]
+        if task.get("completed")
+    }
+    lost_tasks = sum(1 for kind, target in jobs if kind == "task" and target[1] not in done_tasks)
+    lost_weeks = sum(
+        1 for kind, target in jobs
+        if kind == "week" and final.content["weeks"][target - 1].get("pending")
+    )
+    version = final.version
+    db.delete(final)
+    db.commit()
+    db.close()
+    return lost_tasks + lost_weeks, len(jobs), version
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--threads", type=int, default=32)
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--database-url", default="sqlite:///./roadmap_concurrency.db")
+    parser.add_argument("--legacy", action="store_true", help="run the old unversioned writes")
+    args = parser.parse_args()
+
+    connect_args = {"timeout": 30} if args.database_url.startswith("sqlite") else {}
+    engine = create_engine(args.database_url, connect_args=connect_args, pool_size=args.threads + 2)
+    Base.metadata.create_all(engine)
+    session_factory = sessionmaker(bind=engine, autoflush=False)
+
+    db = session_factory()
+    user = User(email=f"concurrency-check-{time.time_ns()}@example.com", name="Concurrency check")
+    db.add(user)
+    db.commit()
+    user_id = user.id
+    db.close()
+
+    total_lost = 0
+    try:
+        for round_number in range(1, args.rounds + 1):
+            started = time.perf_counter()
+            lost, edits, version = run_round(session_factory, user_id, args.threads, args.legacy)
+            total_lost += lost
+            print(
+                f"round {round_number}: {edits} concurrent edits, {lost} lost, "
+                f"final version {version}, {time.perf_counter() - started:.2f}s"
+            )
+    finally:
+        db = session_factory()
+        db.query(User).filter(User.id == user_id).delete()
+        db.commit()
+        db.close()
+        engine.dispose()
+        if args.database_url == "sqlite:///./roadmap_concurrency.db" and os.path.exists("roadmap_concurrency.db"):
+            os.remove("roadmap_concurrency.db")
+
+    print("OK: no lost updates" if total_lost == 0 else f"FAIL: {total_lost} lost update(s)")
+    return 0 if total_lost == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
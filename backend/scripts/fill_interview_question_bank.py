@@ -0,0 +1,106 @@
+"""
+Fill the interview opening-question bank.
+
+For every role in INTERVIEW_BANK_ROLES, company bucket and language in
+INTERVIEW_BANK_LANGUAGES, asks Bedrock for batches of opening messages
+until the key holds INTERVIEW_BANK_QUESTIONS_PER_KEY of them. Keys that
+are already full are skipped, so rerunning the job only tops the bank up.
+
+Usage (from backend/, after running migrations):
+    python -m scripts.fill_interview_question_bank [--roles sde qa]
+        [--languages en hi] [--per-key 12] [--dry-run]
+"""
+
+import argparse
+import sys
+
+from fastapi import HTTPException
+
+from app.config import settings
+from app.services.bedrock import bedrock_service
+from app.services.prompts import (
+    INTERVIEW_COMPANY_BUCKETS,
+    INTERVIEW_OPENING_BANK_SYSTEM_PROMPT,
+    OPENING_COMPANY_PLACEHOLDER,
+    get_interview_opening_bank_prompt,
+)
+from app.services.question_bank import normalize_role, question_bank
+
+BATCH_SIZE = 12
+ATTEMPTS_PER_KEY = 3
+MIN_CHARS = 40
+MAX_CHARS = 1500
+
+
+def usable(question: object) -> bool:
+    """A generated opening can be banked: plain text of sane length, no stray template braces."""
+    if not isinstance(question, str):
+        return False
+    text = question.strip()
+    if not MIN_CHARS <= len(text) <= MAX_CHARS:
+        return False
+    rest = text.replace(OPENING_COMPANY_PLACEHOLDER, "")
+    return "{" not in rest and "}" not in rest
+
+
+def generate(role_key: str, company_bucket: str, language: str, count: int) -> list[str]:
+    """One Bedrock batch of openings for a key; invalid entries are dropped."""
+    raw = bedrock_service.invoke_model(
+        INTERVIEW_OPENING_BANK_SYSTEM_PROMPT,
+        get_interview_opening_bank_prompt(role_key, company_bucket, language, count),
+        max_tokens=min(4096, 250 * count),
+        temperature=0.9,
+        fallback_type="interview_bank",  # no fallback text: failures raise
+        call_site="interview_bank",
+    )
+    parsed = bedrock_service.parse_json_response_safe(raw, fallback={})
+    if not isinstance(parsed, list):
+        return []
+    return [question.strip() for question in parsed if usable(question)]
+
+
+def fill_key(role_key: str, company_bucket: str, language: str, per_key: int, dry_run: bool) -> int:
+    """Top up one key; returns how many openings were added."""
+    have = question_bank.count(role_key, company_bucket, language)
+    label = f"{role_key}/{company_bucket}/{language}"
+    if have >= per_key:
+        print(f"{label}: full ({have})")
+        return 0
+    if dry_run:
+        print(f"{label}: would generate {per_key - have}")
+        return 0
+
+    added = 0
+    for _ in range(ATTEMPTS_PER_KEY):
+        missing = per_key - have - added
+        if missing <= 0:
+            break
+        try:
+            questions = generate(role_key, company_bucket, language, min(BATCH_SIZE, missing))
+        except HTTPException as exc:
+            print(f"{label}: generation failed: {exc.detail}")
+            break
+        added += question_bank.add(role_key, company_bucket, language, questions[:missing])
+    print(f"{label}: {have} -> {have + added}")
+    return added
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--roles", nargs="+", default=settings.INTERVIEW_BANK_ROLES)
+    parser.add_argument("--languages", nargs="+", default=settings.INTERVIEW_BANK_LANGUAGES)
+    parser.add_argument("--per-key", type=int, default=settings.INTERVIEW_BANK_QUESTIONS_PER_KEY)
+    parser.add_argument("--dry-run", action="store_true", help="only report which keys need openings")
+    args = parser.parse_args()
+
+    added = 0
+    for role in args.roles:
+        for company_bucket in INTERVIEW_COMPANY_BUCKETS:
+            for language in args.languages:
+                added += fill_key(normalize_role(role), company_bucket, language.lower(), args.per_key, args.dry_run)
+    print(f"Interview question bank fill complete. inserted={added}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
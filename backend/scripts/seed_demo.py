@@ -2,7 +2,7 @@ from datetime import datetime, timedelta
 
 from app.auth import hash_password
 from app.database import SessionLocal
-from app.models import DailyPlan, Interview, Resource, Roadmap, User
+from app.models import DailyPlan, Interview, InterviewMessage, Resource, Roadmap, User
 
 
 DEMO_EMAIL = "demo@campushire.com"
@@ -230,11 +230,17 @@ def seed_demo():
                 user_id=user.id,
                 role="sde",
                 company="Amazon",
+                message_count=2,
                 messages=[
-                    {"role": "assistant", "content": "Tell me about yourself."},
-                    {"role": "user", "content": "I am a third-year CSE student focused on DSA and backend development."},
+                    InterviewMessage(seq=0, role="assistant", content="Tell me about yourself."),
+                    InterviewMessage(
+                        seq=1,
+                        role="user",
+                        content="I am a third-year CSE student focused on DSA and backend development.",
+                    ),
                 ],
                 score=75,
+                status="completed",
                 feedback="Good structure and clarity. Improve by adding one concrete project impact example.",
                 created_at=now - timedelta(days=2),
             )
@@ -244,11 +250,17 @@ def seed_demo():
                 user_id=user.id,
                 role="sde",
                 company="Microsoft",
+                message_count=2,
                 messages=[
-                    {"role": "assistant", "content": "How would you solve Two Sum efficiently?"},
-                    {"role": "user", "content": "I would use a hash map to track complements in O(n) time."},
+                    InterviewMessage(seq=0, role="assistant", content="How would you solve Two Sum efficiently?"),
+                    InterviewMessage(
+                        seq=1,
+                        role="user",
+                        content="I would use a hash map to track complements in O(n) time.",
+                    ),
                 ],
                 score=82,
+                status="completed",
                 feedback="Strong problem solving and clean explanation. Push harder on edge-case discussion.",
                 created_at=now - timedelta(days=1),
             )
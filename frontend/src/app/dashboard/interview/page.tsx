@@ -322,6 +322,21 @@ export default function InterviewPage() {
     }
   }, [interview]);
 
+  // Evaluation runs in the background; poll until the score is in.
+  useEffect(() => {
+    if (!interview?.id || interview.status !== "evaluating") return;
+    const interviewId = interview.id;
+    const timer = setInterval(async () => {
+      try {
+        const latest = await interviewApi.get(interviewId);
+        if (latest.status !== "evaluating") setInterview(latest);
+      } catch {
+        // Keep polling; the next request may succeed
+      }
+    }, 2000);
+    return () => clearInterval(timer);
+  }, [interview?.id, interview?.status]);
+
   async function handleStart() {
     setStarting(true);
     setError("");
@@ -373,6 +388,7 @@ export default function InterviewPage() {
   const isFinished =
     (interview?.score !== null && interview?.score !== undefined) ||
     (interview?.feedback !== null && interview?.feedback !== undefined && interview.feedback !== "");
+  const isEvaluating = interview?.status === "evaluating";
 
   if (!interview) {
     return (
@@ -486,7 +502,7 @@ export default function InterviewPage() {
           )}
         </div>
         <div className="flex gap-2 self-start sm:self-auto">
-          {!isFinished ? (
+          {!isFinished && !isEvaluating ? (
             <button
               onClick={handleEnd}
               disabled={ending}
@@ -557,10 +573,22 @@ export default function InterviewPage() {
           <InterviewEvaluationCard interview={interview} t={t} />
         ) : null}
 
+        {isEvaluating ? (
+          <div className="flex items-center gap-2 rounded-2xl border border-border/40 bg-muted/30 p-4 text-sm text-muted-foreground">
+            <Loader2 className="h-4 w-4 animate-spin spinner-glow" />
+            {t("interview.evaluating")}
+          </div>
+        ) : interview.status === "evaluation_failed" ? (
+          <div className="flex items-center gap-2 rounded-2xl border border-destructive/30 bg-destructive/10 p-4 text-sm text-destructive">
+            <AlertTriangle className="h-4 w-4" />
+            {t("interview.evaluationFailed")}
+          </div>
+        ) : null}
+
         <div ref={chatEndRef} />
       </div>
 
-      {!isFinished ? (
+      {!isFinished && !isEvaluating && interview.status !== "evaluation_failed" ? (
         <motion.div
           className="mt-4 flex gap-2 border-t border-border/40 pt-4"
           animate={{
@@ -194,6 +194,8 @@ export const interviewApi = {
       method: "POST",
     }),
 
+  get: (interviewId: string) => request<Interview>(`/api/interview/${interviewId}`),
+
   getHistory: () => request<Interview[]>("/api/interview/history"),
 };
 
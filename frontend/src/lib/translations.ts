@@ -224,6 +224,8 @@ const en: TranslationDictionary = {
   "interview.errorStart": "Could not start the interview. Please try again.",
   "interview.errorSend": "Could not send your answer. Please try again.",
   "interview.errorEnd": "Could not end the interview. Please try again.",
+  "interview.evaluating": "Evaluating your interview...",
+  "interview.evaluationFailed": "We could not evaluate this interview. Press End to try again.",
   "interview.roleHeader": "{role} Interview",
   "jd.hero.badge": "JD reasoning engine",
   "jd.hero.title": "Read the role, compare the gaps, then act on the delta.",
@@ -471,6 +473,8 @@ const hi: TranslationDictionary = {
   "interview.errorStart": "Interview start nahin ho saka. Dobara koshish karein.",
   "interview.errorSend": "Jawab bheja nahin ja saka. Dobara koshish karein.",
   "interview.errorEnd": "Interview end nahin ho saka. Dobara koshish karein.",
+  "interview.evaluating": "Aapka interview evaluate ho raha hai...",
+  "interview.evaluationFailed": "Interview evaluate nahin ho saka. Dobara koshish ke liye End dabayein.",
   "interview.roleHeader": "{role} Interview",
   "jd.hero.badge": "JD reasoning engine",
   "jd.hero.title": "Role padhein, gaps compare karein, phir us delta par kaam karein.",
@@ -720,6 +724,8 @@ const ta: TranslationDictionary = {
   "interview.errorStart": "Interview-ஐ தொடங்க முடியவில்லை. மீண்டும் முயற்சிக்கவும்.",
   "interview.errorSend": "உங்கள் பதிலை அனுப்ப முடியவில்லை. மீண்டும் முயற்சிக்கவும்.",
   "interview.errorEnd": "Interview-ஐ முடிக்க முடியவில்லை. மீண்டும் முயற்சிக்கவும்.",
+  "interview.evaluating": "உங்கள் interview evaluate செய்யப்படுகிறது...",
+  "interview.evaluationFailed": "Interview-ஐ evaluate செய்ய முடியவில்லை. மீண்டும் முயற்சிக்க End-ஐ அழுத்தவும்.",
   "interview.roleHeader": "{role} Interview",
   "jd.hero.badge": "JD reasoning engine",
   "jd.hero.title": "Role-ஐ படியுங்கள், gaps-ஐ ஒப்பிடுங்கள், பிறகு அந்த delta-வின் மீது செயல்படுங்கள்.",
@@ -968,6 +974,8 @@ const te: TranslationDictionary = {
   "interview.errorStart": "Interview ప్రారంభించలేకపోయాం. మళ్లీ ప్రయత్నించండి.",
   "interview.errorSend": "మీ సమాధానం పంపలేకపోయాం. మళ్లీ ప్రయత్నించండి.",
   "interview.errorEnd": "Interview ముగించలేకపోయాం. మళ్లీ ప్రయత్నించండి.",
+  "interview.evaluating": "మీ interview evaluate అవుతోంది...",
+  "interview.evaluationFailed": "Interview ని evaluate చేయలేకపోయాం. మళ్లీ ప్రయత్నించడానికి End నొక్కండి.",
   "interview.roleHeader": "{role} Interview",
   "jd.hero.badge": "JD reasoning engine",
   "jd.hero.title": "Role ని చదవండి, gaps ని compare చేయండి, తర్వాత ఆ delta పై పని చేయండి.",
@@ -1216,6 +1224,8 @@ const bn: TranslationDictionary = {
   "interview.errorStart": "Interview শুরু করা যায়নি। আবার চেষ্টা করুন।",
   "interview.errorSend": "আপনার উত্তর পাঠানো যায়নি। আবার চেষ্টা করুন।",
   "interview.errorEnd": "Interview শেষ করা যায়নি। আবার চেষ্টা করুন।",
+  "interview.evaluating": "আপনার interview evaluate করা হচ্ছে...",
+  "interview.evaluationFailed": "Interview evaluate করা যায়নি। আবার চেষ্টা করতে End চাপুন।",
   "interview.roleHeader": "{role} Interview",
   "jd.hero.badge": "JD reasoning engine",
   "jd.hero.title": "Role পড়ুন, gaps compare করুন, তারপর সেই delta-র ওপর কাজ করুন।",
@@ -1464,6 +1474,8 @@ const mr: TranslationDictionary = {
   "interview.errorStart": "Interview सुरू करता आला नाही. पुन्हा प्रयत्न करा.",
   "interview.errorSend": "तुमचे उत्तर पाठवता आले नाही. पुन्हा प्रयत्न करा.",
   "interview.errorEnd": "Interview संपवता आला नाही. पुन्हा प्रयत्न करा.",
+  "interview.evaluating": "तुमचा interview evaluate होत आहे...",
+  "interview.evaluationFailed": "Interview evaluate करता आला नाही. पुन्हा प्रयत्न करण्यासाठी End दाबा.",
   "interview.roleHeader": "{role} Interview",
   "jd.hero.badge": "JD reasoning engine",
   "jd.hero.title": "Role वाचा, gaps compare करा, मग त्या delta वर काम करा.",
@@ -128,6 +128,7 @@ export interface Interview {
   messages: ChatMessage[];
   score?: number | null;
   feedback?: string | null;
+  status?: "active" | "evaluating" | "completed" | "evaluation_failed";
   created_at: string;
 }
 